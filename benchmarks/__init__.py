@@ -0,0 +1,7 @@
+"""Performance benchmarks for namebot.
+
+Run the whole suite with `make benchmarks`, or `python -m benchmarks.run`
+(see `--help` for options). Everything runs offline: benchmarks that need
+NLTK data or optional libraries that are not installed are reported as
+skipped. This package is not installed with namebot.
+"""
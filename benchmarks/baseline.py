@@ -0,0 +1,92 @@
+"""Store benchmark results, and compare new ones against them.
+
+Baselines also store the time of `suite.calibrate`, so results from a
+faster or slower machine (or a busy one) are scaled before comparing.
+"""
+
+import json
+
+# How many times slower than the baseline a benchmark may get
+# before it counts as a regression.
+THRESHOLD = 2.0
+# Timings below this many seconds are too noisy to compare.
+MIN_SECONDS = 0.001
+
+
+def save(path, results, calibration=None):
+    """Save benchmark results as the new baseline.
+
+    :param path (str): The baseline file.
+    :param results (dict): Benchmark results, keyed by name then size.
+    :param calibration (float, optional): The calibration time.
+    """
+    data = {
+        'calibration': calibration,
+        'benchmarks': dict(
+            (name, dict((str(size), result['seconds'])
+                        for size, result in sizes.items()))
+            for name, sizes in results.items()),
+    }
+    with open(path, 'w') as files:
+        json.dump(data, files, indent=2, sort_keys=True,
+                  separators=(',', ': '))
+        files.write('\n')
+
+
+def load(path):
+    """Load a baseline.
+
+    :param path (str): The baseline file.
+    :rtype tuple: The seconds taken, keyed by benchmark name then size,
+        and the calibration time (or None).
+    """
+    with open(path) as files:
+        data = json.load(files)
+    benchmarks = dict(
+        (name, dict((int(size), seconds) for size, seconds in sizes.items()))
+        for name, sizes in data['benchmarks'].items())
+    return benchmarks, data.get('calibration')
+
+
+def compare(results, baseline, threshold=THRESHOLD, min_seconds=MIN_SECONDS,
+            speed=1.0):
+    """Find benchmarks that got slower than the baseline allows.
+
+    :param results (dict): Benchmark results, keyed by name then size.
+    :param baseline (dict): Baseline seconds, keyed by name then size.
+    :param threshold (float, optional): The allowed slowdown ratio.
+    :param min_seconds (float, optional): Ignore timings where both the
+        result and the baseline are faster than this.
+    :param speed (float, optional): How much slower this machine is than
+        the baseline's, e.g. the ratio of their calibration times.
+        Baseline times are multiplied by it.
+    :rtype list: `(name, size, seconds, baseline seconds)` tuples
+        for every regression, sorted by name and size. Baseline seconds
+        are scaled by `speed`.
+    """
+    regressions = []
+    for name, sizes in sorted(results.items()):
+        for size, result in sorted(sizes.items()):
+            expected = baseline.get(name, {}).get(size)
+            if expected is None:
+                continue
+            expected *= speed
+            seconds = result['seconds']
+            if max(seconds, expected) < min_seconds:
+                continue
+            if seconds > expected * threshold:
+                regressions.append((name, size, seconds, expected))
+    return regressions
+
+
+def missing(results, baseline):
+    """Find results with nothing in the baseline to compare against.
+
+    :param results (dict): Benchmark results, keyed by name then size.
+    :param baseline (dict): Baseline seconds, keyed by name then size.
+    :rtype list: `(name, size)` tuples, sorted by name and size.
+    """
+    return [(name, size)
+            for name, sizes in sorted(results.items())
+            for size in sorted(sizes)
+            if baseline.get(name, {}).get(size) is None]
@@ -0,0 +1,77 @@
+"""Reproducible seed word corpora for the benchmarks."""
+
+import random
+
+from namebot.latin_words import words as _latin_words
+
+# The corpus sizes benchmarked by default.
+SIZES = (10, 100, 1000, 10000)
+
+_onsets = ('b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'r',
+           's', 't', 'v', 'w', 'z', 'br', 'cl', 'dr', 'fl', 'gr', 'pl', 'st',
+           'tr', 'sh', 'ch', 'th')
+_nuclei = ('a', 'e', 'i', 'o', 'u', 'y', 'ai', 'ea', 'oo', 'ou')
+_codas = ('', '', '', 'n', 'r', 's', 't', 'x', 'ck', 'ng', 'st')
+
+
+def synthetic(size, seed=0):
+    """Make pronounceable, made up words from random syllables.
+
+    :param size (int): The number of words.
+    :param seed (int, optional): The random seed. The same seed always
+        gives the same words.
+    :rtype list: The words.
+    """
+    rand = random.Random(seed)
+    words = []
+    for _ in range(size):
+        words.append(''.join(
+            rand.choice(_onsets) + rand.choice(_nuclei) + rand.choice(_codas)
+            for _ in range(rand.randint(1, 3))))
+    return words
+
+
+def _english_words():
+    return sorted(set(
+        keyword for keywords in _latin_words.values()
+        for keyword in keywords if keyword.isalpha()))
+
+
+def real(size, seed=0):
+    """Sample real English words (from the latin dictionary definitions).
+
+    There are about 5000 of them, so larger corpora are filled up with
+    two-word compounds of them.
+
+    :param size (int): The number of words.
+    :param seed (int, optional): The random seed.
+    :rtype list: The words.
+    """
+    rand = random.Random(seed)
+    english = _english_words()
+    if size <= len(english):
+        return rand.sample(english, size)
+    words = list(english)
+    rand.shuffle(words)
+    while len(words) < size:
+        words.append(rand.choice(english) + rand.choice(english))
+    return words
+
+
+corpora = {
+    'synthetic': synthetic,
+    'real': real,
+}
+
+
+def get_corpus(name, size, seed=0):
+    """Get a corpus by name.
+
+    :param name (str): `synthetic` or `real`.
+    :param size (int): The number of words.
+    :param seed (int, optional): The random seed.
+    :rtype list: The words.
+    """
+    if name not in corpora:
+        raise ValueError('Unknown corpus: {}'.format(name))
+    return corpora[name](size, seed=seed)
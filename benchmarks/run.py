@@ -0,0 +1,141 @@
+"""Run the benchmark suite from the command line.
+
+Examples:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10 100 --only scoring. techniques.suffix
+    python -m benchmarks.run --save-baseline
+
+Exits with status 1 if a benchmark regressed against the baseline, has
+no baseline to compare against (unless `--allow-missing` is given), or
+grows faster than its expected complexity. Benchmarks skipped because
+a dependency or NLTK data is missing are reported with a warning.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import sys
+
+from benchmarks import baseline
+from benchmarks import corpora
+from benchmarks import scaling
+from benchmarks import suite
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'baseline.json')
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description='Benchmark the namebot techniques, scorers, filters, '
+                    'normalization, metrics and NLP helpers.')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=list(corpora.SIZES),
+                        help='The corpus sizes to run.')
+    parser.add_argument('--corpus', choices=sorted(corpora.corpora),
+                        default='synthetic', help='The seed word corpus.')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='The corpus random seed.')
+    parser.add_argument('--only', nargs='+', metavar='PREFIX',
+                        help='Only run benchmarks starting with a prefix.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement; the fastest is kept.')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='The baseline file to compare against.')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Save the results as the new baseline.')
+    parser.add_argument('--allow-missing', action='store_true',
+                        help='Do not fail on benchmarks missing from '
+                             'the baseline.')
+    parser.add_argument('--threshold', type=float,
+                        default=baseline.THRESHOLD,
+                        help='The allowed slowdown against the baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='How far above the expected scaling exponent '
+                             'a benchmark may fit.')
+    parser.add_argument('--json', metavar='FILE',
+                        help='Also write the full results as JSON.')
+    return parser.parse_args(argv)
+
+
+def _print_result(name, size, result):
+    peak = result['peak_bytes']
+    print('{:<45} {:>6} {:>11.6f}s {:>13} {:>12}'.format(
+        name, size, result['seconds'],
+        '{:.0f}/s'.format(result['throughput'] or 0),
+        '-' if peak is None else '{}B'.format(peak)))
+
+
+def _compare(args, results, calibration):
+    """Compare the results against the baseline file.
+
+    :rtype int: The exit status.
+    """
+    if not os.path.exists(args.baseline):
+        print('WARNING: no baseline at {}, nothing was compared'.format(
+            args.baseline))
+        return 0 if args.allow_missing else 1
+    status = 0
+    base, base_calibration = baseline.load(args.baseline)
+    speed = calibration / base_calibration if base_calibration else 1.0
+    print('calibration: {:.4f}s, {:.2f}x the baseline machine'.format(
+        calibration, speed))
+    regressions = baseline.compare(
+        results, base, threshold=args.threshold, speed=speed)
+    for name, size, seconds, base_seconds in regressions:
+        print('REGRESSION {} at {}: {:.6f}s, baseline {:.6f}s'.format(
+            name, size, seconds, base_seconds))
+        status = 1
+    for name, size in baseline.missing(results, base):
+        print('NO BASELINE {} at {}: record it with --save-baseline'.format(
+            name, size))
+        if not args.allow_missing:
+            status = 1
+    return status
+
+
+def main(argv=None):
+    """Run the suite and report the results.
+
+    :param argv (list, optional): The command line arguments.
+    :rtype int: The exit status.
+    """
+    args = _parse_args(argv)
+    calibration = suite.calibrate()
+    print('{:<45} {:>6} {:>12} {:>13} {:>12}'.format(
+        'benchmark', 'size', 'time', 'throughput', 'peak'))
+    report = suite.run(
+        lambda size: corpora.get_corpus(args.corpus, size, seed=args.seed),
+        args.sizes, names=args.only, repeat=args.repeat,
+        progress=_print_result)
+    results = report['results']
+    for name, reason in sorted(report['skipped'].items()):
+        print('WARNING: skipped {}, so it is not compared or saved to the '
+              'baseline: {}'.format(name, reason))
+
+    status = 0
+    failures = scaling.check_scaling(
+        results, suite.expected_exponents(), tolerance=args.tolerance)
+    for name, (fitted, expected) in sorted(failures.items()):
+        print('SCALING {}: grows as n^{:.2f}, expected n^{}'.format(
+            name, fitted, expected))
+        status = 1
+
+    # Calibrate before and after, so load changes during the run count.
+    calibration = (calibration + suite.calibrate()) / 2
+    if args.save_baseline:
+        baseline.save(args.baseline, results, calibration=calibration)
+        print('saved baseline to {}'.format(args.baseline))
+    else:
+        status = max(status, _compare(args, results, calibration))
+
+    if args.json:
+        with open(args.json, 'w') as files:
+            json.dump(report, files, indent=2, sort_keys=True)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
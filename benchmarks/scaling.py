@@ -0,0 +1,44 @@
+"""Fit scaling curves, to catch accidentally quadratic code."""
+
+import math
+
+
+def fit_exponent(timings):
+    """Fit `seconds = c * size ** k` by least squares on a log-log scale.
+
+    :param timings (dict): Seconds taken, keyed by corpus size.
+    :rtype float: The exponent `k`, or None with fewer than two sizes.
+    """
+    points = [(math.log(size), math.log(seconds))
+              for size, seconds in sorted(timings.items())
+              if size > 0 and seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def check_scaling(results, expected, tolerance=0.5):
+    """Find benchmarks whose time grows faster than expected.
+
+    Small corpora are dominated by fixed overheads, which only makes the
+    fitted exponent smaller, so this does not give false alarms for them.
+
+    :param results (dict): Benchmark results, keyed by name then size.
+    :param expected (dict): The expected exponents, keyed by name.
+    :param tolerance (float, optional): How far above its expected
+        exponent a benchmark may fit.
+    :rtype dict: `(fitted, expected)` exponents of the failing benchmarks,
+        keyed by name.
+    """
+    failures = {}
+    for name, sizes in results.items():
+        fitted = fit_exponent(dict(
+            (size, result['seconds']) for size, result in sizes.items()))
+        if fitted is not None and fitted > expected.get(name, 1) + tolerance:
+            failures[name] = (fitted, expected.get(name, 1))
+    return failures
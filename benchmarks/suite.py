@@ -0,0 +1,282 @@
+"""The benchmarks, and the code to time them.
+
+Each benchmark is a `(name, function, exponent, max_size)` tuple. The
+function takes the seed words, `exponent` is the expected growth of its
+running time (1 for linear, 2 for pairwise techniques), and `max_size`
+caps the corpus sizes it runs at, so pairwise techniques stay fast.
+Benchmarks needing untimed setup, e.g. building an index, wrap it in
+`Prepared`.
+"""
+
+import io
+import os
+import re
+import shutil
+import tempfile
+import timeit
+
+from namebot import metrics
+from namebot import nlp
+from namebot import normalization
+from namebot import scoring
+from namebot import strainer
+from namebot import techniques
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Errors meaning a benchmark cannot run here, e.g. missing NLTK data
+# (LookupError) or a missing optional library (ImportError).
+_skip_errors = (ImportError, LookupError)
+# Terminal color codes.
+_ansi = re.compile(r'\x1b\[[0-9;]*m')
+
+# Techniques combining every pair of seed words.
+_pairwise = ('alliterations', 'portmanteau', 'make_portmanteau_split')
+
+
+def _strain(words):
+    return list(strainer.Strainer([
+        ('length', {'min_length': 3, 'max_length': 12}),
+        ('vowel_cons_ratio', {'ratio': 0.5}),
+        ('soundex', {'code': 'S530'}),
+    ]).strain(words))
+
+
+def _scrub(words):
+    return techniques.super_scrub({'words': {'suffix': words}})
+
+
+def _accumulate(words):
+    accumulator = metrics.MetricsAccumulator()
+    accumulator.update(words)
+    return accumulator.results()
+
+
+def _pipeline(words):
+    return normalization.NormalizationPipeline(
+        normalization.SCRUB_STAGES)(words)
+
+
+def _filter(func, **kwargs):
+    """Benchmark a single strainer filter over all seed words."""
+    def _run(words):
+        return [word for word in words if func(word, **kwargs)]
+    return _run
+
+
+class Prepared(object):
+    """A benchmark with setup that is not timed.
+
+    `setup` is called once per corpus with the seed words, and returns
+    the function to time, which is then called with the seed words.
+    If that function has a `cleanup` attribute, it is called afterwards.
+    """
+
+    def __init__(self, setup):
+        self.setup = setup
+
+
+def _metrics_file(aggregate):
+    def _setup(words):
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        with io.open(fd, 'w', encoding='utf-8') as files:
+            files.write(u'\n'.join(words))
+
+        def _run(words):
+            return metrics.generate_all_metrics(
+                filename=path, aggregate=aggregate)
+        _run.cleanup = lambda: os.remove(path)
+        return _run
+    return Prepared(_setup)
+
+
+def _relation_index(words):
+    path = tempfile.mkdtemp()
+    try:
+        index = nlp.build_relation_index(path, words=words)
+    except Exception:
+        shutil.rmtree(path)
+        raise
+
+    def _run(words):
+        return [index.get(word) for word in words]
+    _run.cleanup = lambda: shutil.rmtree(path)
+    return _run
+
+
+def _technique_benchmarks():
+    for name, func, _ in techniques._all_techniques:
+        pairwise = name in _pairwise
+        yield ('techniques.{}'.format(name), func,
+               2 if pairwise else 1, 1000 if pairwise else None)
+
+
+benchmarks = list(_technique_benchmarks()) + [
+    ('techniques.pig_latinize', techniques.pig_latinize, 1, None),
+    ('techniques.domainify', techniques.domainify, 1, None),
+    ('techniques.super_scrub', _scrub, 1, None),
+    ('scoring.score_dmetaphone', scoring.score_dmetaphone, 1, None),
+    ('scoring.score_soundex', scoring.score_soundex, 1, None),
+    ('scoring.score_nysiis', scoring.score_nysiis, 1, None),
+    ('scoring.score_names_overall', scoring.score_names_overall, 1, None),
+    ('scoring.score_names_overall_batch',
+     scoring.score_names_overall_batch, 1, None),
+    ('scoring.top_k_names', scoring.top_k_names, 1, None),
+    ('strainer.Strainer', _strain, 1, None),
+    ('strainer.filter_length',
+     _filter(strainer.filter_length, min_length=3, max_length=12), 1, None),
+    ('strainer.filter_startswith',
+     _filter(strainer.filter_startswith, beginning='st'), 1, None),
+    ('strainer.filter_endswith',
+     _filter(strainer.filter_endswith, ending='er'), 1, None),
+    ('strainer.filter_tld', _filter(strainer.filter_tld, tld='.io'), 1,
+     None),
+    ('strainer.filter_vowel_cons_ratio',
+     _filter(strainer.filter_vowel_cons_ratio, ratio=0.5), 1, None),
+    ('strainer.filter_consonant_ending',
+     _filter(strainer.filter_consonant_ending), 1, None),
+    ('strainer.filter_vowel_ending', _filter(strainer.filter_vowel_ending),
+     1, None),
+    ('strainer.filter_dmetaphone',
+     _filter(strainer.filter_dmetaphone, code='STR'), 1, None),
+    ('strainer.filter_soundex', _filter(strainer.filter_soundex, code='S530'),
+     1, None),
+    ('strainer.filter_nysiis', _filter(strainer.filter_nysiis, code='STAR'),
+     1, None),
+    ('normalization.clean_sort', normalization.clean_sort, 1, None),
+    ('normalization.remove_odd_sounding_words',
+     normalization.remove_odd_sounding_words, 1, None),
+    ('normalization.uniquify', normalization.uniquify, 1, None),
+    ('normalization.remove_bad_words', normalization.remove_bad_words, 1,
+     None),
+    ('normalization.remove_stop_words', normalization.remove_stop_words, 1,
+     None),
+    ('normalization.stem_words', normalization.stem_words, 1, None),
+    ('normalization.NormalizationPipeline', _pipeline, 1, None),
+    ('metrics.MetricsAccumulator', _accumulate, 1, None),
+    ('metrics.get_pos_tags', metrics.get_pos_tags, 1, None),
+    ('metrics.generate_all_metrics', _metrics_file(False), 1, None),
+    ('metrics.generate_all_metrics_aggregate', _metrics_file(True), 1, None),
+    ('nlp.get_synsets', nlp.get_synsets, 1, 100),
+    ('nlp.RelationIndex.get', Prepared(_relation_index), 1, 1000),
+]
+
+
+def calibrate(repeat=5):
+    """Time a fixed workload, to compare the speed of machines (or runs).
+
+    :param repeat (int, optional): The number of runs. The fastest is kept.
+    :rtype float: The seconds taken.
+    """
+    words = ['word{}'.format(i) for i in range(20000)]
+
+    def _workload():
+        counts = {}
+        for word in sorted(words, key=lambda word: word[::-1]):
+            counts[word[-1]] = counts.get(word[-1], 0) + len(word.upper())
+        return counts
+    return min(timeit.repeat(_workload, number=1, repeat=repeat))
+
+
+def _clear_caches():
+    """Clear the in-memory caches, so every run starts cold."""
+    scoring._phonetic_cache.clear()
+    normalization._stem_cache.clear()
+    metrics._pos_tag_cache.clear()
+
+
+def _reason(exc):
+    # NLTK's LookupError messages are framed by lines of asterisks,
+    # and color the resource name.
+    lines = [line.strip() for line in _ansi.sub('', str(exc)).split('\n')
+             if any(char.isalnum() for char in line)]
+    return '{}: {}'.format(type(exc).__name__, lines[0] if lines else '')
+
+
+def measure(func, words, repeat=3):
+    """Time a function over the seed words.
+
+    :param func (function): The function, called with `words`,
+        or a `Prepared` benchmark.
+    :param words (list): The seed words.
+    :param repeat (int, optional): The number of runs. The fastest is kept.
+    :rtype dict: The `seconds` taken, the `throughput` in seed words per
+        second, and the `peak_bytes` allocated (None without tracemalloc).
+    """
+    if isinstance(func, Prepared):
+        func = func.setup(words)
+    try:
+        return _measure(func, words, repeat)
+    finally:
+        if hasattr(func, 'cleanup'):
+            func.cleanup()
+
+
+def _measure(func, words, repeat):
+    best = None
+    for _ in range(repeat):
+        _clear_caches()
+        start = timeit.default_timer()
+        func(words)
+        elapsed = timeit.default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    peak = None
+    if tracemalloc is not None:
+        _clear_caches()
+        tracemalloc.start()
+        try:
+            func(words)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        'seconds': best,
+        'throughput': len(words) / best if best else None,
+        'peak_bytes': peak,
+    }
+
+
+def run(corpus, sizes, names=None, repeat=3, progress=None):
+    """Run the benchmarks.
+
+    :param corpus (function): Called with a size, returns the seed words.
+    :param sizes (list): The corpus sizes.
+    :param names (list, optional): Only run benchmarks whose name starts
+        with one of these.
+    :param repeat (int, optional): The number of runs per measurement.
+    :param progress (function, optional): Called with
+        `(name, size, result)` after each measurement.
+    :rtype dict: `results`, keyed by benchmark name then size, and
+        `skipped`, with the reason each skipped benchmark could not run.
+    """
+    corpora = dict((size, corpus(size)) for size in sizes)
+    results = {}
+    skipped = {}
+    for name, func, _, max_size in benchmarks:
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            try:
+                result = measure(func, corpora[size], repeat=repeat)
+            except _skip_errors as exc:
+                skipped[name] = _reason(exc)
+                results.pop(name, None)
+                break
+            results.setdefault(name, {})[size] = result
+            if progress is not None:
+                progress(name, size, result)
+    return {'results': results, 'skipped': skipped}
+
+
+def expected_exponents():
+    """Get the expected running time growth of each benchmark.
+
+    :rtype dict: The exponents, keyed by benchmark name.
+    """
+    return dict((name, exponent) for name, _, exponent, _ in benchmarks)
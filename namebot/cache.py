@@ -0,0 +1,230 @@
+"""Caching helpers shared across namebot modules."""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class LRUCache(object):
+    """A bounded cache that evicts the least recently used entries first.
+
+    Hits and misses are counted so callers can check how effective
+    the cache is for their data.
+    """
+
+    def __init__(self, maxsize=None):
+        """Create the cache.
+
+        :param maxsize (int, optional): The maximum number of entries.
+            If None, the cache is unbounded.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, func, *args):
+        """Return the cached value for `key`, computing it if needed.
+
+        :param key (hashable): The cache key.
+        :param func (function): Called with `args` on a miss.
+        :rtype: The cached or computed value.
+        """
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            value = func(*args)
+        else:
+            self.hits += 1
+        self._data[key] = value
+        self._evict()
+        return value
+
+    def resize(self, maxsize):
+        """Change the maximum size, evicting entries if needed.
+
+        :param maxsize (int): The new maximum size, or None for unbounded.
+        """
+        self.maxsize = maxsize
+        self._evict()
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return the cache statistics.
+
+        :rtype dict: The hits, misses, maximum and current size.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maxsize': self.maxsize,
+            'currsize': len(self._data),
+        }
+
+    def _evict(self):
+        if self.maxsize is None:
+            return
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class PersistentCache(object):
+    """A persistent, size-bounded cache stored in an SQLite database.
+
+    Keys are any JSON serializable values, and so are the cached values.
+    Once the stored values exceed `max_bytes`, the least recently
+    used entries are evicted first.
+
+    Access times are kept in memory, and written along with new values
+    when they are committed: after each `set`, or once at the end of a
+    `transaction`.
+    """
+
+    def __init__(self, path, max_bytes=None):
+        """Open (or create) the cache database.
+
+        :param path (str): The database file.
+        :param max_bytes (int, optional): The maximum total size of the
+            serialized values. If None, the cache is unbounded.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._depth = 0
+        self._accessed = {}
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value TEXT, size INTEGER, '
+            'accessed INTEGER)')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)')
+        self._conn.commit()
+        self._clock = self._conn.execute(
+            'SELECT COALESCE(MAX(accessed), 0) FROM cache').fetchone()[0]
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def __contains__(self, key):
+        return self._conn.execute(
+            'SELECT 1 FROM cache WHERE key = ?',
+            (json.dumps(key),)).fetchone() is not None
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def get(self, key, default=None):
+        """Return the cached value for `key`.
+
+        :param key: The cache key.
+        :param default (optional): Returned if the key is not cached.
+        :rtype: The cached value, or `default`.
+        """
+        key = json.dumps(key)
+        row = self._conn.execute(
+            'SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._accessed[key] = self._tick()
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        """Store a value, evicting old entries if needed.
+
+        :param key: The cache key.
+        :param value: The value to store.
+        """
+        key = json.dumps(key)
+        value = json.dumps(value)
+        self._accessed.pop(key, None)
+        self._conn.execute(
+            'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)',
+            (key, value, len(value), self._tick()))
+        if not self._depth:
+            self.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Group reads and writes, committing them once at the end.
+
+        Transactions can be nested; only the outermost one commits.
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.commit()
+
+    def commit(self):
+        """Write the access times, evict old entries if needed and commit."""
+        if self._accessed:
+            self._conn.executemany(
+                'UPDATE cache SET accessed = ? WHERE key = ?',
+                [(accessed, key) for key, accessed in self._accessed.items()])
+            self._accessed.clear()
+        self._evict()
+        self._conn.commit()
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._conn.execute('DELETE FROM cache')
+        self._conn.commit()
+        self._accessed.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Commit any pending changes and close the database connection."""
+        self.commit()
+        self._conn.close()
+
+    def info(self):
+        """Return the cache statistics.
+
+        :rtype dict: The hits, misses, entries and total stored bytes.
+        """
+        entries, size = self._conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache').fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+        }
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        size = self._conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM cache').fetchone()[0]
+        if size <= self.max_bytes:
+            return
+        evict = []
+        for key, entry_size in self._conn.execute(
+                'SELECT key, size FROM cache ORDER BY accessed'):
+            if size <= self.max_bytes:
+                break
+            evict.append((key,))
+            size -= entry_size
+        self._conn.executemany('DELETE FROM cache WHERE key = ?', evict)
@@ -0,0 +1,175 @@
+"""De-duplication of candidate names across techniques and rounds.
+
+`super_scrub` only removes repeats within one technique's list, so the
+same name made by several techniques (or by several `recycle` rounds)
+would otherwise be scored and filtered more than once. A
+`CandidateStore` keeps every name it has seen, and which techniques
+produced it. For very large runs, it can use a Bloom filter instead,
+which bounds memory at the cost of a small false positive rate (a few
+new names are wrongly treated as seen) and of the provenance map.
+"""
+
+import hashlib
+import math
+import struct
+from collections import OrderedDict
+from collections import defaultdict
+
+
+class BloomFilter(object):
+    """A fixed-size Bloom filter for strings."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        """Size the filter.
+
+        :param capacity (int): The expected number of items.
+        :param error_rate (float, optional): The target false positive
+            rate once `capacity` items were added.
+        """
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1')
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = int(math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, int(round(
+            self.num_bits / float(capacity) * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item):
+        if isinstance(item, unicode):
+            item = item.encode('utf-8')
+        h1, h2 = struct.unpack('<QQ', hashlib.md5(item).digest())
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, item):
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7))
+                   for pos in self._positions(item))
+
+    def __len__(self):
+        return self.count
+
+    def add(self, item):
+        """Add an item.
+
+        :param item (str): The item.
+        :rtype bool: False if the item was (probably) already present.
+        """
+        bits = self._bits
+        added = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+
+class CandidateStore(object):
+    """Remember candidate names, and which techniques produced them.
+
+    In the default exact mode, every name is kept along with the list
+    of techniques that produced it, in order. In Bloom filter mode
+    (`bloom=True`), names are not kept, so only membership tests and
+    the per-technique counters are available.
+    """
+
+    def __init__(self, bloom=False, capacity=10000000, error_rate=0.001):
+        """Create an empty store.
+
+        :param bloom (bool, optional): Use a Bloom filter.
+        :param capacity (int, optional): The expected number of names,
+            in Bloom filter mode.
+        :param error_rate (float, optional): The false positive rate,
+            in Bloom filter mode.
+        """
+        self.bloom = bloom
+        if bloom:
+            self._seen = BloomFilter(capacity, error_rate=error_rate)
+        else:
+            self._seen = OrderedDict()
+        # Number of new and of repeated names, per technique.
+        self.added = defaultdict(int)
+        self.duplicates = defaultdict(int)
+
+    def __contains__(self, word):
+        return word in self._seen
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __iter__(self):
+        return iter(self.words())
+
+    def add(self, word, technique=None):
+        """Add a name.
+
+        :param word (str): The name.
+        :param technique (str, optional): The technique that produced it.
+        :rtype bool: True if the name was not seen before.
+        """
+        if self.bloom:
+            new = self._seen.add(word)
+        else:
+            sources = self._seen.get(word)
+            new = sources is None
+            if new:
+                sources = self._seen[word] = []
+            if technique is not None and technique not in sources:
+                sources.append(technique)
+        if new:
+            self.added[technique] += 1
+        else:
+            self.duplicates[technique] += 1
+        return new
+
+    def filter(self, candidates):
+        """Lazily drop already seen names from `(technique, word)` pairs.
+
+        :param candidates (iterable): `(technique, word)` pairs.
+        :rtype generator: The pairs with names not seen before.
+        """
+        add = self.add
+        for technique, word in candidates:
+            if add(word, technique):
+                yield technique, word
+
+    def sources(self, word):
+        """Get the techniques that produced a name.
+
+        :param word (str): The name.
+        :rtype list: The techniques, in the order they produced it.
+        """
+        self._require_exact('sources')
+        return list(self._seen.get(word, []))
+
+    def words(self):
+        """Get all names, in the order they were first added.
+
+        :rtype list: The names.
+        """
+        self._require_exact('words')
+        return list(self._seen)
+
+    def stats(self):
+        """Return the number of unique names and per-technique counters.
+
+        :rtype dict: The store statistics.
+        """
+        return {
+            'unique': len(self._seen),
+            'added': dict(self.added),
+            'duplicates': dict(self.duplicates),
+        }
+
+    def _require_exact(self, name):
+        if self.bloom:
+            raise TypeError(
+                '{} is not available in Bloom filter mode'.format(name))
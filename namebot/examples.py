@@ -2,28 +2,63 @@
 
 from __future__ import absolute_import
 
+from collections import OrderedDict
+
 from . import metrics
 from . import nlp
 from . import scoring
 from . import techniques
 
 
-def generate_all_examples(filename=None, words=None):
+def _synset_categories(filename, words):
+    return list(nlp.get_all_synset_categories())
+
+
+def _synsets(filename, words):
+    return nlp.get_synsets(words, use_definitions=True)
+
+
+def _metrics(filename, words):
+    return metrics.generate_all_metrics(filename=filename, words=words)
+
+
+def _techniques(filename, words):
+    return techniques.generate_all_techniques(words)
+
+
+def _scoring(filename, words):
+    return scoring.generate_all_scoring(words)
+
+
+# The example sections, in report order. Each function takes the
+# filename and words given to `generate_all_examples`.
+SECTIONS = OrderedDict([
+    ('synset_categories', _synset_categories),
+    ('synsets', _synsets),
+    ('metrics', _metrics),
+    ('techniques', _techniques),
+    ('scoring', _scoring),
+])
+
+
+def generate_all_examples(filename=None, words=None, sections=None):
     """Generate examples using all functions available.
 
+    Only the selected sections are computed, in order.
+
     Args:
         filename (str, optional): A file name.
         words (list, optional): A list of words.
+        sections (list, optional): The sections to generate, from
+            `SECTIONS`. Defaults to all of them.
 
     Returns:
-        dict: All generated examples
+        dict: All generated examples, keyed by section.
     """
-    return {
-        'synset_categories': nlp.print_all_synset_categories(),
-        'synsets': nlp.get_synsets(words, use_definitions=True),
-        'metrics': metrics.generate_all_metrics(
-            filename=filename,
-            words=words),
-        'techniques': techniques.generate_all_techniques(words),
-        'scoring': scoring.generate_all_scoring(words)
-    }
+    if sections is None:
+        sections = list(SECTIONS)
+    for section in sections:
+        if section not in SECTIONS:
+            raise ValueError('Unknown section: {}'.format(section))
+    return dict((section, SECTIONS[section](filename, words))
+                for section in sections)
@@ -0,0 +1,225 @@
+"""Timing and volume instrumentation for the generation techniques.
+
+Pass an `Instrumentation` to `techniques.generate_all_techniques` (or its
+streaming and parallel versions) to record, for every technique, the wall
+and CPU time it took, the number of seed words, and the number of
+candidates before and after `super_scrub`.
+
+Peak memory is recorded too. With `tracemalloc` (Python 3.4+), it is the
+peak memory allocated while the technique ran. Otherwise it is how much
+the process's peak resident size grew, from `resource`, so it is 0 when
+a technique stays under an earlier peak. It is None if neither is
+available.
+
+The records can be read as a structured report, or exported as
+Prometheus text for dashboards.
+"""
+
+import os
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Prometheus metric names and help text, for each record field.
+_metrics = (
+    ('wall_time', 'technique_wall_seconds',
+     'Wall time spent running the technique.'),
+    ('cpu_time', 'technique_cpu_seconds',
+     'CPU time spent running the technique.'),
+    ('input_size', 'technique_input_words',
+     'Number of seed words given to the technique.'),
+    ('raw_count', 'technique_raw_candidates',
+     'Number of candidates made by the technique.'),
+    ('scrubbed_count', 'technique_scrubbed_candidates',
+     'Number of candidates left after scrubbing.'),
+    ('peak_bytes', 'technique_peak_bytes',
+     'Peak memory allocated while running the technique.'),
+)
+
+
+def _cpu_time():
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+    times = os.times()
+    return times[0] + times[1]
+
+
+def _max_rss():
+    """Get the peak resident size of the process, in bytes."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def _format_value(value):
+    # repr keeps the full float precision, but would add an L to longs.
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape_label(value):
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+class Instrumentation(object):
+    """Collect per-technique timing and volume records.
+
+    Each record is a dict with the keys `wall_time`, `cpu_time`,
+    `input_size`, `raw_count`, `scrubbed_count` and `peak_bytes`.
+    Callbacks are called with `(technique, record)` once a technique's
+    record is complete.
+    """
+
+    def __init__(self, callbacks=None):
+        """Create an empty instrumentation.
+
+        :param callbacks (list, optional): Functions called with
+            `(technique, record)` for every completed record.
+        """
+        self.callbacks = list(callbacks or [])
+        self.records = OrderedDict()
+
+    def add_callback(self, callback):
+        """Add a function called with `(technique, record)`.
+
+        :param callback (function): The callback.
+        """
+        self.callbacks.append(callback)
+
+    def _record(self, technique, input_size):
+        return self.records.setdefault(technique, {
+            'wall_time': 0.0,
+            'cpu_time': 0.0,
+            'input_size': input_size,
+            'raw_count': None,
+            'scrubbed_count': None,
+            'peak_bytes': None,
+        })
+
+    @contextmanager
+    def measure(self, technique, input_size=None):
+        """Time the code run in the block, and record it for a technique.
+
+        :param technique (str): The technique name.
+        :param input_size (int, optional): The number of seed words.
+        :rtype record (dict): The technique's record, yielded to the block.
+        """
+        record = self._record(technique, input_size)
+        tracing = tracemalloc is not None
+        started = tracing and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        elif tracing and hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        else:
+            tracing = False
+        if tracing:
+            base = tracemalloc.get_traced_memory()[0]
+        elif resource is not None:
+            base = _max_rss()
+        wall, cpu = time.time(), _cpu_time()
+        try:
+            yield record
+        finally:
+            record['wall_time'] += time.time() - wall
+            record['cpu_time'] += _cpu_time() - cpu
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] - base
+            elif resource is not None:
+                peak = _max_rss() - base
+            else:
+                peak = None
+            if peak is not None:
+                record['peak_bytes'] = max(record['peak_bytes'] or 0, peak)
+            if started:
+                tracemalloc.stop()
+
+    def merge(self, technique, record, input_size=None):
+        """Add the times and peak memory of a record made elsewhere.
+
+        E.g. for a technique split over several worker processes.
+
+        :param technique (str): The technique name.
+        :param record (dict): The other record.
+        :param input_size (int, optional): The number of seed words.
+        """
+        own = self._record(technique, input_size)
+        own['wall_time'] += record['wall_time']
+        own['cpu_time'] += record['cpu_time']
+        if record['peak_bytes'] is not None:
+            own['peak_bytes'] = max(own['peak_bytes'] or 0,
+                                    record['peak_bytes'])
+
+    def finish(self, technique, raw_count=None, scrubbed_count=None):
+        """Set a technique's candidate counts and run the callbacks.
+
+        :param technique (str): The technique name.
+        :param raw_count (int, optional): The number of raw candidates.
+        :param scrubbed_count (int, optional): The number of candidates
+            after scrubbing.
+        """
+        record = self._record(technique, None)
+        record['raw_count'] = raw_count
+        record['scrubbed_count'] = scrubbed_count
+        for callback in self.callbacks:
+            callback(technique, record)
+
+    def report(self):
+        """Get all records, and totals across techniques.
+
+        :rtype dict: The report, with `techniques` (a list of records,
+            each with its `technique` name) and `totals`.
+        """
+        techniques = []
+        totals = {'wall_time': 0.0, 'cpu_time': 0.0,
+                  'raw_count': 0, 'scrubbed_count': 0}
+        for technique, record in self.records.iteritems():
+            entry = dict(record, technique=technique)
+            techniques.append(entry)
+            for key in totals:
+                totals[key] += record[key] or 0
+        return {'techniques': techniques, 'totals': totals}
+
+    def to_prometheus(self, prefix='namebot'):
+        """Export the records in the Prometheus text format.
+
+        :param prefix (str, optional): The metric name prefix.
+        :rtype str: The exported metrics.
+        """
+        lines = []
+        for key, name, description in _metrics:
+            name = '{}_{}'.format(prefix, name)
+            lines.append('# HELP {} {}'.format(name, description))
+            lines.append('# TYPE {} gauge'.format(name))
+            for technique, record in self.records.iteritems():
+                if record[key] is None:
+                    continue
+                lines.append('{}{{technique="{}"}} {}'.format(
+                    name, _escape_label(technique),
+                    _format_value(record[key])))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path, prefix='namebot'):
+        """Write the records to a Prometheus text file.
+
+        The file is written under a temporary name first, so a collector
+        never reads a partial file.
+
+        :param path (str): The file to write.
+        :param prefix (str, optional): The metric name prefix.
+        """
+        tmp_path = '{}.tmp'.format(path)
+        with open(tmp_path, 'w') as files:
+            files.write(self.to_prometheus(prefix=prefix))
+        os.rename(tmp_path, path)
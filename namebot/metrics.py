@@ -10,10 +10,28 @@ Conventions used in this utility:
 """
 
 from __future__ import division
+import io
+import mmap
 import re
+from itertools import islice
 
-from nltk import pos_tag
-from pattern.en import parse
+import settings as namebot_settings
+from cache import LRUCache
+
+_pos_tag_cache = LRUCache(maxsize=namebot_settings.POS_TAG_CACHE_SIZE)
+
+_numbers_re = re.compile(
+    r'\Aone |two |three |four |five |six |seven |eight |nine |ten',
+    re.IGNORECASE)
+_vowel_start_re = re.compile(r'\A[aeiou]')
+_digits_re = re.compile(r'[0-9]+')
+_special_chars_re = re.compile(r'[^a-z]', re.IGNORECASE)
+_consonant_repeat_re = re.compile(r'[^a|e|i|o|u{6}]')
+_consonant_dup_re = re.compile(r'[^a|e|i|o|u]{1,}')
+_vowel_repeat_re = re.compile(r'[aeiou{3}]')
+
+_verb_tags = frozenset(['VBP', 'VB', 'RB', 'VBG'])
+_noun_tags = frozenset(['NN', 'NNP'])
 
 
 def prep_file(file_name):
@@ -32,6 +50,60 @@ def prep_file(file_name):
     return items
 
 
+def iter_file(file_name, encoding='utf-8', use_mmap=False, skip_blank=True):
+    """Lazily read names from a file, one per line.
+
+    Unlike `prep_file`, line endings are stripped, and the file is never
+    read into memory all at once.
+
+    Args:
+        file_name (str): The file name to open
+        encoding (str, optional): The file encoding.
+        use_mmap (bool, optional): Memory-map the file instead of
+            reading it through a buffer.
+        skip_blank (bool, optional): Skip empty lines.
+
+    Returns:
+        generator: The names, as unicode strings.
+    """
+    if use_mmap:
+        with open(file_name, 'rb') as files:
+            if not files.read(1):
+                return
+            mapped = mmap.mmap(files.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for line in iter(mapped.readline, b''):
+                    line = line.decode(encoding).rstrip(u'\r\n')
+                    if line or not skip_blank:
+                        yield line
+            finally:
+                mapped.close()
+        return
+    with io.open(file_name, encoding=encoding) as files:
+        for line in files:
+            line = line.rstrip(u'\r\n')
+            if line or not skip_blank:
+                yield line
+
+
+def iter_chunks(words, chunk_size=10000):
+    """Split an iterable of names into lists of at most `chunk_size` names.
+
+    Args:
+        words (iterable): The names.
+        chunk_size (int, optional): The maximum size of each chunk.
+
+    Returns:
+        generator: The chunks, as lists.
+    """
+    words = iter(words)
+    while True:
+        chunk = list(islice(words, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def get_named_numbers_1_10(words):
     """Return a summary of words spelled out (e.g. one, two).
 
@@ -42,11 +114,8 @@ def get_named_numbers_1_10(words):
         dict: The data and summary results.
     """
     matches = []
-    numbers = re.compile(
-        r'\Aone |two |three |four |five |six |seven |eight |nine |ten',
-        re.IGNORECASE)
     for word in words:
-        if re.findall(numbers, word):
+        if _numbers_re.search(word):
             matches.append(word)
     return {
         'data': matches,
@@ -111,9 +180,8 @@ def name_starts_with_vowel(words):
         dict: The data and summary results.
     """
     vowelcount = 0
-    vowels = re.compile(r'\A[aeiou]')
     for name in words:
-        if re.match(vowels, name):
+        if _vowel_start_re.match(name):
             vowelcount += 1
     summary = 'Of {} words, {} or {}% are vowels as the first letter.'.format(
         len(words), vowelcount,
@@ -135,11 +203,10 @@ def get_digits_frequency(words):
     """
     new_words = []
     count = 0
-    digits = re.compile(r'[0-9]+')
     for name in words:
-        if re.findall(digits, name):
+        matches = _digits_re.findall(name)
+        if matches:
             count += 1
-            matches = re.findall(digits, name)
             new_words += matches
     return {
         'data': new_words,
@@ -181,10 +248,8 @@ def get_special_chars(words):
         dict: The data and summary results.
     """
     data = []
-    chars = re.compile(r'[^a-z]', re.IGNORECASE)
     for word in words:
-        if re.findall(chars, word):
-            data += re.findall(chars, word)
+        data += _special_chars_re.findall(word)
     return {
         'data': data,
         'summary': ('{} occurrences of special characters were'
@@ -201,6 +266,8 @@ def get_word_types(words):
     Returns:
         dict: The data and summary results.
     """
+    from pattern.en import parse
+
     new_arr = []
     for val in words:
         try:
@@ -249,9 +316,8 @@ def get_consonant_repeat_frequency(words):
         dict: The data and summary results.
     """
     count = 0
-    cons = re.compile(r'[^a|e|i|o|u{6}]')
     for val in words:
-        if re.match(cons, val):
+        if _consonant_repeat_re.match(val):
             count += 1
     return {
         'data': count,
@@ -269,9 +335,8 @@ def get_consonant_duplicate_repeat_frequency(words):
         dict: The data and summary results.
     """
     count = 0
-    cons_dup = re.compile(r'[^a|e|i|o|u]{1,}')
     for name in words:
-        if re.match(cons_dup, name):
+        if _consonant_dup_re.match(name):
             count += 1
     return {
         'data': count,
@@ -289,9 +354,8 @@ def get_vowel_repeat_frequency(words):
         dict: The data and summary results.
     """
     count = 0
-    cons_vowel = re.compile(r'[aeiou{3}]')
     for val in words:
-        if re.match(cons_vowel, val):
+        if _vowel_repeat_re.match(val):
             count += 1
     return {
         'data': count,
@@ -299,24 +363,85 @@ def get_vowel_repeat_frequency(words):
     }
 
 
-def get_adjective_verb_or_noun(words):
+def _tag_words(words):
+    """Tag each word on its own, in a single tagger call."""
+    from nltk import pos_tag_sents
+
+    return [tagged[0][1] for tagged in pos_tag_sents([[w] for w in words])]
+
+
+def get_pos_tags(words, chunk_size=1000):
+    """Get the part-of-speech tag of each word, tagged on its own.
+
+    This gives the same tags as calling `nltk.pos_tag([word])` for every
+    word, but only loads the tagger once per chunk, and caches
+    the tag of each word so repeated words are only tagged once.
+
+    Args:
+        words (list): A list of words
+        chunk_size (int, optional): The number of words tagged per call.
+
+    Returns:
+        list: (word, tag) tuples, in the same order as `words`.
+    """
+    # Copy the cached tags first: caching new ones may evict them.
+    tags = {}
+    missing = set()
+    for word in words:
+        if word in tags or word in missing:
+            continue
+        if word in _pos_tag_cache:
+            tags[word] = _pos_tag_cache.get(word, None)
+        else:
+            missing.add(word)
+    missing = list(missing)
+    for start in range(0, len(missing), chunk_size):
+        chunk = missing[start:start + chunk_size]
+        tags.update(zip(chunk, _tag_words(chunk)))
+    for word in missing:
+        _pos_tag_cache.get(word, tags.__getitem__, word)
+    return [(word, tags[word]) for word in words]
+
+
+def pos_tag_cache_info():
+    """Return the hit/miss statistics for the part-of-speech tag cache.
+
+    Returns:
+        dict: The cache statistics.
+    """
+    return _pos_tag_cache.info()
+
+
+def get_adjective_verb_or_noun(words, tags=None):
     """Get the number of words that are classified as verbs or nouns.
 
     Args:
         words (TYPE): Description
+        tags (list, optional): Precomputed (word, tag) tuples for `words`,
+            e.g. from `get_pos_tags`. If not given, the words are
+            tagged together as one sentence.
 
     Returns:
         dict: The data and summary results.
     """
-    total = len(words)
+    if tags is None:
+        from nltk import pos_tag
+
+        tags = pos_tag(words)
     data = {'verbs': 0, 'nouns': 0}
-    verby = ['VBP', 'VB', 'RB', 'VBG']
-    nouns = ['NN', 'NNP']
-    for word, tag in pos_tag(words):
-        if tag in nouns:
+    _count_verbs_and_nouns(data, tags)
+    return _adjective_verb_or_noun(len(words), data)
+
+
+def _count_verbs_and_nouns(data, tags):
+    for word, tag in tags:
+        if tag in _noun_tags:
             data['nouns'] += 1
-        elif tag in verby:
+        elif tag in _verb_tags:
             data['verbs'] += 1
+
+
+def _adjective_verb_or_noun(total, data):
     remainder = total - (data['verbs'] + data['nouns'])
     return {
         'data': data,
@@ -326,7 +451,7 @@ def get_adjective_verb_or_noun(words):
     }
 
 
-def categorize_word_type(words):
+def categorize_word_type(words, tags=None):
     """Get the common naming strategy 'category' of a name, based on precedence.
 
     Categories are derived from
@@ -356,14 +481,18 @@ def categorize_word_type(words):
 
     Args:
         words (list): A list of words
+        tags (list, optional): Precomputed (word, tag) tuples for `words`,
+            from `get_pos_tags`. If not given, they are computed here.
 
     Returns:
         new_words (list) - A list of lists, with each word
                            and its distribution by word "type"
     """
+    if tags is None:
+        tags = get_pos_tags(words)
     new_words = []
 
-    def _get_distribution(word):
+    def _get_distribution(word, tag):
         # TODO:
         # misspelled, foreign, tweaked, affixed, fake_obscure,
         # initials_acronym, blend, puns, person, compound
@@ -390,48 +519,307 @@ def categorize_word_type(words):
             categories['phrase'] = 50
         # If word cannot be tagged,
         # it's very likely fake_obscure
-        if pos_tag([word])[0][1] == '-NONE-':
+        if tag == '-NONE-':
             categories['real'] = 0
             categories['fake_obscure'] = 75
         return categories
 
-    for word in words:
-        new_words.append([word, _get_distribution(word)])
+    for word, tag in tags:
+        new_words.append([word, _get_distribution(word, tag)])
     return new_words
 
 
-def generate_all_metrics(filename=None, words=None):
+def _tally(counts, keys):
+    for key in keys:
+        counts[key] = counts.get(key, 0) + 1
+
+
+def _combine(values, other):
+    """Add the values of another accumulator's list or tally to `values`."""
+    if isinstance(values, dict):
+        for key, count in other.iteritems():
+            values[key] = values.get(key, 0) + count
+    else:
+        values += other
+
+
+def _word_type_tags(parsed):
+    """Get the tags of a `get_word_types` result, e.g. `NN` for `cat/NN`."""
+    return [token.rsplit('/', 1)[1] for token in parsed.split()
+            if '/' in token]
+
+
+class MetricsAccumulator(object):
+    """Compute all character-level metrics in a single pass over the names.
+
+    Names are added one at a time, so they can come from any iterable.
+    `results` returns the same result dicts as the individual metric
+    functions (e.g. `name_length`, `get_digits_frequency`).
+
+    With `aggregate`, no per-name data is kept, so memory does not grow
+    with the number of names. Metrics listing values per name (lengths,
+    digits, special characters, spaces and word types) then count how
+    often each value occurs instead, and `name_numbers` only counts the
+    matching names.
+    """
+
+    def __init__(self, aggregate=False):
+        self.aggregate = aggregate
+        self.total = 0
+        self.length_sum = 0
+        self.vowel_count = {'a': 0, 'e': 0, 'i': 0, 'o': 0, 'u': 0}
+        self.vowel_start = 0
+        self.digit_names = 0
+        self.digit_count = 0
+        self.first_letters = {}
+        self.special_count = 0
+        self.consonant_repeat = 0
+        self.consonant_dup = 0
+        self.vowel_repeat = 0
+        self.named_number_count = 0
+        self.tagged = 0
+        self.pos_counts = {'verbs': 0, 'nouns': 0}
+        self.typed = 0
+        if aggregate:
+            self.lengths = {}
+            self.digits = {}
+            self.special_chars = {}
+            self.spaces = {}
+            self.word_types = {}
+            self.named_numbers = None
+        else:
+            self.lengths = []
+            self.digits = []
+            self.special_chars = []
+            self.spaces = []
+            self.word_types = []
+            self.named_numbers = []
+
+    def add(self, word):
+        """Add a single name.
+
+        Args:
+            word (str): The name.
+        """
+        self.total += 1
+        length = len(word)
+        self.length_sum += length
+        vowel_count = self.vowel_count
+        for vowel in vowel_count:
+            vowel_count[vowel] += word.count(vowel)
+        if _vowel_start_re.match(word):
+            self.vowel_start += 1
+        digits = _digits_re.findall(word)
+        if digits:
+            self.digit_names += 1
+            self.digit_count += len(digits)
+        first = word[0]
+        self.first_letters[first] = self.first_letters.get(first, 0) + 1
+        special_chars = _special_chars_re.findall(word)
+        self.special_count += len(special_chars)
+        spaces = len(word.split(r' '))
+        if _consonant_repeat_re.match(word):
+            self.consonant_repeat += 1
+        if _consonant_dup_re.match(word):
+            self.consonant_dup += 1
+        if _vowel_repeat_re.match(word):
+            self.vowel_repeat += 1
+        named_number = _numbers_re.search(word) is not None
+        if named_number:
+            self.named_number_count += 1
+        if self.aggregate:
+            _tally(self.lengths, [length])
+            _tally(self.digits, digits)
+            _tally(self.special_chars, special_chars)
+            _tally(self.spaces, [spaces])
+            return
+        self.lengths.append(length)
+        self.digits += digits
+        self.special_chars += special_chars
+        self.spaces.append({'word': word, 'spaces': spaces})
+        if named_number:
+            self.named_numbers.append(word)
+
+    def update(self, words):
+        """Add all names from an iterable.
+
+        Args:
+            words (iterable): The names.
+        """
+        add = self.add
+        for word in words:
+            add(word)
+
+    def add_pos_tags(self, tags):
+        """Count the verbs and nouns among tagged names.
+
+        Args:
+            tags (list): (word, tag) tuples, e.g. from `get_pos_tags`.
+        """
+        tags = list(tags)
+        self.tagged += len(tags)
+        _count_verbs_and_nouns(self.pos_counts, tags)
+
+    def add_word_types(self, words):
+        """Add the `get_word_types` results of some names.
+
+        Args:
+            words (list): The names.
+        """
+        parsed = get_word_types(words)['data']
+        self.typed += len(words)
+        if self.aggregate:
+            for value in parsed:
+                _tally(self.word_types, _word_type_tags(value))
+        else:
+            self.word_types += parsed
+
+    def merge(self, other):
+        """Merge the partial results of another accumulator into this one.
+
+        The result is the same as if the other accumulator's names were
+        added to this one, after its own names. Both accumulators must
+        use the same `aggregate` mode.
+
+        Args:
+            other (MetricsAccumulator): The other accumulator.
+
+        Returns:
+            MetricsAccumulator: This accumulator.
+        """
+        if other.aggregate != self.aggregate:
+            raise ValueError('Cannot merge aggregate and per-name metrics.')
+        self.total += other.total
+        self.length_sum += other.length_sum
+        for vowel, count in other.vowel_count.iteritems():
+            self.vowel_count[vowel] += count
+        self.vowel_start += other.vowel_start
+        self.digit_names += other.digit_names
+        self.digit_count += other.digit_count
+        _combine(self.first_letters, other.first_letters)
+        self.special_count += other.special_count
+        self.consonant_repeat += other.consonant_repeat
+        self.consonant_dup += other.consonant_dup
+        self.vowel_repeat += other.vowel_repeat
+        self.named_number_count += other.named_number_count
+        self.tagged += other.tagged
+        _combine(self.pos_counts, other.pos_counts)
+        self.typed += other.typed
+        _combine(self.lengths, other.lengths)
+        _combine(self.digits, other.digits)
+        _combine(self.special_chars, other.special_chars)
+        _combine(self.spaces, other.spaces)
+        _combine(self.word_types, other.word_types)
+        if not self.aggregate:
+            self.named_numbers += other.named_numbers
+        return self
+
+    def results(self):
+        """Get the metrics for all names added so far.
+
+        Returns:
+            dict: The metrics results, keyed like `generate_all_metrics`.
+                The part-of-speech metrics are only included if tags
+                or word types were added.
+        """
+        total = self.total
+        length = {
+            'data': dict(self.lengths) if self.aggregate else self.lengths,
+            'summary': (
+                'Of {} words, the average length of names is...{}'.format(
+                    total, round(self.length_sum / total)))
+        }
+        results = {
+            'digits_freq': {
+                'data': self.digits,
+                'summary': ('Of {} words, {} have numbers in them, '
+                            'with a total of {} numbers found.').format(
+                                total, self.digit_names, self.digit_count)
+            },
+            'length': length,
+            'vowel_beginning': {
+                'data': None,
+                'summary': ('Of {} words, {} or {}% are vowels as the first '
+                            'letter.').format(
+                                total, self.vowel_start,
+                                round(float(self.vowel_start) / total * 100))
+            },
+            'vowel_count': {'data': dict(self.vowel_count), 'summary': None},
+            'name_length': dict(length),
+            'name_spaces': {'data': self.spaces, 'summary': None},
+            'consonant_repeat_freq': {
+                'data': self.consonant_repeat, 'summary': None},
+            'consonant_dup_repeat_freq': {
+                'data': self.consonant_dup, 'summary': None},
+            'vowel_repeat_freq': {'data': self.vowel_repeat, 'summary': None},
+            'special_characters': {
+                'data': self.special_chars,
+                'summary': ('{} occurrences of special characters were'
+                            ' found in {} words.').format(
+                                self.special_count, total)
+            },
+            'name_numbers': {
+                'data': (self.named_number_count if self.aggregate
+                         else self.named_numbers),
+                'summary': 'Of {} words, {} matched'.format(
+                    total, self.named_number_count)
+            },
+            'first_letter_freq': {
+                'data': dict(self.first_letters), 'summary': None},
+        }
+        if self.tagged:
+            results['adj_verb_noun'] = _adjective_verb_or_noun(
+                self.tagged, dict(self.pos_counts))
+        if self.typed:
+            results['word_types'] = {'data': self.word_types, 'summary': None}
+        return results
+
+
+def generate_all_metrics(filename=None, words=None, chunk_size=10000,
+                         encoding='utf-8', use_mmap=False, aggregate=False):
     """Generate all metrics in this module in one place.
 
+    Names are read as a stream (see `iter_file`), in chunks. Each chunk
+    goes through its own `MetricsAccumulator`, along with its
+    part-of-speech tags and word types, and is then merged into the
+    overall results.
+
     Args:
         filename (str, optional): A filename to load words from.
+            Line endings and blank lines are skipped.
         words (TYPE, optional): Words to use, if file is not specified.
+        chunk_size (int, optional): The number of names processed at a time.
+        encoding (str, optional): The file encoding.
+        use_mmap (bool, optional): Memory-map the file.
+        aggregate (bool, optional): Only keep counts and sums, so memory
+            stays flat for any number of names (see `MetricsAccumulator`).
+            The names are then not returned either.
 
     Returns:
-        dict: All metrics results, keyed by name.
+        dict: All metrics results, keyed by name, under `metrics`, and
+            the names under `names` (unless `aggregate` is set).
     """
     if not filename and not words:
         return None
     if filename:
-        allnames = prep_file(filename)
+        names = iter_file(filename, encoding=encoding, use_mmap=use_mmap)
     else:
-        allnames = words
+        names = words
+    allnames = []
+    accumulator = MetricsAccumulator(aggregate=aggregate)
+    for chunk in iter_chunks(names, chunk_size=chunk_size):
+        partial = MetricsAccumulator(aggregate=aggregate)
+        partial.update(chunk)
+        partial.add_pos_tags(get_pos_tags(chunk))
+        partial.add_word_types(chunk)
+        accumulator.merge(partial)
+        if not aggregate:
+            allnames += chunk
+    if not accumulator.total:
+        return None
+    if aggregate:
+        return {'metrics': accumulator.results()}
     return {
         'names': allnames,
-        'metrics': {
-            'digits_freq': get_digits_frequency(allnames),
-            'length': name_length(allnames),
-            'vowel_beginning': name_starts_with_vowel(allnames),
-            'vowel_count': name_vowel_count(allnames),
-            'name_length': name_length(allnames),
-            'name_spaces': get_name_spaces(allnames),
-            'consonant_repeat_freq': get_consonant_repeat_frequency(allnames),
-            'consonant_dup_repeat_freq': get_consonant_duplicate_repeat_frequency(allnames),
-            'vowel_repeat_freq': get_vowel_repeat_frequency(allnames),
-            'special_characters': get_special_chars(allnames),
-            'name_numbers': get_named_numbers_1_10(allnames),
-            'adj_verb_noun': get_adjective_verb_or_noun(allnames),
-            'first_letter_freq': get_first_letter_frequency(allnames),
-            'word_types': get_word_types(allnames)
-        }
+        'metrics': accumulator.results()
     }
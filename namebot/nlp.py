@@ -2,19 +2,20 @@
 
 Word relationships found (via NLTK and other libraries)
 to find and generate related words.
+
+NLTK (and NumPy) are only imported by the functions that use them,
+so importing this module stays cheap.
 """
 
 
 from __future__ import absolute_import
 
 import itertools
-
-from nltk.corpus import (
-    verbnet,
-    wordnet,
-)
+import json
+import os
 
 from . import normalization
+from .cache import PersistentCache
 
 
 def _get_synset_words(word):
@@ -31,15 +32,178 @@ def _get_synset_words(word):
     return words
 
 
+# The synset names of each part of speech,
+# keyed by (WordNet version, pos).
+_synset_categories = {}
+
+
+def get_all_synset_categories(pos='n'):
+    """Get the names of all synsets for a part of speech, loading them once.
+
+    WordNet never changes while running, so the names are cached
+    (per WordNet version) after the first call. Only the names are kept,
+    not the synsets; see `SynsetSnapshot` to browse them without WordNet.
+
+    :param pos (str, optional): The WordNet part of speech.
+    :rtype categories (tuple): All wordnet synset names for `pos`,
+        e.g. `dog.n.01`.
+    """
+    from nltk.corpus import wordnet
+
+    key = (_get_wordnet_version(), pos)
+    if key not in _synset_categories:
+        _synset_categories[key] = tuple(
+            synset.name() for synset in wordnet.all_synsets(pos))
+    return _synset_categories[key]
+
+
 def print_all_synset_categories():
     """Print all domains and categories for research purposes.
 
+    The synsets are not cached; `get_all_synset_categories` caches
+    their names.
+
     :rtype categories (list): A list of all wordnet synsets.
     """
-    categories = []
-    for synset in list(wordnet.all_synsets('n')):
-        categories.append(synset)
-    return categories
+    from nltk.corpus import wordnet
+
+    return list(wordnet.all_synsets('n'))
+
+
+def iter_synset_categories(pos='n', lexnames=None, domains=None):
+    """Lazily yield synsets, optionally filtered by category.
+
+    Unlike `print_all_synset_categories`, nothing is kept in memory.
+
+    :param pos (str, optional): The WordNet part of speech.
+    :param lexnames (list, optional): Only yield synsets in these
+        lexicographer categories, e.g. `noun.animal`.
+    :param domains (list, optional): Only yield synsets with one of these
+        topic domains, given as synset names, e.g. `music.n.01`.
+    :rtype generator: The matching wordnet synsets.
+    """
+    from nltk.corpus import wordnet
+
+    if lexnames is not None:
+        lexnames = frozenset(lexnames)
+    if domains is not None:
+        domains = frozenset(domains)
+    for synset in wordnet.all_synsets(pos):
+        if lexnames is not None and synset.lexname() not in lexnames:
+            continue
+        if domains is not None and not any(
+                domain.name() in domains
+                for domain in synset.topic_domains()):
+            continue
+        yield synset
+
+
+class SynsetSnapshot(object):
+    """A memory-mapped list of synset names, categories and offsets.
+
+    Built once with `build_synset_snapshot`, so categories can be browsed
+    without loading WordNet or holding its synset objects in memory.
+
+    Files in the snapshot directory:
+        meta.json: the part of speech, lexnames and WordNet version.
+        names.npy: the synset names.
+        lexnames.npy: the lexname of each synset, as an index into
+            the lexnames in meta.json.
+        offsets.npy: the WordNet offset of each synset.
+    """
+
+    def __init__(self, path):
+        """Open a snapshot directory.
+
+        :param path (str): The snapshot directory.
+        """
+        import numpy as np
+
+        with open(os.path.join(path, 'meta.json')) as metafile:
+            self.meta = json.load(metafile)
+        self.pos = self.meta['pos']
+        self.lexnames = self.meta['lexnames']
+        for name in ('names', 'offsets'):
+            setattr(self, name, np.load(
+                os.path.join(path, '{}.npy'.format(name)), mmap_mode='r'))
+        self.lexname_ids = np.load(
+            os.path.join(path, 'lexnames.npy'), mmap_mode='r')
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return self.iter()
+
+    def iter(self, lexnames=None):
+        """Lazily yield the synsets, optionally filtered by lexname.
+
+        :param lexnames (list, optional): Only yield synsets in these
+            lexicographer categories, e.g. `noun.animal`.
+        :rtype generator: `(name, lexname, offset)` tuples.
+        """
+        import numpy as np
+
+        if lexnames is None:
+            rows = xrange(len(self.names))
+        else:
+            ids = [i for i, lexname in enumerate(self.lexnames)
+                   if lexname in lexnames]
+            rows = np.flatnonzero(np.in1d(self.lexname_ids, ids))
+        for row in rows:
+            yield (self.names[row].decode('utf-8'),
+                   self.lexnames[self.lexname_ids[row]],
+                   int(self.offsets[row]))
+
+    def synset(self, offset):
+        """Load the wordnet synset at an offset.
+
+        :param offset (int): The WordNet offset.
+        :rtype synset: The wordnet synset.
+        """
+        from nltk.corpus import wordnet
+
+        return wordnet.synset_from_pos_and_offset(self.pos, offset)
+
+
+def build_synset_snapshot(path, pos='n', synsets=None):
+    """Write the synsets for a part of speech to a snapshot directory.
+
+    :param path (str): The directory to write the snapshot to.
+    :param pos (str, optional): The WordNet part of speech.
+    :param synsets (iterable, optional): The synsets to write.
+        Defaults to all wordnet synsets for `pos`.
+    :rtype snapshot (SynsetSnapshot): The new snapshot.
+    """
+    import numpy as np
+
+    version = None
+    if synsets is None:
+        from nltk.corpus import wordnet
+
+        synsets = wordnet.all_synsets(pos)
+        version = _get_wordnet_version()
+    names, lexname_ids, offsets = [], [], []
+    lexnames = {}
+    for synset in synsets:
+        names.append(_encode(synset.name()))
+        lexname_ids.append(lexnames.setdefault(
+            synset.lexname(), len(lexnames)))
+        offsets.append(synset.offset())
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    arrays = {
+        'names': np.array(names, dtype=bytes),
+        'lexnames': np.array(lexname_ids, dtype=np.uint8),
+        'offsets': np.array(offsets, dtype=np.uint32),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(path, '{}.npy'.format(name)), array)
+    with open(os.path.join(path, 'meta.json'), 'w') as metafile:
+        json.dump({'pos': pos,
+                   'lexnames': sorted(lexnames, key=lexnames.get),
+                   'wordnet_version': version}, metafile)
+    return SynsetSnapshot(path)
 
 
 def _get_lemma_names(sub_synset, use_definitions=False):
@@ -293,6 +457,8 @@ def get_verb_lemmas(verbs):
     :rtype lemmas (list) - A list of lemmas for all verbs
                         - these are not separated by verb.
     """
+    from nltk.corpus import verbnet
+
     lemmas = []
     for verb in normalization.stem_words(verbs):
         _lemmas = verbnet.classids(lemma=verb)
@@ -306,6 +472,8 @@ def get_word_synsets(word):
     :param word (str): The word to lookup.
     :rtype object: The synset ring instance.
     """
+    from nltk.corpus import wordnet
+
     return wordnet.synsets(word.encode('utf-8'), pos=None)
 
 
@@ -331,6 +499,57 @@ def get_synsets_definitions(words):
     return [get_synset_definitions(w) for w in words if w]
 
 
+# All relation types walked for each synset by `get_synsets`,
+# as (result key, extraction function) pairs.
+_relations = (
+    # More Specific *nyms (deep)
+    ('hyponyms', get_hyponyms),
+    ('instance_hyponyms', get_inst_hyponyms),
+    ('member_meronyms', get_member_meronyms),
+    ('substance_meronyms', get_substance_meronyms),
+    ('part_meronyms', get_part_meronyms),
+    ('substance_holonyms', get_substance_holoynms),
+    # More Generic *nyms (shallow)
+    ('member_holonyms', get_member_holoynms),
+    ('part_holonyms', get_part_holoynms),
+    ('instance_hypernyms', get_instance_hypernyms),
+    ('hypernyms', get_hypernyms),
+    # Other types
+    ('topic_domains', get_topic_domains),
+    ('region_domains', get_region_domains),
+    ('usage_domains', get_usage_domains),
+    ('attributes', get_attributes),
+    ('entailments', get_entailments),
+    ('causes', get_causes),
+    ('also_sees', get_also_sees),
+    ('verb_groups', get_verb_groups),
+    ('similar_tos', get_similartos),
+)
+
+
+def _get_word_relations(word, use_definitions=False):
+    """Walk the synset ring of a single word for all relation types.
+
+    :param word (str): The word to lookup.
+    :param use_definitions (bool, optional): Determine if definition words
+            should also be extracted.
+    :rtype key (dict): The related words, keyed by relation type.
+    """
+    synsets = get_word_synsets(word)
+
+    key = {'synset_original': []}
+
+    for synset in synsets:
+        if hasattr(synset.lemma_names, '__call__'):
+            key['synset_original'].append(synset.lemma_names())
+        else:
+            key['synset_original'].append(synset.lemma_names)
+
+        for relation, func in _relations:
+            key[relation] = func(synset, use_definitions=use_definitions)
+    return key
+
+
 def get_synsets(words, use_definitions=False, clean=False):
     """Brute force loop on a synset ring to get all related words.
 
@@ -339,6 +558,12 @@ def get_synsets(words, use_definitions=False, clean=False):
     The scoring module provides tools to filter based on pronunciation,
     but you can write your own and extend the functionality.
 
+    If a relation index is enabled with `use_relation_index`, words found
+    in it are looked up there instead of walking the synset ring.
+    If a synset cache is enabled with `use_synset_cache`, previously
+    computed results are reused, and new ones are stored, in a single
+    transaction.
+
     :param words (list): The list of words.
     :param use_definitions (bool, optional): Determine if definition words
             should also be extracted.
@@ -346,63 +571,28 @@ def get_synsets(words, use_definitions=False, clean=False):
             cleaned, etc...
     :rtype results (dict): The results dictionary.
     """
-    results = {}
+    if _synset_cache is None:
+        return _get_synsets(words, use_definitions, clean)
+    with _synset_cache.transaction():
+        return _get_synsets(words, use_definitions, clean)
 
-    for word in words:
-        synsets = get_word_synsets(word)
 
-        key = {'synset_original': []}
-
-        for synset in synsets:
-            if hasattr(synset.lemma_names, '__call__'):
-                key['synset_original'].append(synset.lemma_names())
-            else:
-                key['synset_original'].append(synset.lemma_names)
-
-            # More Specific *nyms (deep)
-            key['hyponyms'] = get_hyponyms(
-                synset, use_definitions=use_definitions)
-            key['instance_hyponyms'] = get_inst_hyponyms(
-                synset, use_definitions=use_definitions)
-            key['member_meronyms'] = get_member_meronyms(
-                synset, use_definitions=use_definitions)
-            key['substance_meronyms'] = get_substance_meronyms(
-                synset, use_definitions=use_definitions)
-            key['part_meronyms'] = get_part_meronyms(
-                synset, use_definitions=use_definitions)
-            key['substance_holonyms'] = get_substance_holoynms(
-                synset, use_definitions=use_definitions)
-
-            # More Generic *nyms (shallow)
-            key['member_holonyms'] = get_member_holoynms(
-                synset, use_definitions=use_definitions)
-            key['part_holonyms'] = get_part_holoynms(
-                synset, use_definitions=use_definitions)
-            key['instance_hypernyms'] = get_instance_hypernyms(
-                synset, use_definitions=use_definitions)
-            key['hypernyms'] = get_hypernyms(
-                synset, use_definitions=use_definitions)
-
-            # Other types
-            key['topic_domains'] = get_topic_domains(
-                synset, use_definitions=use_definitions)
-            key['region_domains'] = get_region_domains(
-                synset, use_definitions=use_definitions)
-            key['usage_domains'] = get_usage_domains(
-                synset, use_definitions=use_definitions)
-            key['attributes'] = get_attributes(
-                synset, use_definitions=use_definitions)
-            key['entailments'] = get_entailments(
-                synset, use_definitions=use_definitions)
-            key['causes'] = get_causes(
-                synset, use_definitions=use_definitions)
-            key['also_sees'] = get_also_sees(
-                synset, use_definitions=use_definitions)
-            key['verb_groups'] = get_verb_groups(
-                synset, use_definitions=use_definitions)
-            key['similar_tos'] = get_similartos(
-                synset, use_definitions=use_definitions)
+def _get_synsets(words, use_definitions, clean):
+    results = {}
+    cached = {}
 
+    for word in words:
+        if _synset_cache is not None:
+            value = _synset_cache.get(
+                _synset_cache_key(word, use_definitions, clean))
+            if value is not None:
+                cached[word] = value
+                continue
+        key = None
+        if _relation_index is not None and not use_definitions:
+            key = _relation_index.get(word)
+        if key is None:
+            key = _get_word_relations(word, use_definitions=use_definitions)
         results[word] = key
 
     # 1. get words back
@@ -410,15 +600,220 @@ def get_synsets(words, use_definitions=False, clean=False):
     # 3. split up words
     # 4. filter, clean, stem, uniquify
 
-    for nlp_type in results:
-        if clean:
-            results[nlp_type] = sorted(
-                normalization.uniquify(
-                    normalization.clean_sort(
-                        normalization.remove_stop_words(
-                            normalization.stem_words(
-                                normalization.remove_bad_words(
-                                    list(itertools.chain(
-                                        *results[nlp_type]))))))))
-
+    if clean and results:
+        pipeline = normalization.NormalizationPipeline(
+            normalization.SYNSET_STAGES)
+        for nlp_type in results:
+            results[nlp_type] = sorted(pipeline.run(
+                itertools.chain(*results[nlp_type])))
+
+    if _synset_cache is not None:
+        for word, value in results.items():
+            _synset_cache.set(
+                _synset_cache_key(word, use_definitions, clean), value)
+    results.update(cached)
     return results
+
+
+# Relation index layout: result keys stored for each word, and the kinds
+# of stored values (a key can be missing, None, or a list of lemma names).
+_index_relations = ['synset_original'] + [name for name, _ in _relations]
+_INDEX_MISSING, _INDEX_NONE, _INDEX_LIST = 0, 1, 2
+# Separates the per-synset groups of `synset_original`.
+_INDEX_SEPARATOR = 0xFFFFFFFF
+_missing = object()
+
+_relation_index = None
+
+
+def _encode(text):
+    return text.encode('utf-8') if isinstance(text, unicode) else text
+
+
+class RelationIndex(object):
+    """A memory-mapped index of precomputed `get_synsets` results.
+
+    Built once with `build_relation_index`. Lookups only touch the
+    memory-mapped arrays, so they are fast and load nothing up front.
+
+    Files in the index directory:
+        meta.json: the relation keys and the WordNet version.
+        words.npy: the sorted index words.
+        names.npy: all related lemma names, referenced by id.
+        kinds.npy: the kind of value stored, per word and relation.
+        offsets.npy: the start of each (word, relation) run in ids.npy.
+        ids.npy: the lemma name ids.
+    """
+
+    def __init__(self, path):
+        """Open an index directory.
+
+        :param path (str): The index directory.
+        """
+        import numpy as np
+
+        with open(os.path.join(path, 'meta.json')) as metafile:
+            self.meta = json.load(metafile)
+        self.relations = self.meta['relations']
+        for name in ('words', 'names', 'kinds', 'offsets', 'ids'):
+            setattr(self, name, np.load(
+                os.path.join(path, '{}.npy'.format(name)), mmap_mode='r'))
+        self._np = np
+
+    def __contains__(self, word):
+        return self._find(word) is not None
+
+    def _find(self, word):
+        key = _encode(word.lower())
+        pos = int(self._np.searchsorted(self.words, key))
+        if pos < len(self.words) and self.words[pos] == key:
+            return pos
+        return None
+
+    def _names(self, start, end):
+        return [self.names[i].decode('utf-8') for i in self.ids[start:end]]
+
+    def get(self, word):
+        """Get the `get_synsets` result for a single word.
+
+        :param word (str): The word to lookup.
+        :rtype key (dict): The related words keyed by relation type,
+            or None if the word is not in the index.
+        """
+        pos = self._find(word)
+        if pos is None:
+            return None
+        key = {}
+        for r, relation in enumerate(self.relations):
+            cell = pos * len(self.relations) + r
+            kind = self.kinds[pos, r]
+            if kind == _INDEX_MISSING:
+                continue
+            if kind == _INDEX_NONE:
+                key[relation] = None
+                continue
+            start, end = self.offsets[cell], self.offsets[cell + 1]
+            if relation != 'synset_original':
+                key[relation] = self._names(start, end)
+                continue
+            groups = [[]]
+            for i in self.ids[start:end]:
+                if i == _INDEX_SEPARATOR:
+                    groups.append([])
+                else:
+                    groups[-1].append(self.names[i].decode('utf-8'))
+            key[relation] = groups[:-1]
+        return key
+
+
+def build_relation_index(path, words=None):
+    """Precompute `get_synsets` results into a relation index directory.
+
+    This walks the full synset ring for every word, so it is slow,
+    but only needs to be run once per WordNet version.
+
+    :param path (str): The directory to write the index to.
+    :param words (list, optional): The words to index.
+        Defaults to all lemma names in WordNet.
+    :rtype index (RelationIndex): The new index.
+    """
+    import numpy as np
+    from nltk.corpus import wordnet
+
+    if words is None:
+        words = wordnet.all_lemma_names()
+    words = sorted(set(_encode(word.lower()) for word in words))
+    names = {}
+    kinds = np.zeros((len(words), len(_index_relations)), dtype=np.uint8)
+    offsets = [0]
+    ids = []
+    for pos, word in enumerate(words):
+        key = _get_word_relations(word)
+        for r, relation in enumerate(_index_relations):
+            value = key.get(relation, _missing)
+            if value is None:
+                kinds[pos, r] = _INDEX_NONE
+            elif value is not _missing:
+                kinds[pos, r] = _INDEX_LIST
+                groups = value if relation == 'synset_original' else [value]
+                for group in groups:
+                    ids.extend(names.setdefault(_encode(name), len(names))
+                               for name in group)
+                    if relation == 'synset_original':
+                        ids.append(_INDEX_SEPARATOR)
+            offsets.append(len(ids))
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    arrays = {
+        'words': np.array(words, dtype=bytes),
+        'names': np.array(sorted(names, key=names.get), dtype=bytes),
+        'kinds': kinds,
+        'offsets': np.array(offsets, dtype=np.int64),
+        'ids': np.array(ids, dtype=np.uint32),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(path, '{}.npy'.format(name)), array)
+    with open(os.path.join(path, 'meta.json'), 'w') as metafile:
+        json.dump({'relations': _index_relations,
+                   'wordnet_version': wordnet.get_version()}, metafile)
+    return RelationIndex(path)
+
+
+def use_relation_index(path):
+    """Use a relation index as the backend for `get_synsets`.
+
+    :param path (str): The index directory, or None to stop using one.
+    """
+    global _relation_index
+    _relation_index = RelationIndex(path) if path is not None else None
+
+
+_synset_cache = None
+_wordnet_version = None
+
+
+def _get_wordnet_version():
+    global _wordnet_version
+    if _wordnet_version is None:
+        from nltk.corpus import wordnet
+        _wordnet_version = wordnet.get_version()
+    return _wordnet_version
+
+
+def _synset_cache_key(word, use_definitions, clean):
+    return [word, use_definitions, clean, _get_wordnet_version()]
+
+
+def use_synset_cache(path, max_bytes=None):
+    """Cache `get_synsets` results persistently in an SQLite database.
+
+    Results are keyed by word, options and WordNet version.
+
+    :param path (str): The database file, or None to stop caching.
+    :param max_bytes (int, optional): The maximum total size of the
+        cached results, after which the least recently used are evicted.
+    :rtype cache (PersistentCache): The cache, or None.
+    """
+    global _synset_cache
+    if _synset_cache is not None:
+        _synset_cache.close()
+    _synset_cache = (PersistentCache(path, max_bytes=max_bytes)
+                     if path is not None else None)
+    return _synset_cache
+
+
+def warm_synset_cache(words, use_definitions=False, clean=False):
+    """Precompute `get_synsets` results for a list of (common) seed words.
+
+    :param words (list): The seed words.
+    :param use_definitions (bool, optional): See `get_synsets`.
+    :param clean (bool, optional): See `get_synsets`.
+    :rtype count (int): The number of words that were not already cached.
+    """
+    if _synset_cache is None:
+        raise ValueError('No synset cache enabled, see `use_synset_cache`.')
+    with _synset_cache.transaction():
+        missing = [word for word in set(words) if _synset_cache_key(
+            word, use_definitions, clean) not in _synset_cache]
+        get_synsets(missing, use_definitions=use_definitions, clean=clean)
+    return len(missing)
@@ -1,17 +1,30 @@
-"""Helpers to normalize inputs and text."""
+"""Helpers to normalize inputs and text.
+
+NLTK and Pattern are only imported by the functions that use them,
+so importing this module stays cheap.
+"""
 
 import re
 import string
 from collections import defaultdict
-
-from nltk.corpus import stopwords
-
-from pattern.vector import PORTER
-from pattern.vector import stem
+from collections import OrderedDict
 
 import settings as namebot_settings
+from cache import LRUCache
 
 _regexes = namebot_settings.regexes
+_odd_regexes = [
+    re.compile(r'^a|e|i|o|u|y{3,6}'),
+    # bk, ck, dk, gk, etc...
+    re.compile(r'\b[^aeiouys]k|zt|ksd|kd|zhr'),
+    re.compile(r'\bzt|ksd|kd|zhr')
+]
+_bad_words = frozenset(["nigger", "wop",
+                        "kike", "faggot",
+                        "fuck", "pussy", "cunt"])
+# Characters removed by `clean_sort`.
+_clean_chars = '!"#$%\'()*+,._/:;<=>?@[\\]^`{|}~01234567890'
+_clean_unicode_table = dict((ord(char), None) for char in _clean_chars)
 
 
 def flatten(lst):
@@ -50,22 +63,38 @@ def remove_odd_sounding_words(words):
     Returns:
         list: An updated word list with words cleaned.
     """
-    odd_regexes = [
-        re.compile(r'^a|e|i|o|u|y{3,6}'),
-        # bk, ck, dk, gk, etc...
-        re.compile(r'\b[^aeiouys]k|zt|ksd|kd|zhr'),
-        re.compile(r'\bzt|ksd|kd|zhr')
-    ]
     cleaned = []
     if words is None or len(words) == 0:
         return words
     # Loop through any number of
     # regexes and add only if no matches exist
     [cleaned.append(word) for word in words if not any(
-        re.match(regex, word) for regex in odd_regexes)]
+        re.match(regex, word) for regex in _odd_regexes)]
     return cleaned
 
 
+_stem_cache = LRUCache(maxsize=namebot_settings.STEM_CACHE_SIZE)
+
+
+def _stem(word):
+    from pattern.vector import PORTER
+    from pattern.vector import stem
+
+    return stem(word, stemmer=PORTER)
+
+
+def stem_word(word):
+    """Stem a single word, caching the result.
+
+    Args:
+        word (str): The word.
+
+    Returns:
+        str: The stemmed word.
+    """
+    return _stem_cache.get(word, _stem, word)
+
+
 def stem_words(words):
     """Stem words to their base linguistic stem to remove redundancy.
 
@@ -75,21 +104,101 @@ def stem_words(words):
     Returns:
         list: An updated word list with words stemmed.
     """
-    return [stem(word, stemmer=PORTER) for word in words]
+    return [stem_word(word) for word in words]
+
+
+def stem_words_batch(words):
+    """Stem words, stemming each distinct word only once.
+
+    Args:
+        words (list): The list of words, possibly with repeats.
+
+    Returns:
+        list: The stemmed words, in the same order as `words`.
+    """
+    stems = dict((word, stem_word(word)) for word in set(words))
+    return [stems[word] for word in words]
+
+
+def stem_cache_info():
+    """Return the hit/miss statistics for the stem cache.
+
+    Returns:
+        dict: The cache statistics.
+    """
+    return _stem_cache.info()
+
+
+def set_stem_cache_size(maxsize):
+    """Set the maximum number of cached stems.
+
+    Args:
+        maxsize (int): The maximum size, or None for unbounded.
+    """
+    _stem_cache.resize(maxsize)
+
+
+# Stop words for each language, loaded from NLTK on first use.
+_stop_words = {}
+
+
+def get_stop_words(language='english'):
+    """Get the (cached) set of stop words for one or more languages.
+
+    Args:
+        language (str or list, optional): The language(s) to use.
+
+    Returns:
+        frozenset: The lowercase stop words.
+    """
+    if not isinstance(language, basestring):
+        return frozenset().union(*[get_stop_words(l) for l in language])
+    if language not in _stop_words:
+        from nltk.corpus import stopwords
+        _stop_words[language] = frozenset(stopwords.words(language))
+    return _stop_words[language]
+
+
+def add_stop_words(words, language='english'):
+    """Add custom stop words for a language.
+
+    Args:
+        words (list): The words to add.
+        language (str, optional): The language to add the words to.
+    """
+    _stop_words[language] = get_stop_words(language).union(
+        word.lower() for word in words)
 
 
-def remove_stop_words(words):
+def remove_stop_words(words, language='english'):
     """Remove all stop words.
 
     Args:
         words (list): The list of words
+        language (str or list, optional): The language(s) to use.
 
     Returns:
         list: An updated word list with stopwords removed.
     """
     # http://stackoverflow.com/questions/5486337/
     # how-to-remove-stop-words-using-nltk-or-python
-    return [w for w in words if w.lower() not in stopwords.words('english')]
+    stop_words = get_stop_words(language)
+    return [w for w in words if w.lower() not in stop_words]
+
+
+def remove_stop_words_batch(word_lists, language='english'):
+    """Remove all stop words from several lists of words.
+
+    Args:
+        word_lists (list): The lists of words.
+        language (str or list, optional): The language(s) to use.
+
+    Returns:
+        list: The updated word lists, in the same order.
+    """
+    stop_words = get_stop_words(language)
+    return [[w for w in words if w.lower() not in stop_words]
+            for words in word_lists]
 
 
 def remove_bad_words(words):
@@ -101,10 +210,7 @@ def remove_bad_words(words):
     Returns:
         list: An updated word list with bad words removed.
     """
-    bad_words = ["nigger", "wop",
-                 "kike", "faggot",
-                 "fuck", "pussy", "cunt"]
-    return [word for word in words if word.lower() not in bad_words]
+    return [word for word in words if word.lower() not in _bad_words]
 
 
 def filter_words(words):
@@ -160,7 +266,7 @@ def clean_sort(words):
     """
     if isinstance(words, basestring):
         return words
-    chars = '!"#$%\'()*+,._/:;<=>?@[\\]^`{|}~01234567890'
+    chars = _clean_chars
     if words is not None:
         try:
             words = [word.strip().lower().translate(
@@ -201,3 +307,136 @@ def key_words_by_pos_tag(words):
     for word, pos in words:
         alltags[pos].append(word)
     return alltags
+
+
+def _bad_words_stage():
+    return lambda word: None if word.lower() in _bad_words else word
+
+
+def _stem_stage():
+    return stem_word
+
+
+def _stop_words_stage():
+    stop_words = get_stop_words()
+    return lambda word: None if word.lower() in stop_words else word
+
+
+def _clean_stage():
+    table = string.maketrans('', '')
+
+    def _clean(word):
+        if len(word) <= 1:
+            return None
+        word = word.strip().lower()
+        if isinstance(word, unicode):
+            return word.translate(_clean_unicode_table)
+        return word.translate(table, _clean_chars)
+    return _clean
+
+
+def _odd_sounding_stage():
+    def _odd_sounding(word):
+        for regex in _odd_regexes:
+            if regex.match(word):
+                return None
+        return word
+    return _odd_sounding
+
+
+def _unique_stage():
+    seen = set()
+
+    def _unique(word):
+        if word in seen:
+            return None
+        seen.add(word)
+        return word
+    return _unique
+
+
+# Stages available to `NormalizationPipeline`. Each factory returns a
+# function taking a single word and returning the (possibly changed)
+# word, or None to reject it.
+_stages = {
+    'bad_words': _bad_words_stage,
+    'stem': _stem_stage,
+    'stop_words': _stop_words_stage,
+    'clean': _clean_stage,
+    'odd_sounding': _odd_sounding_stage,
+    'unique': _unique_stage,
+}
+
+# The stages used by `nlp.get_synsets(clean=True)`.
+SYNSET_STAGES = ('bad_words', 'stem', 'stop_words', 'clean', 'unique')
+# The stages used by `techniques.super_scrub`, before uniquifying.
+SCRUB_STAGES = ('clean', 'odd_sounding')
+
+
+class NormalizationPipeline(object):
+    """Run several normalization steps over words in a single pass.
+
+    Each word goes through every stage in turn, and is dropped as soon as
+    a stage rejects it, so no intermediate lists are built. The number
+    of words each stage removed is kept in `removed`.
+
+    Stages are given by name:
+        bad_words: like `remove_bad_words`.
+        stem: like `stem_words`.
+        stop_words: like `remove_stop_words` (English).
+        clean: like `clean_sort`, also cleaning unicode words.
+        odd_sounding: like `remove_odd_sounding_words`.
+        unique: drops repeated words, keeping the first.
+    """
+
+    def __init__(self, stages):
+        """Set up the pipeline.
+
+        Args:
+            stages (list): The stage names, in order.
+        """
+        for stage in stages:
+            if stage not in _stages:
+                raise ValueError('Unknown stage: {}'.format(stage))
+        self.stages = tuple(stages)
+        self.reset()
+
+    def reset(self):
+        """Reset the stage state (e.g. seen words) and the counters."""
+        self._funcs = [(stage, _stages[stage]()) for stage in self.stages]
+        self.removed = OrderedDict((stage, 0) for stage in self.stages)
+
+    def process(self, word):
+        """Run a single word through all stages.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            str: The normalized word, or None if it was removed.
+        """
+        for stage, func in self._funcs:
+            word = func(word)
+            if word is None:
+                self.removed[stage] += 1
+                return None
+        return word
+
+    def run(self, words):
+        """Lazily run words through all stages, starting from a fresh state.
+
+        Args:
+            words (iterable): The words.
+
+        Returns:
+            generator: The normalized words that were not removed.
+        """
+        self.reset()
+        process = self.process
+        for word in words:
+            word = process(word)
+            if word is not None:
+                yield word
+
+    def __call__(self, words):
+        return list(self.run(words))
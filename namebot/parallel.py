@@ -0,0 +1,118 @@
+"""Parallel execution of the generation techniques over multiple processes.
+
+Every technique in `techniques.generate_all_techniques` is independent,
+so they can be spread over a pool of worker processes. Per-word techniques
+are further split into chunks of the seed list, and pairwise techniques
+into chunks of their first words. Results are always assembled in task
+order, so the output does not depend on which worker finishes first.
+"""
+
+from __future__ import absolute_import
+
+from multiprocessing import Pool
+
+from . import instrumentation
+from . import techniques
+
+
+def _plan_tasks(words, names=None, chunk_size=100):
+    """Split the techniques into independent tasks.
+
+    :param words (list): The seed words.
+    :param names (list, optional): The technique result keys to run.
+        Defaults to all of them.
+    :param chunk_size (int, optional): The number of seed words per task,
+        for techniques that can be chunked.
+    :rtype tasks (list): `(name, words, start, stop)` tuples, where
+        `start` and `stop` are None for unchunked techniques.
+    """
+    tasks = []
+    for name, _, per_word in techniques._all_techniques:
+        if names is not None and name not in names:
+            continue
+        if per_word:
+            for start in range(0, len(words), chunk_size):
+                tasks.append(
+                    (name, words[start:start + chunk_size], None, None))
+        elif name in techniques._row_techniques:
+            for start in range(0, len(words), chunk_size):
+                tasks.append((name, words, start, start + chunk_size))
+        else:
+            tasks.append((name, words, None, None))
+    return tasks
+
+
+def _run_task(task):
+    """Run a single task from `_plan_tasks`.
+
+    This is called in the worker processes, so it must stay importable
+    at module level.
+    """
+    name, words, start, stop = task
+    if start is not None:
+        return techniques._row_techniques[name](words, start, stop)
+    funcs = dict((key, func) for key, func, _ in techniques._all_techniques)
+    return funcs[name](words)
+
+
+def _run_measured_task(task):
+    """Run a single task, and measure it.
+
+    :rtype tuple: The task result, and its `Instrumentation` record.
+    """
+    instrument = instrumentation.Instrumentation()
+    with instrument.measure(task[0]) as record:
+        result = _run_task(task)
+    return result, record
+
+
+def generate_all_techniques_parallel(words, workers=None, chunk_size=100,
+                                     names=None, instrument=None):
+    """Generate all techniques using a pool of worker processes.
+
+    :param words (list): The seed words.
+    :param workers (int, optional): The number of worker processes.
+        Defaults to the number of CPUs. With a single worker,
+        everything runs in the current process.
+    :param chunk_size (int, optional): The number of seed words per task.
+    :param names (list, optional): The technique result keys to run.
+        Defaults to all of them.
+    :param instrument (Instrumentation, optional): If given, records the
+        time taken and the number of candidates for each technique.
+        Times are summed over all of the technique's tasks, across
+        workers, and the peak memory is the largest of any one task.
+    :rtype dict: The same result as `techniques.generate_all_techniques`.
+    """
+    tasks = _plan_tasks(words, names=names, chunk_size=chunk_size)
+    run = _run_task if instrument is None else _run_measured_task
+    if workers == 1:
+        results = [run(task) for task in tasks]
+    else:
+        pool = Pool(processes=workers)
+        try:
+            results = pool.map(run, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    data = {'words': dict(
+        (name, []) for name, _, _ in techniques._all_techniques
+        if names is None or name in names)}
+    for task, result in zip(tasks, results):
+        name = task[0]
+        if instrument is not None:
+            result, record = result
+            instrument.merge(name, record, input_size=len(words))
+        if isinstance(result, basestring):
+            data['words'][name] = result
+        else:
+            data['words'][name].extend(result)
+    if instrument is None:
+        return techniques.super_scrub(data)
+    raw_counts = dict((name, techniques._count(results))
+                      for name, results in data['words'].items())
+    data = techniques.super_scrub(data)
+    for name, _, _ in techniques._all_techniques:
+        if name in data['words']:
+            instrument.finish(name, raw_count=raw_counts[name],
+                              scrubbed_count=len(data['words'][name]))
+    return data
@@ -1,11 +1,112 @@
-"""Provides various scoring methods for word strength."""
+"""Provides various scoring methods for word strength.
 
+Fuzzy (and NumPy) are only imported by the functions that use them,
+so importing this module stays cheap.
+"""
+
+from __future__ import absolute_import
+
+import heapq
 import re
 
-import fuzzy
+from . import settings as namebot_settings
+from .cache import LRUCache
+
+# Phonetic encoders from fuzzy, created on first use.
+_encoders = {}
+
+# Phonetic codes shared by the scorers and the strainer filters,
+# keyed by (algorithm, word).
+_phonetic_cache = LRUCache(maxsize=namebot_settings.PHONETIC_CACHE_SIZE)
+
+
+def _encoder(name):
+    """Get a phonetic encoder (`dmetaphone`, `soundex` or `nysiis`)."""
+    if not _encoders:
+        import fuzzy
+        _encoders.update({
+            'dmetaphone': fuzzy.DMetaphone(),
+            'soundex': fuzzy.Soundex(4),
+            'nysiis': fuzzy.nysiis,
+        })
+    return _encoders[name]
+
+
+class _LazyEncoder(object):
+    """Stands in for a fuzzy encoder, which is created on first use."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self, word):
+        return _encoder(self.name)(word)
+
+    def __getattr__(self, attr):
+        return getattr(_encoder(self.name), attr)
+
+
+# The fuzzy encoders, kept for backwards compatibility.
+# Use the cached `get_dmetaphone` and `get_soundex` instead.
+dmeta = _LazyEncoder('dmetaphone')
+soundex = _LazyEncoder('soundex')
+
+
+def _dmetaphone(word):
+    return tuple(_encoder('dmetaphone')(word))
+
+
+def get_dmetaphone(word):
+    """Get the (cached) double metaphone codes for a word.
+
+    :param word (str): the word.
+    :rtype codes (tuple): the primary and secondary codes,
+        where the secondary code may be None.
+    """
+    return _phonetic_cache.get(('dmetaphone', word), _dmetaphone, word)
+
+
+def _soundex(word):
+    # fuzzy's Soundex upper-cases its argument in place,
+    # so only ever give it a copy.
+    return _encoder('soundex')(word.upper())
+
+
+def get_soundex(word):
+    """Get the (cached) soundex code for a word.
+
+    :param word (str): the word.
+    :rtype code (str): the soundex code.
+    """
+    return _phonetic_cache.get(('soundex', word), _soundex, word)
+
+
+def _nysiis(word):
+    return _encoder('nysiis')(word)
+
+
+def get_nysiis(word):
+    """Get the (cached) nysiis code for a word.
+
+    :param word (str): the word.
+    :rtype code (str): the nysiis code.
+    """
+    return _phonetic_cache.get(('nysiis', word), _nysiis, word)
+
+
+def phonetic_cache_info():
+    """Return the hit/miss statistics for the phonetic code cache.
+
+    :rtype info (dict): the cache statistics.
+    """
+    return _phonetic_cache.info()
 
-dmeta = fuzzy.DMetaphone()
-soundex = fuzzy.Soundex(4)
+
+def set_phonetic_cache_size(maxsize):
+    """Set the maximum number of cached phonetic codes.
+
+    :param maxsize (int): the maximum size, or None for unbounded.
+    """
+    _phonetic_cache.resize(maxsize)
 
 
 def score_dmetaphone(words):
@@ -16,7 +117,7 @@ def score_dmetaphone(words):
     """
     scores = []
     for word in words:
-        res, output = dmeta(word)
+        res, output = get_dmetaphone(word)
         scores.append('{0}:{1}:{2}'.format(word, res, output))
     return scores
 
@@ -27,7 +128,7 @@ def score_soundex(words):
     :param words (list): the list of words.
     :rtype scores (list): the scored words
     """
-    return ['{}: {}'.format(w.lower(), soundex(w)) for w in words]
+    return ['{}: {}'.format(w.lower(), get_soundex(w)) for w in words]
 
 
 def score_nysiis(words):
@@ -36,7 +137,7 @@ def score_nysiis(words):
     :param words (list): the list of words.
     :rtype scores (list): the scored words
     """
-    return ['{}: {}'.format(w.lower(), fuzzy.nysiis(w)) for w in words]
+    return ['{}: {}'.format(w.lower(), get_nysiis(w)) for w in words]
 
 
 def score_length(word):
@@ -91,6 +192,9 @@ def score_pronounceability(word):
     0.0   0.1   0.2   0.3   0.4   0.5   0.6   0.7   0.8   0.9   1.0
     0      1     2     3     4     5     4     3     2     1      5
 
+    Words without vowels or without consonants (including words with
+    no letters or digits at all, e.g. `&`) score 0.
+
     :param word (string): The name
     :rtype (int): The final pronounceability score
     """
@@ -101,7 +205,7 @@ def score_pronounceability(word):
     re_cons = re.compile(r'[^a|e|i|o|u]')
     vowels = float(len(re.findall(re_vowels, word)))
     consonants = float(len(re.findall(re_cons, word)))
-    if vowels is 0.0 or consonants is 0.0:
+    if not vowels or not consonants:
         return 0
     if vowels < consonants:
         ratio = vowels / consonants
@@ -182,6 +286,167 @@ def score_names_overall(words):
     return [(score_name_overall(w), w) for w in words]
 
 
+def _encode_words(words):
+    """Encode words into a fixed-width array of character codes.
+
+    Non-ascii characters are all mapped to 128, since the scorers only
+    care about ascii letters and digits.
+
+    :param words (list): the list of words.
+    :rtype tuple: The (words x width) uint8 code array, and the word lengths.
+    """
+    import numpy as np
+
+    chars = np.array(words)
+    lengths = np.char.str_len(chars)
+    if chars.dtype.kind == 'S':
+        codes = chars.view(np.uint8)
+    else:
+        codes = np.minimum(chars.view(np.uint32), 128).astype(np.uint8)
+    return codes.reshape(len(words), -1), lengths
+
+
+def _score_chunk(words):
+    """Score a chunk of words, see `score_names_overall_batch`."""
+    import numpy as np
+
+    codes, lengths = _encode_words(words)
+    empty = lengths == 0
+
+    lower = ((codes >= ord('a')) & (codes <= ord('z'))).sum(axis=1)
+    upper = ((codes >= ord('A')) & (codes <= ord('Z'))).sum(axis=1)
+    digits = ((codes >= ord('0')) & (codes <= ord('9'))).sum(axis=1)
+    vowels = np.in1d(
+        codes, np.array(bytearray(b'aeiou'), dtype=np.uint8)).reshape(
+            codes.shape).sum(axis=1)
+    consonants = lower + upper + digits - vowels
+
+    length = np.select(
+        [empty, lengths > 20, lengths > 15, lengths <= 4, lengths >= 10],
+        [0, 1, 2, 3, 4], default=5)
+
+    # Words without vowels or consonants get a ratio of zero.
+    ratio = (np.minimum(vowels, consonants).astype(float) /
+             np.maximum(np.maximum(vowels, consonants), 1))
+
+    def _bounds(lower_a, upper_a, lower_b, upper_b):
+        return (((ratio >= lower_a) & (ratio <= upper_a)) |
+                ((ratio >= lower_b) & (ratio <= upper_b)))
+    pronounceability = np.select(
+        [empty, ratio == 0.0, ratio == 1.0,
+         _bounds(0.0, 0.1, 0.9, 1.0), _bounds(0.1, 0.2, 0.8, 0.9),
+         _bounds(0.2, 0.3, 0.7, 0.8), _bounds(0.3, 0.4, 0.6, 0.7),
+         _bounds(0.4, 0.5, 0.5, 0.6)],
+        [0, 0, 5, 1, 2, 3, 4, 5], default=0)
+
+    word_count = lengths - lower + 1
+    simplicity = np.select(
+        [empty, word_count == 1, word_count < 3, word_count < 4,
+         word_count < 5],
+        [0, 5, 4, 3, 2], default=1)
+
+    scores = np.round((length + pronounceability + simplicity) * 10.0)
+    return np.minimum(scores, 100)
+
+
+def score_names_overall_batch(words, chunk_size=100000):
+    """Score all names at once, using array operations.
+
+    This gives the same scores as `score_name_overall`, but is much faster
+    for large lists of names.
+
+    :param words (list): the list of words.
+    :param chunk_size (int, optional): the number of words encoded at a time.
+        Each chunk is padded to its longest word.
+    :rtype scores (numpy.ndarray): the scores, in the same order as words.
+    """
+    import numpy as np
+
+    words = [word or '' for word in words]
+    if not words:
+        return np.zeros(0)
+    return np.concatenate([
+        _score_chunk(words[start:start + chunk_size])
+        for start in range(0, len(words), chunk_size)])
+
+
+class TopKRanker(object):
+    """Keep the K best scoring names from a stream of names.
+
+    Only K names are held at any time, so any number of names can be
+    ranked in O(K) memory. Names with equal scores are ranked in the
+    order they were added.
+    """
+
+    def __init__(self, k, scorer=None):
+        """Create the ranker.
+
+        :param k (int): the number of names to keep.
+        :param scorer (function, optional): scores a name, higher is better.
+            Defaults to `score_name_overall`.
+        """
+        if k < 0:
+            raise ValueError('k must not be negative')
+        self.k = k
+        self.scorer = scorer or score_name_overall
+        self.count = 0
+        # A min-heap of (score, -index, item), so the worst name
+        # (or, for equal scores, the latest one) is always first.
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, word, item=None):
+        """Score a name, keeping it if it is among the K best so far.
+
+        :param word (str): the name.
+        :param item (optional): the value to keep for the name,
+            e.g. a `(technique, word)` pair. Defaults to the name.
+        :rtype score: the name's score.
+        """
+        score = self.scorer(word)
+        entry = (score, -self.count, word if item is None else item)
+        self.count += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self.k and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+        return score
+
+    def update(self, words):
+        """Add all names from an iterable.
+
+        :param words (iterable): the names.
+        """
+        for word in words:
+            self.add(word)
+
+    def results(self):
+        """Get the best names so far.
+
+        :rtype list: (score, name) tuples, best first.
+        """
+        return [(score, item) for score, _, item in
+                sorted(self._heap, key=lambda entry: entry[:2],
+                       reverse=True)]
+
+
+def top_k_names(words, k=10, scorer=None):
+    """Get the K best scoring names, scoring them one at a time.
+
+    :param words (iterable): the names, e.g. a generator.
+    :param k (int, optional): the number of names to return.
+    :param scorer (function, optional): scores a name, higher is better.
+        Defaults to `score_name_overall`.
+    :rtype list: (score, name) tuples, best first. Names with equal
+        scores keep their input order.
+    """
+    ranker = TopKRanker(k, scorer=scorer)
+    ranker.update(words)
+    return ranker.results()
+
+
 def generate_all_scoring(words):
     """Return all scoring methods for a set of words.
 
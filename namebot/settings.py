@@ -7,6 +7,11 @@ MIN_LENGTH = 4
 SPACED_MAX_LENGTH = 22
 VOWELS = list('aeiou')
 CONSONANTS = list('qwrtypsdfghjklzxcvbnm')
+# Multi-letter consonant onsets, for alliterations (see techniques.py)
+ONSETS = ['chr', 'sch', 'scr', 'shr', 'spl', 'spr', 'squ', 'str', 'thr',
+          'bl', 'br', 'ch', 'cl', 'cr', 'dr', 'fl', 'fr', 'gl', 'gr', 'kn',
+          'ph', 'pl', 'pr', 'qu', 'sc', 'sh', 'sk', 'sl', 'sm', 'sn', 'sp',
+          'st', 'sw', 'th', 'tr', 'tw', 'wh', 'wr']
 # Two-letter vowel+consonant prefixes
 VC_TL_PREFIXES = ['ac', 'ad', 'af', 'ag', 'al', 'ap', 'as', 'at', 'an', 'ab',
                   'ag', 'ig', 'am', 'ap', 'be', 'bi', 'co', 'de', 'di', 'dy',
@@ -28,6 +33,12 @@ SUFFIXES = ['age', 'able', 'ible', 'acy', 'cy', 'ade', 'al', 'ial', 'ical',
             'less', 'ly', 'ment', 'ness', 'or', 'ory', 'ous', 'eous', 'ose',
             'ious', 'ship', 'ster', 'ure', 'ward', 'wise', 'y']
 ALPHABET = list('abcdefghijklmnopqrstuvwxyz')
+# Maximum number of cached phonetic codes (see scoring.py)
+PHONETIC_CACHE_SIZE = 100000
+# Maximum number of cached word stems (see normalization.py)
+STEM_CACHE_SIZE = 100000
+# Maximum number of cached part-of-speech tags (see metrics.py)
+POS_TAG_CACHE_SIZE = 100000
 regexes = {
     'no_vowels': re.compile(r'^/a|e|i|o|u', re.IGNORECASE),
     'all_vowels': re.compile(r'a|e|i|o|u', re.IGNORECASE),
@@ -1,23 +1,31 @@
 """Provides filtering functions for reducing large sets of generated words.
 
-Recommended usage: filtered results using a list comprehension
-of all filters 'anded' together.
+Recommended usage: a `Strainer` built from a list of filter specs,
+which applies all filters 'anded' together in a single pass.
 e.g:
 
->>> filtered = [word for word in words if
-            filter_length(word, max_length=7) and
-            filter_startswith(word, beginning='c') and
-            filter_startswith(word, beginning='c') and
-            filter_endswith(word, ending='e') ...]
+>>> strainer = Strainer([
+        ('length', {'max_length': 7}),
+        ('startswith', {'beginning': 'c'}),
+        ('endswith', {'ending': 'e'}) ...])
+>>> filtered = list(strainer.strain(words))
+
+Each filter function can also be used on its own, e.g. in a list
+comprehension of all filters 'anded' together.
 """
 
 from __future__ import absolute_import
 
+import inspect
 import re
+from collections import OrderedDict
 
 from . import scoring
 from . import settings as namebot_settings
 
+_vowels_re = re.compile(r'[aeiouy]')
+_consonants_re = re.compile(r'[^aeyiuo]')
+
 
 def filter_vowel_cons_ratio(word, ratio=0.5):
     """Return True if the ratio of vowels to consonants is > `ratio`.
@@ -28,12 +36,14 @@ def filter_vowel_cons_ratio(word, ratio=0.5):
     :param ratio (float, optional): The ratio
     :rtype: int
     """
-    vowels = re.compile(r'[aeiouy]')
-    consonants = re.compile(r'[^aeyiuo]')
-    vmatch = re.findall(vowels, word.lower())
-    cmatch = re.findall(consonants, word.lower())
-    _ratio = float(len(vmatch)) / float(len(cmatch))
-    return _ratio > ratio
+    return _vowel_cons_ratio(word.lower()) > ratio
+
+
+def _vowel_cons_ratio(word):
+    """Return the ratio of vowels to consonants for a lowercase word."""
+    vmatch = _vowels_re.findall(word)
+    cmatch = _consonants_re.findall(word)
+    return float(len(vmatch)) / float(len(cmatch))
 
 
 def filter_length(word,
@@ -92,11 +102,10 @@ def filter_dmetaphone(word, code=None):
 
     :rtype bool: The resulting check.
     """
-    score = scoring.score_dmetaphone([word])[0]
-    _, pronunciation, dmcode = score.split(':')
     if code is None:
         return True
-    return pronunciation.lower() == code.lower()
+    pronunciation, _ = scoring.get_dmetaphone(word)
+    return '{}'.format(pronunciation).lower() == code.lower()
 
 
 def filter_soundex(word, code=None):
@@ -109,8 +118,7 @@ def filter_soundex(word, code=None):
     """
     if code is None:
         return True
-    retcode = scoring.score_soundex([word])[0].split(':')[1].strip().lower()
-    return retcode == code.lower()
+    return scoring.get_soundex(word).lower() == code.lower()
 
 
 def filter_nysiis(word, code=None):
@@ -122,8 +130,7 @@ def filter_nysiis(word, code=None):
     """
     if code is None:
         return True
-    retcode = scoring.score_nysiis([word])[0].split(':')[1].strip().lower()
-    return retcode == code.lower()
+    return scoring.get_nysiis(word).lower() == code.lower()
 
 
 def filter_consonant_ending(word):
@@ -144,3 +151,158 @@ def filter_vowel_ending(word):
     """
     vowels = namebot_settings.regexes['vowel_ending']
     return re.match(vowels, word[-1]) is not None
+
+
+def _compile_length(name, kwargs):
+    min_length = kwargs.get('min_length', namebot_settings.MIN_LENGTH)
+    max_length = kwargs.get('max_length', namebot_settings.MAX_LENGTH)
+    return lambda word, lower: min_length <= len(word) <= max_length
+
+
+def _compile_affix(name, kwargs):
+    """Compile the startswith, endswith and tld filters."""
+    if name == 'startswith':
+        affix = kwargs.get('beginning')
+        return lambda word, lower: lower.startswith(affix)
+    if name == 'endswith':
+        affix = kwargs.get('ending')
+    else:
+        affix = kwargs.get('tld', '.com')
+        if affix.startswith('.'):
+            affix = affix.replace('.', '')
+    return lambda word, lower: lower.endswith(affix)
+
+
+def _compile_vowel_cons_ratio(name, kwargs):
+    ratio = kwargs.get('ratio', 0.5)
+    return lambda word, lower: _vowel_cons_ratio(lower) > ratio
+
+
+def _compile_ending(name, kwargs):
+    func = globals()['filter_{}'.format(name)]
+    return lambda word, lower: func(word)
+
+
+def _compile_phonetic(name, kwargs):
+    """Compile the dmetaphone, soundex and nysiis filters."""
+    code = kwargs.get('code')
+    if code is None:
+        return lambda word, lower: True
+    code = code.lower()
+    if name == 'dmetaphone':
+        return lambda word, lower: '{}'.format(
+            scoring.get_dmetaphone(word)[0]).lower() == code
+    get_code = getattr(scoring, 'get_{}'.format(name))
+    return lambda word, lower: get_code(word).lower() == code
+
+
+# The function compiling each filter, called with its name and kwargs.
+_compilers = {
+    'length': _compile_length,
+    'startswith': _compile_affix,
+    'endswith': _compile_affix,
+    'tld': _compile_affix,
+    'vowel_cons_ratio': _compile_vowel_cons_ratio,
+    'consonant_ending': _compile_ending,
+    'vowel_ending': _compile_ending,
+    'dmetaphone': _compile_phonetic,
+    'soundex': _compile_phonetic,
+    'nysiis': _compile_phonetic,
+}
+
+
+def _compile_filter(name, kwargs):
+    """Compile a single filter spec into a predicate.
+
+    Predicates take the word and its lowercase form,
+    so each word only needs to be lowered once.
+
+    :param name (str): The filter name, e.g. `length` for `filter_length`.
+    :param kwargs (dict): The keyword arguments for the filter.
+    :rtype function: The predicate.
+    """
+    if name not in _compilers:
+        raise ValueError('Unknown filter: {}'.format(name))
+    args = inspect.getargspec(globals()['filter_{}'.format(name)]).args[1:]
+    unknown = sorted(set(kwargs) - set(args))
+    if unknown:
+        raise ValueError('Unknown argument(s) for filter {}: {}'.format(
+            name, ', '.join(unknown)))
+    return _compilers[name](name, kwargs)
+
+
+def _label(name, kwargs):
+    """Name a filter spec by its filter and arguments,
+    e.g. `length(max_length=7)`.
+    """
+    if not kwargs:
+        return name
+    return '{}({})'.format(name, ', '.join(
+        '{}={!r}'.format(key, value) for key, value in sorted(kwargs.items())))
+
+
+class Strainer(object):
+    """A compiled pipeline of filters, applied in a single pass.
+
+    Filters are given as a list of specs, each either a filter name or a
+    `(name, kwargs)` tuple, where the name matches a `filter_*` function
+    and kwargs are its keyword arguments. Filters are compiled once, run
+    cheapest first, and stop at the first rejection. The number of words
+    rejected by each filter is kept in `rejections`, keyed by the filter
+    name and its arguments, e.g. `length(max_length=7)` (or just the name
+    for a filter without arguments).
+    """
+
+    # Relative cost of each filter; cheaper filters run first.
+    costs = {
+        'length': 0,
+        'startswith': 1,
+        'endswith': 1,
+        'tld': 1,
+        'consonant_ending': 2,
+        'vowel_ending': 2,
+        'vowel_cons_ratio': 3,
+        'soundex': 4,
+        'nysiis': 4,
+        'dmetaphone': 5,
+    }
+
+    def __init__(self, specs):
+        """Compile the filter specs.
+
+        :param specs (list): The filter specs.
+        """
+        specs = [(spec, {}) if isinstance(spec, basestring) else spec
+                 for spec in specs]
+        specs = sorted(specs, key=lambda spec: self.costs.get(spec[0], 0))
+        self.filters = [(name, _compile_filter(name, kwargs))
+                        for name, kwargs in specs]
+        self._checks = [(_label(name, kwargs), predicate)
+                        for (name, kwargs), (_, predicate)
+                        in zip(specs, self.filters)]
+        self.rejections = OrderedDict(
+            (label, 0) for label, _ in self._checks)
+
+    def check(self, word):
+        """Check a single word against all filters.
+
+        :param word (str): The word.
+        :rtype bool: Whether the word passed every filter.
+        """
+        lower = word.lower()
+        for label, predicate in self._checks:
+            if not predicate(word, lower):
+                self.rejections[label] += 1
+                return False
+        return True
+
+    def strain(self, words):
+        """Lazily filter words.
+
+        :param words (iterable): The words to filter.
+        :rtype generator: The words that passed every filter.
+        """
+        check = self.check
+        for word in words:
+            if check(word):
+                yield word
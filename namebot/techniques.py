@@ -3,13 +3,13 @@
 from __future__ import absolute_import
 from __future__ import division
 
+import heapq
 import re
 from collections import defaultdict
+from itertools import islice
 from random import choice
 from string import ascii_uppercase
 
-import nltk
-
 from . import nlp
 from . import normalization
 from . import settings as namebot_settings
@@ -171,6 +171,80 @@ def reduplication_ablaut(words, count=1, random=True, vowel='e'):
     return new_words
 
 
+def _classify_letter(letter):
+    """Classify the first letter of a word for the affix tables.
+
+    :param letter (str): The first letter of a word.
+    :rtype tuple: Whether the letter matches the `no_vowels`,
+        starting vowel and `all_vowels` patterns.
+    """
+    return (bool(re.search(_regexes['no_vowels'], letter)),
+            bool(re.search(r'^a|e|i|o|u', letter)),
+            bool(re.search(_regexes['all_vowels'], letter)))
+
+
+def _first_letter_class(letter):
+    """Classify a first letter, see `_classify_letter`.
+
+    ASCII characters are looked up in `_letter_classes`, computed once
+    at import time, and any others are classified on the fly.
+    """
+    try:
+        return _letter_classes[letter]
+    except KeyError:
+        return _classify_letter(letter)
+
+
+def _build_prefix_table(prefixes):
+    """Map each first letter class to the compatible prefixes, in order.
+
+    :param prefixes (list): The prefixes to use.
+    :rtype dict: The prefixes, keyed by (`no_vowels`, starting vowel) flags.
+    """
+    table = {}
+    for no_vowel in (True, False):
+        for vowel_start in (True, False):
+            table[no_vowel, vowel_start] = [
+                prefix for prefix in prefixes
+                # The word or prefix must pass the `no_vowels` check, and
+                # there has to be a vowel at the end of the prefix or
+                # at the beginning of the word.
+                if (no_vowel or re.search(_regexes['no_vowels'], prefix[0]))
+                and (vowel_start or re.search(r'a|e|i|o|u', prefix[-1:]))]
+    return table
+
+
+def _build_suffix_table(suffixes):
+    """Map each first letter class to the compatible suffixes, in order.
+
+    Since `ify` depends on the word ending, each list of suffixes is split
+    into the runs between `ify` occurrences.
+
+    :param suffixes (list): The suffixes to use.
+    :rtype dict: Lists of suffix runs, keyed by the `all_vowels` flag.
+    """
+    table = {}
+    for vowel_start in (True, False):
+        runs = [[]]
+        for suffix in suffixes:
+            if not vowel_start and not re.search(
+                    _regexes['all_vowels'], suffix[0]):
+                continue
+            if suffix == 'ify':
+                runs.append([])
+            else:
+                runs[-1].append(suffix)
+        table[vowel_start] = runs
+    return table
+
+
+_prefix_table = _build_prefix_table(_prefixes)
+_suffix_table = _build_suffix_table(_suffixes)
+# The class of every ASCII character, see `_first_letter_class`.
+_letter_classes = dict(
+    (chr(i), _classify_letter(chr(i))) for i in range(128))
+
+
 def prefixify(words):
     """Apply a prefix technique to a set of words.
 
@@ -181,19 +255,21 @@ def prefixify(words):
     for word in words:
         if not word:
             continue
-        for prefix in _prefixes:
-            first_prefix_no_vowel = re.search(
-                _regexes['no_vowels'], word[0])
-            second_prefix_no_vowel = re.search(
-                _regexes['no_vowels'], prefix[0])
-            if first_prefix_no_vowel or second_prefix_no_vowel:
-                # if there's a vowel at the end of
-                # prefix but not at the beginning
-                # of the word (or vice versa)
-                vowel_beginning = re.search(r'a|e|i|o|u', prefix[-1:])
-                vowel_end = re.search(r'^a|e|i|o|u', word[:1])
-                if vowel_beginning or vowel_end:
-                    new_arr.append('{}{}'.format(prefix, word))
+        no_vowel, vowel_start, _ = _first_letter_class(word[0])
+        new_arr.extend([prefix + word for prefix
+                        in _prefix_table[no_vowel, vowel_start]])
+    return new_arr
+
+
+def _ify(word):
+    """Apply the `ify` suffix, adding a variant with the `e` ending dropped."""
+    new_arr = []
+    if word[-1] == 'e':
+        if word[-2] != 'i':
+            new_arr.append('{}{}'.format(word[:-2], 'ify'))
+        else:
+            new_arr.append('{}{}'.format(word[:-1], 'ify'))
+    new_arr.append(word + 'ify')
     return new_arr
 
 
@@ -207,19 +283,11 @@ def suffixify(words):
     for word in words:
         if not word:
             continue
-        for suffix in _suffixes:
-            prefix_start_vowel = re.search(_regexes['all_vowels'], word[0])
-            suffix_start_vowel = re.search(_regexes['all_vowels'], suffix[0])
-            if prefix_start_vowel or suffix_start_vowel:
-                if suffix is 'ify':
-                    if word[-1] is 'e':
-                        if word[-2] is not 'i':
-                            new_arr.append('{}{}'.format(word[:-2], suffix))
-                        else:
-                            new_arr.append('{}{}'.format(word[:-1], suffix))
-                    new_arr.append(word + suffix)
-                else:
-                    new_arr.append(word + suffix)
+        _, _, vowel_start = _first_letter_class(word[0])
+        for k, run in enumerate(_suffix_table[vowel_start]):
+            if k > 0:
+                new_arr.extend(_ify(word))
+            new_arr.extend([word + suffix for suffix in run])
     return new_arr
 
 
@@ -388,7 +456,8 @@ def make_founder_product_name(founder1, founder2, product):
         product)
 
 
-def make_name_alliteration(words, divider=' '):
+def make_name_alliteration(words, divider=' ', onsets=False,
+                           max_per_bucket=None):
     """Make an alliteration with a set of words, if applicable.
 
     Examples:
@@ -400,15 +469,75 @@ def make_name_alliteration(words, divider=' '):
     1. Loop through a given array of words
     2. group by words with the same first letter
     3. combine them and return to new array
+
+    :param words (list): The words.
+    :param divider (str, optional): The string between the two words.
+    :param onsets (bool, optional): Group words by their longest
+        multi-letter onset from `settings.ONSETS` (e.g. `str` or `ch`),
+        instead of by their first letter.
+    :param max_per_bucket (int, optional): The maximum number of
+        alliterations made from each group of words.
+    :rtype list: The alliterations.
+    """
+    return list(iter_name_alliterations(
+        words, divider=divider, onsets=onsets, max_per_bucket=max_per_bucket))
+
+
+def iter_name_alliterations(words, divider=' ', onsets=False,
+                            max_per_bucket=None):
+    """Lazily make alliterations, see `make_name_alliteration`.
+
+    :rtype generator: The alliterations.
+    """
+    return _iter_alliterations(words, divider=divider, onsets=onsets,
+                               max_per_bucket=max_per_bucket)
+
+
+# Onsets by decreasing length, so the longest one matches first.
+_onsets = sorted(set(namebot_settings.ONSETS), key=len, reverse=True)
+
+
+def _onset(word):
+    """Get the longest known onset of a word, or its first letter."""
+    for onset in _onsets:
+        if word.startswith(onset):
+            return onset
+    return word[:1]
+
+
+def _iter_alliterations(words, start=0, stop=None, divider=' ',
+                        onsets=False, max_per_bucket=None):
+    """Make alliterations for a slice of the (sorted) first words only.
+
+    Words are indexed by first letter (or onset) once, so each word is
+    only combined with the words in its own bucket.
     """
-    new_arr = []
     words = sorted(words)
+    key = _onset if onsets else lambda word: word[:1]
+    buckets = defaultdict(list)
+    for word in words:
+        buckets[key(word)].append(word)
+    counts = defaultdict(int)
+    for word1 in words[start:stop]:
+        bucket = key(word1)
+        for word2 in buckets[bucket]:
+            if word1 is word2:
+                continue
+            if max_per_bucket is not None:
+                if counts[bucket] >= max_per_bucket:
+                    break
+                counts[bucket] += 1
+            yield word1 + divider + word2
 
-    for word1 in words:
-        for word2 in words:
-            if word1[:1] is word2[:1] and word1 is not word2:
-                new_arr.append(word1 + divider + word2)
-    return new_arr
+
+def _alliteration_rows(words, start=0, stop=None, divider=' '):
+    """Make alliterations for a slice of the (sorted) first words only.
+
+    The second words are always taken from the full list, so slices can be
+    computed independently and concatenated in order.
+    """
+    return list(_iter_alliterations(
+        words, start=start, stop=stop, divider=divider))
 
 
 def make_name_abbreviation(words):
@@ -435,40 +564,57 @@ def make_vowel(words, vowel_type, vowel_index):
 
     The higher number is ordered first, and the two words are then fused
     together by the single matching vowel.
+
+    The words are indexed by vowel position once up front, so only pairs
+    that can actually be ordered this way are compared.
     """
-    new_arr = []
-    for i in words:
-        for j in words:
-            is_match_i = re.search(vowel_type, i)
-            is_match_j = re.search(vowel_type, j)
-            if i is not j and is_match_i and is_match_j:
-                # get the indices and lengths to use in finding the ratio
-                pos_i = i.index(vowel_index)
-                len_i = len(i)
-                pos_j = j.index(vowel_index)
-                len_j = len(j)
-
-                # If starting index is 0,
-                # add 1 to it so we're not dividing by zero
-                if pos_i is 0:
-                    pos_i = 1
-                if pos_j is 0:
-                    pos_j = 1
-
-                # Decide which word should be the
-                # prefix and which should be suffix
-                if round(pos_i / len_i) > round(pos_j / len_j):
-                    p = i[0: pos_i + 1]
-                    p2 = j[pos_j: len(j)]
-                    if len(p) + len(p2) > 2:
-                        if re.search(
-                            _regexes['all_vowels'], p) or re.search(
-                                _regexes['all_vowels'], p2):
-                                    if p[-1] is p2[0]:
-                                        new_arr.append(p[:-1] + p2)
-                                    else:
-                                        new_arr.append(p + p2)
-    return new_arr
+    return list(_iter_vowel(words, vowel_type, vowel_index))
+
+
+def _iter_vowel(words, vowel_type, vowel_index):
+    """Lazily make the portmanteaus of `make_vowel`, one at a time."""
+    prefixes, suffixes = _vowel_position_index(words, vowel_type, vowel_index)
+    # Only words with the vowel in their second half can come first,
+    # paired with words that have it in their first half.
+    for i, p, p_vowels in prefixes:
+        for j, p2, p2_vowels in suffixes:
+            if i is not j and len(p) + len(p2) > 2:
+                if p_vowels or p2_vowels:
+                    if p[-1] == p2[0]:
+                        yield p[:-1] + p2
+                    else:
+                        yield p + p2
+
+
+def _vowel_position_index(words, vowel_type, vowel_index):
+    """Index the words containing a vowel by where the vowel first occurs.
+
+    :param words (list): The list of words.
+    :param vowel_type (regex): The vowel pattern a word must match.
+    :param vowel_index (str): The vowel to find the position of.
+    :rtype tuple: Two lists of `(word, fragment, has_vowels)` entries,
+        in word order. The first holds words whose vowel position ratio
+        rounds up, with the fragment up to and including the vowel.
+        The second holds the rest, with the fragment from the vowel on.
+    """
+    prefixes, suffixes = [], []
+    for word in words:
+        if not re.search(vowel_type, word):
+            continue
+        pos = word.index(vowel_index)
+        # If starting index is 0,
+        # add 1 to it so we're not dividing by zero
+        if pos == 0:
+            pos = 1
+        if round(pos / len(word)) > 0:
+            fragment = word[0: pos + 1]
+            prefixes.append((word, fragment, bool(
+                re.search(_regexes['all_vowels'], fragment))))
+        else:
+            fragment = word[pos: len(word)]
+            suffixes.append((word, fragment, bool(
+                re.search(_regexes['all_vowels'], fragment))))
+    return prefixes, suffixes
 
 
 def make_portmanteau_default_vowel(words):
@@ -482,19 +628,18 @@ def make_portmanteau_default_vowel(words):
     magic, but is a helper in that it provides all types of vowel
     combinations in one function.
     """
-    new_arr = []
-    vowel_a_re = re.compile(r'a{1}')
-    vowel_e_re = re.compile(r'e{1}')
-    vowel_i_re = re.compile(r'i{1}')
-    vowel_o_re = re.compile(r'o{1}')
-    vowel_u_re = re.compile(r'u{1}')
-
-    new_arr += make_vowel(words, vowel_a_re, 'a')
-    new_arr += make_vowel(words, vowel_e_re, 'e')
-    new_arr += make_vowel(words, vowel_i_re, 'i')
-    new_arr += make_vowel(words, vowel_o_re, 'o')
-    new_arr += make_vowel(words, vowel_u_re, 'u')
-    return new_arr
+    return list(_iter_portmanteau_default_vowel(words))
+
+
+_default_vowels = tuple(
+    (re.compile(r'{}{{1}}'.format(vowel)), vowel) for vowel in 'aeiou')
+
+
+def _iter_portmanteau_default_vowel(words):
+    """Lazily make the portmanteaus of `make_portmanteau_default_vowel`."""
+    for vowel_type, vowel_index in _default_vowels:
+        for word in _iter_vowel(words, vowel_type, vowel_index):
+            yield word
 
 
 def make_portmanteau_split(words):
@@ -507,27 +652,39 @@ def make_portmanteau_split(words):
     then last V+C in the first word,
     then all C in the second word.
     """
-    new_arr = []
-    for i in words:
+    return _portmanteau_split_rows(words)
+
+
+def _portmanteau_split_rows(words, start=0, stop=None):
+    """Make split portmanteaus for a slice of the first words only.
+
+    The second words are always taken from the full list, so slices can be
+    computed independently and concatenated in order.
+    """
+    return list(_iter_portmanteau_split(words, start=start, stop=stop))
+
+
+def _iter_portmanteau_split(words, start=0, stop=None):
+    """Lazily make the split portmanteaus of a slice of the first words."""
+    for i in words[start:stop]:
         for j in words:
-                if i is not j:
-                    l1 = re.search(r'[^a|e|i|o|u{1}]+[a|e|i|o|u{1}]', i)
-                    l2 = re.search(r'[a|e|i|o|u{1}]+[^a|e|i|o|u{1}]$', j)
-                    if i and l1 and l2:
-                        # Third letter used for
-                        # consonant middle splits only
-                        l3 = re.split(r'[a|e|i|o|u{1}]', i)
-                        l1 = l1.group(0)
-                        l2 = l2.group(0)
-                        if l3 and len(l3) > 0:
-                            for v in l3:
-                                new_arr.append(l1 + v + l2)
-                            else:
-                                new_arr.append('{}{}{}'.format(l1, 't', l2))
-                                new_arr.append('{}{}{}'.format(l1, 's', l2))
-                                new_arr.append('{}{}{}'.format(l1, 'z', l2))
-                                new_arr.append('{}{}{}'.format(l1, 'x', l2))
-    return new_arr
+            if i is not j:
+                l1 = re.search(r'[^a|e|i|o|u{1}]+[a|e|i|o|u{1}]', i)
+                l2 = re.search(r'[a|e|i|o|u{1}]+[^a|e|i|o|u{1}]$', j)
+                if i and l1 and l2:
+                    # Third letter used for
+                    # consonant middle splits only
+                    l3 = re.split(r'[a|e|i|o|u{1}]', i)
+                    l1 = l1.group(0)
+                    l2 = l2.group(0)
+                    if l3 and len(l3) > 0:
+                        for v in l3:
+                            yield l1 + v + l2
+                        else:
+                            yield '{}{}{}'.format(l1, 't', l2)
+                            yield '{}{}{}'.format(l1, 's', l2)
+                            yield '{}{}{}'.format(l1, 'z', l2)
+                            yield '{}{}{}'.format(l1, 'x', l2)
 
 
 def make_punctuator(words, replace):
@@ -690,6 +847,8 @@ def get_descriptors(words):
     and provide a dictionary with a list of each type
     for later retrieval and usage.
     """
+    import nltk
+
     descriptors = defaultdict(list)
     tokens = nltk.word_tokenize(' '.join(words))
     parts = nltk.pos_tag(tokens)
@@ -780,23 +939,96 @@ def all_prefix_first_vowel(word, letters=list(ascii_uppercase)):
     return words
 
 
-def recycle(words, func, times=2):
+def recycle(words, func, times=2, store=None):
     """Run a set of words applied to a function repeatedly.
 
     It will re-run with the last output as the new input.
     `words` must be a list, and `func` must return a list.
+    Output can grow quickly with each round; see `recycle_iter`
+    for a bounded version.
 
     :param words (list): The list of words.
     :param func (function): A function to recycle.
                             This function must take a single argument,
                             a list of strings.
     :param times (int, optional): The number of times to call the function.
+    :param store (CandidateStore, optional): If given, words already in
+        the store (from earlier rounds or other techniques) are dropped
+        from each round's output, and new ones are added to it.
+        Each round's output is then a list, even if `func` returns a
+        single string.
     """
-    if times > 0:
-        return recycle(func(words), func, times - 1)
+    if store is None:
+        for _ in range(times):
+            words = func(words)
+        return words
+    for words in recycle_iter(words, func, times=times, unique=False,
+                              store=store):
+        pass
     return words
 
 
+def _unseen(words, seen):
+    for word in words:
+        if word not in seen:
+            seen.add(word)
+            yield word
+
+
+def recycle_iter(words, func, times=2, max_per_round=None, beam_width=None,
+                 scorer=None, unique=True, store=None):
+    """Lazily run a set of words through a function, round by round.
+
+    Each round's output is the next round's input, like `recycle`, but
+    the rounds can be bounded so memory and time stay flat:
+    words from earlier rounds are dropped, at most `max_per_round` words
+    are kept, and the best `beam_width` of them by `scorer` go on to the
+    next round. Generation stops early once a round is empty.
+
+    :param words (list): The seed words.
+    :param func (function): A function taking and returning a list of words.
+    :param times (int, optional): The number of rounds.
+    :param max_per_round (int, optional): The maximum number of words
+        taken from each round's output, in output order.
+    :param beam_width (int, optional): If given, only keep the
+        `beam_width` highest scoring words of each round.
+    :param scorer (function, optional): Scores a word, higher is better.
+        Required with `beam_width`, e.g. `scoring.score_name_overall`.
+    :param unique (bool, optional): Drop words already seen as seeds or
+        in earlier rounds.
+    :param store (CandidateStore, optional): Use (and fill) a shared
+        store to drop seen words, instead of a per-call set.
+    :rtype generator: The list of words kept in each round.
+    """
+    if beam_width is not None and scorer is None:
+        raise ValueError('beam_width requires a scorer')
+    return _recycle_rounds(words, func, times, max_per_round, beam_width,
+                           scorer, unique, store)
+
+
+def _recycle_rounds(words, func, times, max_per_round, beam_width, scorer,
+                    unique, store):
+    technique = getattr(func, '__name__', None)
+    seen = set(words) if unique and store is None else None
+    for _ in range(times):
+        results = func(words)
+        if isinstance(results, basestring):
+            results = [results]
+        if store is not None:
+            results = (word for word in results
+                       if store.add(word, technique))
+        elif seen is not None:
+            results = _unseen(results, seen)
+        if max_per_round is not None:
+            results = islice(results, max_per_round)
+        words = list(results)
+        if beam_width is not None and len(words) > beam_width:
+            words = heapq.nlargest(beam_width, words, key=scorer)
+        yield words
+        if not words:
+            return
+
+
 def backronym(acronym, theme, max_attempts=10):
     """Attempt to generate a backronym based on a given acronym and theme.
 
@@ -861,43 +1093,222 @@ def backronym(acronym, theme, max_attempts=10):
 def super_scrub(data):
     """Run words through a comprehensive list of filtering functions.
 
-    Expects a dictionary with key "words"
+    Expects a dictionary with key "words". Techniques that returned a
+    single string are treated as a single word.
     """
-    for technique in data['words']:
+    pipeline = normalization.NormalizationPipeline(
+        normalization.SCRUB_STAGES)
+    for technique, words in data['words'].items():
+        if isinstance(words, basestring):
+            words = [words]
         data['words'][technique] = normalization.uniquify(
-            normalization.remove_odd_sounding_words(
-                normalization.clean_sort(
-                    data['words'][technique])))
+            list(pipeline.run(words)))
     return data
 
 
-def generate_all_techniques(words):
-    """Generate all techniques across the library in one place."""
-    data = {
-        'words': {
-            'alliterations': make_name_alliteration(words),
-            'alliterations': make_name_alliteration(words),
-            'portmanteau': make_portmanteau_default_vowel(words),
-            'vowels': make_vowelify(words),
-            'suffix': suffixify(words),
-            'prefix': prefixify(words),
-            'duplifix': duplifixify(words),
-            'disfix': disfixify(words),
-            'infix': infixify(words),
-            'simulfix': simulfixify(words),
-            'founder_product_name': make_founder_product_name(
-                'Lindsey', 'Chris', 'Widgets'),
-            'punctuator': make_punctuator_vowels(words),
-            'name_abbreviation': make_name_abbreviation(words),
-            'make_portmanteau_split': make_portmanteau_split(words),
-            'forkerism': forkerism(words),
-            'kniferism': kniferism(words),
-            'spoonerism': spoonerism(words),
-            'palindrome': palindromes(words),
-            'reduplication_ablaut': reduplication_ablaut(words),
-            'misspelling': make_misspelling(words),
-            'descriptors': make_descriptors(
-                get_descriptors(words))
+def super_scrub_iter(candidates, unique=True):
+    """Lazily run `(technique, word)` pairs through the `super_scrub` filters.
+
+    :param candidates (iterable): `(technique, word)` pairs.
+    :param unique (bool, optional): Drop repeated words within a technique.
+        This keeps one set of every word seen per technique, which grows
+        with the output. For flat memory, disable it and de-duplicate
+        through a `CandidateStore(bloom=True)` instead.
+    :rtype generator: The cleaned `(technique, word)` pairs.
+    """
+    seen = defaultdict(set)
+    pipeline = normalization.NormalizationPipeline(
+        normalization.SCRUB_STAGES)
+    for technique, word in candidates:
+        word = pipeline.process(word)
+        if word is None:
+            continue
+        if unique:
+            if word in seen[technique]:
+                continue
+            seen[technique].add(word)
+        yield technique, word
+
+
+def _make_founder_product_name(words):
+    """Wrap `make_founder_product_name` with the default demo names."""
+    return make_founder_product_name('Lindsey', 'Chris', 'Widgets')
+
+
+def _make_descriptors(words):
+    """Tag and combine descriptors for a list of words."""
+    return make_descriptors(get_descriptors(words))
+
+
+# All techniques run by `generate_all_techniques`, as
+# (result key, function, per-word) entries. Per-word techniques only look
+# at one word at a time, so streaming generation can feed them
+# the seed list incrementally.
+_all_techniques = (
+    ('alliterations', make_name_alliteration, False),
+    ('portmanteau', make_portmanteau_default_vowel, False),
+    ('vowels', make_vowelify, True),
+    ('suffix', suffixify, True),
+    ('prefix', prefixify, True),
+    ('duplifix', duplifixify, True),
+    ('disfix', disfixify, True),
+    ('infix', infixify, True),
+    ('simulfix', simulfixify, False),
+    ('founder_product_name', _make_founder_product_name, False),
+    ('punctuator', make_punctuator_vowels, True),
+    ('name_abbreviation', make_name_abbreviation, False),
+    ('make_portmanteau_split', make_portmanteau_split, False),
+    ('forkerism', forkerism, False),
+    ('kniferism', kniferism, False),
+    ('spoonerism', spoonerism, False),
+    ('palindrome', palindromes, True),
+    ('reduplication_ablaut', reduplication_ablaut, False),
+    ('misspelling', make_misspelling, True),
+    ('descriptors', _make_descriptors, False),
+)
+
+# Pairwise techniques that can compute a slice of their first words at a
+# time, keyed by result key. See `namebot.parallel`.
+_row_techniques = {
+    'alliterations': _alliteration_rows,
+    'make_portmanteau_split': _portmanteau_split_rows,
+}
+
+# Lazy versions of the pairwise techniques, keyed by result key, used by
+# `iter_all_techniques` so their output is never built as one list.
+_iter_techniques = {
+    'alliterations': iter_name_alliterations,
+    'portmanteau': _iter_portmanteau_default_vowel,
+    'make_portmanteau_split': _iter_portmanteau_split,
+}
+
+
+def _count(results):
+    return 1 if isinstance(results, basestring) else len(results)
+
+
+def generate_all_techniques(words, instrument=None):
+    """Generate all techniques across the library in one place.
+
+    :param words (list): The seed words.
+    :param instrument (Instrumentation, optional): If given, records the
+        time taken and the number of candidates for each technique.
+    :rtype dict: The scrubbed results, keyed by technique.
+    """
+    if instrument is None:
+        data = {
+            'words': dict((name, func(words))
+                          for name, func, _ in _all_techniques)
         }
-    }
-    return super_scrub(data)
+        return super_scrub(data)
+    data = {'words': {}}
+    for name, func, _ in _all_techniques:
+        with instrument.measure(name, input_size=len(words)):
+            results = func(words)
+        scrubbed = super_scrub({'words': {name: results}})['words'][name]
+        instrument.finish(name, raw_count=_count(results),
+                          scrubbed_count=len(scrubbed))
+        data['words'][name] = scrubbed
+    return data
+
+
+def iter_all_techniques(words):
+    """Lazily generate raw `(technique, word)` pairs for all techniques.
+
+    Techniques run one after another. Per-word techniques are fed one
+    seed word at a time, and pairwise techniques (see `_iter_techniques`)
+    yield one name at a time, so only a small slice of the output is ever
+    held in memory, whatever the number of seed words. Techniques that
+    return a single string (e.g. abbreviations) yield it as one candidate.
+
+    :param words (list): The seed words.
+    :rtype generator: `(technique, word)` pairs, in technique order.
+    """
+    for name, func, per_word in _all_techniques:
+        for result in _iter_technique(name, func, per_word, words):
+            yield name, result
+
+
+def _iter_technique(name, func, per_word, words):
+    """Lazily generate the raw words of one technique."""
+    if name in _iter_techniques:
+        for result in _iter_techniques[name](words):
+            yield result
+        return
+    batches = ([word] for word in words) if per_word else [words]
+    for batch in batches:
+        results = func(batch)
+        if isinstance(results, basestring):
+            results = [results]
+        for result in results:
+            yield result
+
+
+# The number of words a technique makes per measurement, when streaming
+# with instrumentation, so timing overhead stays small.
+_measure_size = 1000
+
+
+def _iter_measured(instrument, name, results, input_size, counts):
+    """Time a technique's words in batches, and count them in `counts`."""
+    while True:
+        with instrument.measure(name, input_size=input_size):
+            batch = list(islice(results, _measure_size))
+        if not batch:
+            return
+        counts[name] += len(batch)
+        for result in batch:
+            yield result
+
+
+def generate_all_techniques_iter(words, unique=True, store=None,
+                                 instrument=None):
+    """Streaming version of `generate_all_techniques`.
+
+    Candidates are cleaned as soon as they are produced, so callers can
+    score or filter the first names while the rest are still being
+    generated.
+
+    Memory stays flat whatever the number of seed words, except for the
+    de-duplication: `unique` keeps a set of every name seen per technique
+    (see `super_scrub_iter`). Given a `store`, names are de-duplicated by
+    the store only, so a `CandidateStore(bloom=True)` bounds memory too.
+
+    :param words (list): The seed words.
+    :param unique (bool, optional): Drop repeated words within a technique.
+        Implied by `store`, which drops repeats across all techniques.
+    :param store (CandidateStore, optional): If given, names already in
+        the store are dropped, so each name is only yielded once across
+        all techniques (and across calls sharing the store).
+    :param instrument (Instrumentation, optional): If given, records the
+        time spent making each technique's words, and the number of
+        candidates before and after cleaning. A technique's record is
+        finished once all its candidates were consumed.
+    :rtype generator: The cleaned `(technique, word)` pairs.
+    """
+    unique = unique and store is None
+    if instrument is not None:
+        return _generate_all_techniques_measured(
+            words, unique, store, instrument)
+    candidates = super_scrub_iter(iter_all_techniques(words), unique=unique)
+    if store is not None:
+        candidates = store.filter(candidates)
+    return candidates
+
+
+def _generate_all_techniques_measured(words, unique, store, instrument):
+    counts = defaultdict(int)
+    for name, func, per_word in _all_techniques:
+        results = _iter_measured(
+            instrument, name, _iter_technique(name, func, per_word, words),
+            len(words), counts)
+        candidates = super_scrub_iter(
+            ((name, result) for result in results), unique=unique)
+        if store is not None:
+            candidates = store.filter(candidates)
+        scrubbed = 0
+        for candidate in candidates:
+            scrubbed += 1
+            yield candidate
+        instrument.finish(name, raw_count=counts[name],
+                          scrubbed_count=scrubbed)
@@ -5,6 +5,28 @@ from __future__ import division
 
 from .latin_words import words as lwords
 
+_latin_index = None
+
+
+def _get_latin_index():
+    """Build (once) an index of keyword -> matching latin definitions.
+
+    Definitions are kept in the same order a scan of the word list finds
+    them, and each is only added once per keyword.
+
+    Returns:
+        dict - The definition groups, keyed by keyword.
+    """
+    global _latin_index
+    if _latin_index is None:
+        index = {}
+        for lword, keywords in lwords.iteritems():
+            definitions = lword.split(',')
+            for keyword in set(keywords):
+                index.setdefault(keyword, []).append(definitions)
+        _latin_index = index
+    return _latin_index
+
 
 def lookup_latin_word(word):
     """Search the latin word list for any matches for the given `word`.
@@ -15,13 +37,10 @@ def lookup_latin_word(word):
     Returns:
         results (list) - A nested list with each matching definition(s) group.
     """
-    results = []
     if not word:
-        return results
-    for lword, keywords in lwords.iteritems():
-        if word in keywords:
-            results.append(lword.split(','))
-    return results
+        return []
+    return [list(definitions) for definitions
+            in _get_latin_index().get(word, [])]
 
 
 def lookup_latin_words(words):
@@ -39,3 +58,18 @@ def lookup_latin_words(words):
     for word in words:
         results.append(lookup_latin_word(word))
     return results
+
+
+def lookup_latin_words_dict(words):
+    """Look up the matching latin definitions for a list of words at once.
+
+    Args:
+        words (list): A list of words.
+
+    Returns:
+        results (dict): The definition groups for each unique word,
+            keyed by word.
+    """
+    if not words:
+        return {}
+    return dict((word, lookup_latin_word(word)) for word in set(words))
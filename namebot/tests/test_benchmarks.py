@@ -0,0 +1,139 @@
+"""Benchmark suite tests."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks import baseline
+from benchmarks import corpora
+from benchmarks import scaling
+from benchmarks import suite
+
+
+class CorporaTestCase(unittest.TestCase):
+
+    def test_reproducible(self):
+        for name in corpora.corpora:
+            self.assertEqual(corpora.get_corpus(name, 50),
+                             corpora.get_corpus(name, 50))
+            self.assertNotEqual(corpora.get_corpus(name, 50),
+                                corpora.get_corpus(name, 50, seed=1))
+
+    def test_sizes(self):
+        for name in corpora.corpora:
+            self.assertEqual(len(corpora.get_corpus(name, 10000)), 10000)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            corpora.get_corpus('nope', 10)
+
+
+class ScalingTestCase(unittest.TestCase):
+
+    def test_fit(self):
+        linear = dict((size, size * 0.001) for size in (10, 100, 1000))
+        quadratic = dict((size, size ** 2 * 0.001) for size in (10, 100))
+        self.assertAlmostEqual(scaling.fit_exponent(linear), 1.0)
+        self.assertAlmostEqual(scaling.fit_exponent(quadratic), 2.0)
+        self.assertIsNone(scaling.fit_exponent({10: 1.0}))
+
+    def test_check(self):
+        results = {
+            'linear': {10: {'seconds': 0.01}, 100: {'seconds': 0.1}},
+            'quadratic': {10: {'seconds': 0.01}, 100: {'seconds': 1.0}},
+        }
+        self.assertEqual(scaling.check_scaling(results, {}).keys(),
+                         ['quadratic'])
+        self.assertEqual(
+            scaling.check_scaling(results, {'quadratic': 2}), {})
+
+
+class BaselineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.results = {'foo': {10: {'seconds': 0.1}, 100: {'seconds': 1.0}}}
+
+    def test_save_load(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'baseline.json')
+            baseline.save(path, self.results, calibration=0.5)
+            self.assertEqual(baseline.load(path),
+                             ({'foo': {10: 0.1, 100: 1.0}}, 0.5))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_compare(self):
+        base = {'foo': {10: 0.01, 100: 1.0}, 'bar': {10: 1.0}}
+        self.assertEqual(baseline.compare(self.results, base),
+                         [('foo', 10, 0.1, 0.01)])
+        self.assertEqual(baseline.compare(self.results, base, speed=10), [])
+
+    def test_compare_ignores_noise(self):
+        base = {'foo': {10: 0.0001}}
+        results = {'foo': {10: {'seconds': 0.0009}}}
+        self.assertEqual(baseline.compare(results, base), [])
+
+    def test_missing(self):
+        base = {'foo': {10: 0.1}, 'bar': {10: 1.0}}
+        self.assertEqual(baseline.missing(self.results, base), [('foo', 100)])
+        self.assertEqual(baseline.missing(self.results, {}),
+                         [('foo', 10), ('foo', 100)])
+
+
+class SuiteTestCase(unittest.TestCase):
+
+    def test_run(self):
+        report = suite.run(corpora.synthetic, [10, 20],
+                           names=['normalization.uniquify'], repeat=1)
+        self.assertEqual(report['results'].keys(), ['normalization.uniquify'])
+        self.assertEqual(
+            sorted(report['results']['normalization.uniquify']), [10, 20])
+
+    def test_skips_missing_data(self):
+        def _missing(words):
+            raise LookupError('\n****\nResource foo not found.\n****')
+        suite.benchmarks.append(('test.missing', _missing, 1, None))
+        try:
+            report = suite.run(corpora.synthetic, [10], names=['test.'],
+                               repeat=1)
+        finally:
+            suite.benchmarks.pop()
+        self.assertEqual(report['results'], {})
+        self.assertEqual(report['skipped'],
+                         {'test.missing': 'LookupError: Resource foo '
+                                          'not found.'})
+
+    def test_prepared(self):
+        calls = []
+
+        def _setup(words):
+            calls.append('setup')
+
+            def _run(words):
+                calls.append('run')
+            _run.cleanup = lambda: calls.append('cleanup')
+            return _run
+        suite.measure(suite.Prepared(_setup), ['foo'], repeat=2)
+        self.assertEqual(calls[0], 'setup')
+        self.assertEqual(calls[-1], 'cleanup')
+        self.assertEqual(calls.count('setup'), 1)
+
+    def test_skips_missing_setup_data(self):
+        def _setup(words):
+            raise LookupError('Resource foo not found.')
+        suite.benchmarks.append(
+            ('test.missing', suite.Prepared(_setup), 1, None))
+        try:
+            report = suite.run(corpora.synthetic, [10], names=['test.'],
+                               repeat=1)
+        finally:
+            suite.benchmarks.pop()
+        self.assertEqual(report['results'], {})
+        self.assertEqual(report['skipped'].keys(), ['test.missing'])
+
+    def test_filters(self):
+        report = suite.run(corpora.synthetic, [10],
+                           names=['strainer.filter_length'], repeat=1)
+        self.assertEqual(report['results'].keys(), ['strainer.filter_length'])
@@ -0,0 +1,117 @@
+"""Cache tests."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from namebot import cache
+
+
+class LRUCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def _upper(self, word):
+        self.calls.append(word)
+        return word.upper()
+
+    def test_hit(self):
+        lru = cache.LRUCache(maxsize=10)
+        self.assertEqual(lru.get('foo', self._upper, 'foo'), 'FOO')
+        self.assertEqual(lru.get('foo', self._upper, 'foo'), 'FOO')
+        self.assertEqual(self.calls, ['foo'])
+        self.assertEqual(lru.info(), {
+            'hits': 1, 'misses': 1, 'maxsize': 10, 'currsize': 1})
+
+    def test_evicts_least_recent(self):
+        lru = cache.LRUCache(maxsize=2)
+        lru.get('foo', self._upper, 'foo')
+        lru.get('bar', self._upper, 'bar')
+        lru.get('foo', self._upper, 'foo')
+        lru.get('baz', self._upper, 'baz')
+        self.assertTrue('foo' in lru)
+        self.assertFalse('bar' in lru)
+        self.assertEqual(len(lru), 2)
+
+    def test_unbounded(self):
+        lru = cache.LRUCache()
+        for word in map(str, range(100)):
+            lru.get(word, self._upper, word)
+        self.assertEqual(len(lru), 100)
+
+    def test_resize(self):
+        lru = cache.LRUCache()
+        for word in map(str, range(10)):
+            lru.get(word, self._upper, word)
+        lru.resize(3)
+        self.assertEqual(len(lru), 3)
+        self.assertTrue('9' in lru)
+
+    def test_clear(self):
+        lru = cache.LRUCache(maxsize=2)
+        lru.get('foo', self._upper, 'foo')
+        lru.clear()
+        self.assertEqual(lru.info()['currsize'], 0)
+        self.assertEqual(lru.info()['misses'], 0)
+
+
+class PersistentCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.db = os.path.join(self.path, 'cache.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_roundtrip(self):
+        store = cache.PersistentCache(self.db)
+        store.set(['cat', False, True, '3.0'], {'hyponyms': ['kitty']})
+        self.assertEqual(store.get(['cat', False, True, '3.0']),
+                         {'hyponyms': ['kitty']})
+        self.assertIsNone(store.get(['dog', False, True, '3.0']))
+        self.assertEqual(store.info()['hits'], 1)
+        self.assertEqual(store.info()['misses'], 1)
+
+    def test_persists(self):
+        store = cache.PersistentCache(self.db)
+        store.set('cat', ['kitty'])
+        store.close()
+        store = cache.PersistentCache(self.db)
+        self.assertTrue('cat' in store)
+        self.assertEqual(store.get('cat'), ['kitty'])
+
+    def test_evicts_least_recent(self):
+        store = cache.PersistentCache(self.db, max_bytes=20)
+        store.set('foo', ['a' * 5])
+        store.set('bar', ['b' * 5])
+        store.get('foo')
+        store.set('baz', ['c' * 5])
+        self.assertTrue('foo' in store)
+        self.assertFalse('bar' in store)
+        self.assertLessEqual(store.info()['bytes'], 20)
+
+    def test_transaction(self):
+        store = cache.PersistentCache(self.db, max_bytes=30)
+        other = cache.PersistentCache(self.db)
+        store.set('foo', ['a' * 5])
+        store.set('bar', ['b' * 5])
+        with store.transaction():
+            store.get('foo')
+            store.set('baz', ['c' * 5])
+            with store.transaction():
+                store.set('qux', ['d' * 5])
+            self.assertFalse('qux' in other)
+        self.assertTrue('qux' in other)
+        self.assertTrue('foo' in other)
+        self.assertFalse('bar' in other)
+        self.assertLessEqual(store.info()['bytes'], 30)
+        other.close()
+
+    def test_clear(self):
+        store = cache.PersistentCache(self.db)
+        store.set('foo', 1)
+        store.clear()
+        self.assertEqual(len(store), 0)
@@ -0,0 +1,78 @@
+"""Candidate store tests."""
+
+import unittest
+
+from namebot import candidates
+
+
+class BloomFilterTestCase(unittest.TestCase):
+
+    def test_add(self):
+        bloom = candidates.BloomFilter(100)
+        self.assertTrue(bloom.add('foo'))
+        self.assertFalse(bloom.add('foo'))
+        self.assertTrue('foo' in bloom)
+        self.assertFalse('bar' in bloom)
+        self.assertEqual(len(bloom), 1)
+
+    def test_unicode(self):
+        bloom = candidates.BloomFilter(100)
+        bloom.add(u'caf\xe9')
+        self.assertTrue(u'caf\xe9' in bloom)
+
+    def test_no_false_negatives(self):
+        bloom = candidates.BloomFilter(1000, error_rate=0.01)
+        words = ['word{}'.format(i) for i in range(1000)]
+        for word in words:
+            bloom.add(word)
+        self.assertTrue(all(word in bloom for word in words))
+
+    def test_error_rate(self):
+        bloom = candidates.BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add('word{}'.format(i))
+        false = sum('other{}'.format(i) in bloom for i in range(10000))
+        self.assertLess(false, 300)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            candidates.BloomFilter(0)
+        with self.assertRaises(ValueError):
+            candidates.BloomFilter(10, error_rate=1)
+
+
+class CandidateStoreTestCase(unittest.TestCase):
+
+    def test_add(self):
+        store = candidates.CandidateStore()
+        self.assertTrue(store.add('foo', 'suffix'))
+        self.assertFalse(store.add('foo', 'prefix'))
+        self.assertFalse(store.add('foo', 'suffix'))
+        self.assertTrue(store.add('bar', 'prefix'))
+        self.assertEqual(store.words(), ['foo', 'bar'])
+        self.assertEqual(store.sources('foo'), ['suffix', 'prefix'])
+        self.assertEqual(store.sources('baz'), [])
+        self.assertEqual(store.stats(), {
+            'unique': 2,
+            'added': {'suffix': 1, 'prefix': 1},
+            'duplicates': {'prefix': 1, 'suffix': 1},
+        })
+
+    def test_filter(self):
+        store = candidates.CandidateStore()
+        pairs = [('suffix', 'foo'), ('prefix', 'foo'), ('prefix', 'bar')]
+        self.assertEqual(list(store.filter(pairs)),
+                         [('suffix', 'foo'), ('prefix', 'bar')])
+        self.assertEqual(list(store), ['foo', 'bar'])
+
+    def test_bloom(self):
+        store = candidates.CandidateStore(bloom=True, capacity=100)
+        self.assertTrue(store.add('foo', 'suffix'))
+        self.assertFalse(store.add('foo', 'prefix'))
+        self.assertTrue('foo' in store)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.stats()['duplicates'], {'prefix': 1})
+        with self.assertRaises(TypeError):
+            store.sources('foo')
+        with self.assertRaises(TypeError):
+            store.words()
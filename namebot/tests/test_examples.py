@@ -0,0 +1,99 @@
+"""Examples module tests."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from namebot import examples
+from namebot import nlp
+
+
+class GenerateAllExamplesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.sections = examples.SECTIONS.copy()
+        self.calls = []
+
+        def _fake(name):
+            def _section(filename, words):
+                self.calls.append(name)
+                return name, filename, words
+            return _section
+        for name in examples.SECTIONS:
+            examples.SECTIONS[name] = _fake(name)
+
+    def tearDown(self):
+        examples.SECTIONS.update(self.sections)
+
+    def test_selected(self):
+        res = examples.generate_all_examples(
+            filename='names.txt', sections=['scoring', 'metrics'])
+        self.assertEqual(res, {
+            'metrics': ('metrics', 'names.txt', None),
+            'scoring': ('scoring', 'names.txt', None),
+        })
+        self.assertEqual(self.calls, ['scoring', 'metrics'])
+
+    def test_default_sections(self):
+        res = examples.generate_all_examples(words=['cat'])
+        self.assertEqual(sorted(res), sorted(examples.SECTIONS))
+
+    def test_unknown_section(self):
+        with self.assertRaises(ValueError):
+            examples.generate_all_examples(words=['cat'], sections=['nope'])
+        self.assertEqual(self.calls, [])
+
+
+class SynsetCategoriesSectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.version = nlp._wordnet_version
+        nlp._wordnet_version = 'test'
+        nlp._synset_categories[('test', 'n')] = ('dog.n.01', 'cat.n.01')
+
+    def tearDown(self):
+        nlp._wordnet_version = self.version
+        nlp._synset_categories.pop(('test', 'n'))
+
+    def test_names(self):
+        res = examples.generate_all_examples(sections=['synset_categories'])
+        self.assertEqual(res['synset_categories'], ['dog.n.01', 'cat.n.01'])
+
+
+class SynsetCacheSectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = nlp.use_synset_cache(
+            os.path.join(self.path, 'synsets.db'))
+        self._get_word_relations = nlp._get_word_relations
+        self._wordnet_version = nlp._wordnet_version
+        self._techniques = examples.SECTIONS['techniques']
+        nlp._get_word_relations = lambda word, use_definitions=False: {
+            'hypernyms': [word + 's']}
+        nlp._wordnet_version = '3.0'
+        examples.SECTIONS['techniques'] = lambda filename, words: words
+
+    def tearDown(self):
+        nlp.use_synset_cache(None)
+        nlp._get_word_relations = self._get_word_relations
+        nlp._wordnet_version = self._wordnet_version
+        examples.SECTIONS['techniques'] = self._techniques
+        shutil.rmtree(self.path)
+
+    def test_cached(self):
+        for _ in range(2):
+            res = examples.generate_all_examples(
+                words=['cat'], sections=['synsets', 'techniques'])
+        self.assertEqual(res['synsets'], {'cat': {'hypernyms': ['cats']}})
+        self.assertEqual(self.cache.info()['hits'], 1)
+
+
+class ScoringSectionTestCase(unittest.TestCase):
+
+    def test_only_selected(self):
+        res = examples.generate_all_examples(
+            words=['cat', 'dog'], sections=['scoring'])
+        self.assertEqual(res.keys(), ['scoring'])
+        self.assertEqual(len(res['scoring']['grade']), 2)
@@ -0,0 +1,59 @@
+"""Import time tests.
+
+Short-lived workers only use the string techniques, so importing them
+must not load the heavy NLP and phonetic dependencies.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+# Cold start budget for importing a module, in seconds.
+IMPORT_BUDGET = 0.5
+HEAVY_MODULES = ['nltk', 'pattern', 'fuzzy', 'numpy']
+
+_script = '''
+import json, sys, time
+start = time.time()
+import {module}
+elapsed = time.time() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [name for name in {heavy} if name in sys.modules],
+}}))
+'''
+
+
+def _cold_import(module):
+    """Import a module in a fresh interpreter, returning timing info."""
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        _script.format(module=module, heavy=HEAVY_MODULES)])
+    return json.loads(output.decode('utf-8'))
+
+
+class ColdImportTestCase(unittest.TestCase):
+
+    def _check(self, module):
+        res = _cold_import(module)
+        self.assertEqual(res['loaded'], [])
+        self.assertLess(res['elapsed'], IMPORT_BUDGET)
+
+    def test_techniques(self):
+        self._check('namebot.techniques')
+
+    def test_scoring(self):
+        self._check('namebot.scoring')
+
+    def test_strainer(self):
+        self._check('namebot.strainer')
+
+    def test_normalization(self):
+        self._check('namebot.normalization')
+
+    def test_nlp(self):
+        self._check('namebot.nlp')
+
+    def test_metrics(self):
+        self._check('namebot.metrics')
@@ -0,0 +1,162 @@
+"""Instrumentation tests."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from namebot import instrumentation
+from namebot import parallel
+from namebot import techniques
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.instrument = instrumentation.Instrumentation()
+        with self.instrument.measure('suffix', input_size=3) as record:
+            record['extra'] = True
+        self.instrument.finish('suffix', raw_count=10, scrubbed_count=7)
+
+    def test_record(self):
+        record = self.instrument.records['suffix']
+        self.assertEqual(record['input_size'], 3)
+        self.assertEqual(record['raw_count'], 10)
+        self.assertEqual(record['scrubbed_count'], 7)
+        self.assertGreaterEqual(record['wall_time'], 0)
+        self.assertGreaterEqual(record['cpu_time'], 0)
+        self.assertTrue(record['extra'])
+
+    def test_peak_bytes(self):
+        with self.instrument.measure('peak'):
+            data = [str(i) for i in range(100000)]
+        self.assertEqual(len(data), 100000)
+        self.assertGreaterEqual(
+            self.instrument.records['peak']['peak_bytes'], 0)
+
+    def test_peak_bytes_without_tracemalloc(self):
+        tracemalloc = instrumentation.tracemalloc
+        instrumentation.tracemalloc = None
+        try:
+            with self.instrument.measure('rss'):
+                pass
+        finally:
+            instrumentation.tracemalloc = tracemalloc
+        self.assertGreaterEqual(
+            self.instrument.records['rss']['peak_bytes'], 0)
+
+    def test_merge(self):
+        other = instrumentation.Instrumentation()
+        with other.measure('suffix') as record:
+            record['peak_bytes'] = 10 ** 9
+        self.instrument.merge('suffix', other.records['suffix'])
+        record = self.instrument.records['suffix']
+        self.assertEqual(record['peak_bytes'], 10 ** 9)
+        self.assertEqual(record['input_size'], 3)
+
+    def test_callbacks(self):
+        calls = []
+        self.instrument.add_callback(
+            lambda technique, record: calls.append(
+                (technique, record['raw_count'])))
+        with self.instrument.measure('prefix', input_size=1):
+            pass
+        self.instrument.finish('prefix', raw_count=2, scrubbed_count=1)
+        self.assertEqual(calls, [('prefix', 2)])
+
+    def test_measure_records_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.instrument.measure('broken'):
+                raise ValueError
+        self.assertTrue('broken' in self.instrument.records)
+
+    def test_report(self):
+        with self.instrument.measure('prefix', input_size=3):
+            pass
+        self.instrument.finish('prefix', raw_count=5, scrubbed_count=5)
+        report = self.instrument.report()
+        self.assertEqual([entry['technique'] for entry in
+                          report['techniques']], ['suffix', 'prefix'])
+        self.assertEqual(report['totals']['raw_count'], 15)
+        self.assertEqual(report['totals']['scrubbed_count'], 12)
+
+    def test_prometheus(self):
+        text = self.instrument.to_prometheus()
+        self.assertTrue(
+            '# TYPE namebot_technique_raw_candidates gauge\n' in text)
+        self.assertTrue(
+            'namebot_technique_raw_candidates{technique="suffix"} 10\n'
+            in text)
+        self.assertTrue(
+            'namebot_technique_peak_bytes{technique="suffix"} ' in text)
+
+    def test_prometheus_escapes_labels(self):
+        with self.instrument.measure('a"b'):
+            pass
+        self.assertTrue('{technique="a\\"b"}' in
+                        self.instrument.to_prometheus())
+
+    def test_write_prometheus(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'namebot.prom')
+            self.instrument.write_prometheus(path, prefix='names')
+            with open(path) as files:
+                text = files.read()
+            self.assertEqual(text, self.instrument.to_prometheus('names'))
+            self.assertEqual(os.listdir(tmpdir), ['namebot.prom'])
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+class GenerateAllTechniquesInstrumentedTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['shop', 'cool', 'radio']
+        self.names = ['alliterations', 'suffix', 'name_abbreviation',
+                      'spoonerism']
+        self._all_techniques = techniques._all_techniques
+        techniques._all_techniques = tuple(
+            entry for entry in techniques._all_techniques
+            if entry[0] in self.names)
+
+    def tearDown(self):
+        techniques._all_techniques = self._all_techniques
+
+    def _check(self, instrument, res):
+        self.assertEqual(list(instrument.records), self.names)
+        for name, record in instrument.records.items():
+            self.assertEqual(record['input_size'], 3)
+            self.assertEqual(record['scrubbed_count'], len(res[name]))
+            self.assertGreaterEqual(record['raw_count'],
+                                    record['scrubbed_count'])
+            self.assertIsNotNone(record['peak_bytes'])
+
+    def test_iter(self):
+        instrument = instrumentation.Instrumentation()
+        res = dict((name, []) for name in self.names)
+        for name, word in techniques.generate_all_techniques_iter(
+                self.words, instrument=instrument):
+            res[name].append(word)
+        self._check(instrument, res)
+        self.assertEqual(instrument.records['suffix']['raw_count'],
+                         len(techniques.suffixify(self.words)))
+
+    def test_parallel(self):
+        for workers in (1, 2):
+            instrument = instrumentation.Instrumentation()
+            res = parallel.generate_all_techniques_parallel(
+                self.words, workers=workers, chunk_size=2,
+                instrument=instrument)
+            self._check(instrument, res['words'])
+
+    def test_records_every_technique(self):
+        words = ['shop', 'cool', 'radio']
+        instrument = instrumentation.Instrumentation()
+        res = techniques.generate_all_techniques(words, instrument=instrument)
+        self.assertEqual(set(instrument.records), set(res['words']))
+        for name, record in instrument.records.items():
+            self.assertEqual(record['input_size'], 3)
+            self.assertEqual(record['scrubbed_count'], len(res['words'][name]))
+            self.assertGreaterEqual(record['raw_count'],
+                                    record['scrubbed_count'])
@@ -1,3 +1,6 @@
+import io
+import os
+import tempfile
 import unittest
 from namebot import metrics
 
@@ -159,6 +162,59 @@ class GetAdjectiveVerbOrNounTestCase(unittest.TestCase):
         self.assertEqual(res['data']['verbs'], 1)
 
 
+class GetPosTagsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self._tag_words = metrics._tag_words
+        metrics._tag_words = self.fake_tag_words
+        metrics._pos_tag_cache.clear()
+
+    def tearDown(self):
+        metrics._tag_words = self._tag_words
+        metrics._pos_tag_cache.clear()
+
+    def fake_tag_words(self, words):
+        self.calls.append(sorted(words))
+        return ['-NONE-' if ' ' in word else 'NN' for word in words]
+
+    def test_order_and_dedupe(self):
+        tags = metrics.get_pos_tags(['dog', 'a cat', 'dog'])
+        self.assertEqual(tags, [('dog', 'NN'), ('a cat', '-NONE-'),
+                                ('dog', 'NN')])
+        self.assertEqual(self.calls, [['a cat', 'dog']])
+
+    def test_cached(self):
+        metrics.get_pos_tags(['dog'])
+        metrics.get_pos_tags(['dog', 'cat'])
+        self.assertEqual(self.calls, [['dog'], ['cat']])
+        self.assertEqual(metrics.pos_tag_cache_info()['currsize'], 2)
+
+    def test_evicted_while_tagging(self):
+        metrics._pos_tag_cache.resize(2)
+        try:
+            metrics.get_pos_tags(['a'])
+            tags = metrics.get_pos_tags(['b', 'c', 'a'])
+        finally:
+            metrics._pos_tag_cache.resize(
+                metrics.namebot_settings.POS_TAG_CACHE_SIZE)
+        self.assertEqual(tags, [('b', 'NN'), ('c', 'NN'), ('a', 'NN')])
+
+    def test_chunks(self):
+        metrics.get_pos_tags(['a', 'b', 'c'], chunk_size=2)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_shared_tags(self):
+        words = ['rain', 'a lot of sunshine']
+        tags = metrics.get_pos_tags(words)
+        res = metrics.categorize_word_type(words, tags=tags)
+        self.assertEqual(res[0][1]['real'], 50)
+        self.assertEqual(res[1][1]['fake_obscure'], 75)
+        res = metrics.get_adjective_verb_or_noun(words, tags=tags)
+        self.assertEqual(res['data'], {'nouns': 1, 'verbs': 0})
+        self.assertEqual(len(self.calls), 1)
+
+
 class CategorizeWordType(unittest.TestCase):
 
     def setUp(self):
@@ -173,3 +229,166 @@ class CategorizeWordType(unittest.TestCase):
         res = metrics.categorize_word_type(self.words)
         self.assertEqual(res[0][1]['real'], 50)
         self.assertEqual(res[0][1]['phrase'], 0)
+
+
+class MetricsAccumulatorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['7-11', 'apple', 'Two Fish', 'the cat in the hat',
+                      'rhythm', 'aaa', '3M', 'one two', 'eel!']
+
+    def test_matches_functions(self):
+        accumulator = metrics.MetricsAccumulator()
+        accumulator.update(iter(self.words))
+        res = accumulator.results()
+        expected = {
+            'digits_freq': metrics.get_digits_frequency(self.words),
+            'length': metrics.name_length(self.words),
+            'vowel_beginning': metrics.name_starts_with_vowel(self.words),
+            'vowel_count': metrics.name_vowel_count(self.words),
+            'name_length': metrics.name_length(self.words),
+            'name_spaces': metrics.get_name_spaces(self.words),
+            'consonant_repeat_freq':
+                metrics.get_consonant_repeat_frequency(self.words),
+            'consonant_dup_repeat_freq':
+                metrics.get_consonant_duplicate_repeat_frequency(self.words),
+            'vowel_repeat_freq':
+                metrics.get_vowel_repeat_frequency(self.words),
+            'special_characters': metrics.get_special_chars(self.words),
+            'name_numbers': metrics.get_named_numbers_1_10(self.words),
+            'first_letter_freq':
+                metrics.get_first_letter_frequency(self.words),
+        }
+        self.assertEqual(res, expected)
+
+    def test_merge(self):
+        first = metrics.MetricsAccumulator()
+        first.update(self.words[:4])
+        second = metrics.MetricsAccumulator()
+        second.update(self.words[4:])
+        merged = first.merge(second)
+        self.assertIs(merged, first)
+        accumulator = metrics.MetricsAccumulator()
+        accumulator.update(self.words)
+        self.assertEqual(merged.results(), accumulator.results())
+
+    def test_aggregate(self):
+        accumulator = metrics.MetricsAccumulator(aggregate=True)
+        accumulator.update(self.words)
+        res = accumulator.results()
+        full = metrics.MetricsAccumulator()
+        full.update(self.words)
+        expected = full.results()
+        for name, result in expected.items():
+            self.assertEqual(res[name]['summary'], result['summary'])
+        self.assertEqual(res['length']['data'][4], 2)
+        self.assertEqual(res['digits_freq']['data'], {'7': 1, '11': 1,
+                                                      '3': 1})
+        self.assertEqual(res['name_spaces']['data'], {1: 6, 2: 2, 5: 1})
+        self.assertEqual(res['name_numbers']['data'],
+                         len(expected['name_numbers']['data']))
+        self.assertEqual(res['first_letter_freq'],
+                         expected['first_letter_freq'])
+
+    def test_aggregate_merge(self):
+        first = metrics.MetricsAccumulator(aggregate=True)
+        first.update(self.words[:4])
+        second = metrics.MetricsAccumulator(aggregate=True)
+        second.update(self.words[4:])
+        accumulator = metrics.MetricsAccumulator(aggregate=True)
+        accumulator.update(self.words)
+        self.assertEqual(first.merge(second).results(),
+                         accumulator.results())
+
+    def test_merge_mixed_modes(self):
+        with self.assertRaises(ValueError):
+            metrics.MetricsAccumulator().merge(
+                metrics.MetricsAccumulator(aggregate=True))
+
+
+class GenerateAllMetricsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['apple', 'run', 'Two Fish', '3M', 'zebra']
+        self._tag_words = metrics._tag_words
+        self._get_word_types = metrics.get_word_types
+        metrics._tag_words = lambda words: [
+            'VB' if word == 'run' else 'NN' for word in words]
+        metrics.get_word_types = lambda words: {
+            'data': ['{}/NN'.format(word) for word in words],
+            'summary': None}
+        metrics._pos_tag_cache.clear()
+
+    def tearDown(self):
+        metrics._tag_words = self._tag_words
+        metrics.get_word_types = self._get_word_types
+        metrics._pos_tag_cache.clear()
+
+    def test_names(self):
+        res = metrics.generate_all_metrics(words=self.words, chunk_size=2)
+        self.assertEqual(res['names'], self.words)
+        self.assertEqual(res['metrics']['adj_verb_noun']['data'],
+                         {'nouns': 4, 'verbs': 1})
+        self.assertEqual(res['metrics']['word_types']['data'][-1],
+                         'zebra/NN')
+
+    def test_aggregate(self):
+        res = metrics.generate_all_metrics(
+            words=self.words, chunk_size=2, aggregate=True)
+        self.assertNotIn('names', res)
+        expected = metrics.generate_all_metrics(words=self.words)
+        self.assertEqual(res['metrics']['adj_verb_noun'],
+                         expected['metrics']['adj_verb_noun'])
+        self.assertEqual(res['metrics']['word_types']['data'], {'NN': 5})
+        self.assertEqual(res['metrics']['length']['summary'],
+                         expected['metrics']['length']['summary'])
+
+    def test_empty(self):
+        self.assertIsNone(metrics.generate_all_metrics(
+            words=iter([]), aggregate=True))
+
+
+class IterFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        with io.open(self.path, 'w', encoding='utf-8') as files:
+            files.write(u'apple\r\n\ncaf\xe9\nzebra')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_strips_newlines(self):
+        self.assertEqual(list(metrics.iter_file(self.path)),
+                         [u'apple', u'caf\xe9', u'zebra'])
+
+    def test_keep_blank(self):
+        self.assertEqual(
+            list(metrics.iter_file(self.path, skip_blank=False)),
+            [u'apple', u'', u'caf\xe9', u'zebra'])
+
+    def test_mmap(self):
+        self.assertEqual(list(metrics.iter_file(self.path, use_mmap=True)),
+                         list(metrics.iter_file(self.path)))
+
+    def test_mmap_empty(self):
+        open(self.path, 'w').close()
+        self.assertEqual(list(metrics.iter_file(self.path, use_mmap=True)),
+                         [])
+
+    def test_lazy(self):
+        self.assertFalse(isinstance(metrics.iter_file(self.path), list))
+
+    def test_prep_file_unchanged(self):
+        self.assertEqual(len(metrics.prep_file(self.path)), 4)
+
+
+class IterChunksTestCase(unittest.TestCase):
+
+    def test_basic(self):
+        self.assertEqual(list(metrics.iter_chunks(iter(range(5)), 2)),
+                         [[0, 1], [2, 3], [4]])
+
+    def test_empty(self):
+        self.assertEqual(list(metrics.iter_chunks([])), [])
@@ -1,5 +1,8 @@
 """NLP module tests."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from namebot import nlp
@@ -31,8 +34,157 @@ class NLPTestCase(unittest.TestCase):
         self.assertEqual(len(res), 0)
 
 
+class SynsetCategoriesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.version = nlp._wordnet_version
+        nlp._wordnet_version = 'test'
+        nlp._synset_categories[('test', 'n')] = ('dog.n.01', 'cat.n.01')
+
+    def tearDown(self):
+        nlp._wordnet_version = self.version
+        nlp._synset_categories.pop(('test', 'n'))
+
+    def test_cached(self):
+        self.assertEqual(nlp.get_all_synset_categories(),
+                         ('dog.n.01', 'cat.n.01'))
+
+
+class FakeSynset(object):
+
+    def __init__(self, name, lexname, offset):
+        self._name, self._lexname, self._offset = name, lexname, offset
+
+    def name(self):
+        return self._name
+
+    def lexname(self):
+        return self._lexname
+
+    def offset(self):
+        return self._offset
+
+
+class SynsetSnapshotTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.path = tempfile.mkdtemp()
+        cls.snapshot = nlp.build_synset_snapshot(cls.path, synsets=[
+            FakeSynset('dog.n.01', 'noun.animal', 2084071),
+            FakeSynset('apple.n.01', 'noun.food', 7739125),
+            FakeSynset('cat.n.01', 'noun.animal', 2121620),
+        ])
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.path)
+
+    def test_iter(self):
+        self.assertEqual(len(self.snapshot), 3)
+        self.assertEqual(list(self.snapshot), [
+            (u'dog.n.01', u'noun.animal', 2084071),
+            (u'apple.n.01', u'noun.food', 7739125),
+            (u'cat.n.01', u'noun.animal', 2121620),
+        ])
+
+    def test_filter_lexnames(self):
+        self.assertEqual(
+            [name for name, _, _ in self.snapshot.iter(['noun.animal'])],
+            [u'dog.n.01', u'cat.n.01'])
+        self.assertEqual(list(self.snapshot.iter(['noun.plant'])), [])
+
+    def test_reopen(self):
+        snapshot = nlp.SynsetSnapshot(self.path)
+        self.assertEqual(snapshot.pos, 'n')
+        self.assertEqual(list(snapshot), list(self.snapshot))
+
+    def test_empty(self):
+        path = tempfile.mkdtemp()
+        try:
+            self.assertEqual(
+                list(nlp.build_synset_snapshot(path, synsets=[])), [])
+        finally:
+            shutil.rmtree(path)
+
+
+class IterSynsetCategoriesTestCase(unittest.TestCase):
+
+    def test_lexnames(self):
+        synsets = nlp.iter_synset_categories(lexnames=['noun.animal'])
+        self.assertFalse(isinstance(synsets, list))
+        for _, synset in zip(range(20), synsets):
+            self.assertEqual(synset.lexname(), 'noun.animal')
+
+    def test_domains(self):
+        for synset in nlp.iter_synset_categories(
+                domains=['computer_science.n.01']):
+            self.assertTrue('computer_science.n.01' in
+                            [domain.name() for domain in
+                             synset.topic_domains()])
+            break
+
+
 class GetSynsetWordsTestCase(unittest.TestCase):
 
     def test_get_words_basic(self):
         res = nlp._get_synset_words('cat')
         self.assertIsInstance(res, list)
+
+
+class RelationIndexTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.path = tempfile.mkdtemp()
+        cls.index = nlp.build_relation_index(cls.path, ['cat', 'potato'])
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.path)
+
+    def tearDown(self):
+        nlp.use_relation_index(None)
+
+    def test_matches_synset_walk(self):
+        for word in ['cat', 'potato']:
+            self.assertEqual(
+                self.index.get(word), nlp._get_word_relations(word))
+
+    def test_case_insensitive(self):
+        self.assertEqual(self.index.get('Cat'), self.index.get('cat'))
+
+    def test_missing(self):
+        self.assertIsNone(self.index.get('dog'))
+        self.assertFalse('dog' in self.index)
+
+    def test_get_synsets_backend(self):
+        expected = nlp.get_synsets(['cat', 'dog'])
+        nlp.use_relation_index(self.path)
+        self.assertEqual(nlp.get_synsets(['cat', 'dog']), expected)
+
+
+class SynsetCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = nlp.use_synset_cache(
+            os.path.join(self.path, 'synsets.db'))
+
+    def tearDown(self):
+        nlp.use_synset_cache(None)
+        shutil.rmtree(self.path)
+
+    def test_cached(self):
+        res = nlp.get_synsets(['cat'], clean=True)
+        self.assertEqual(nlp.get_synsets(['cat'], clean=True), res)
+        self.assertEqual(self.cache.info()['hits'], 1)
+
+    def test_keyed_by_options(self):
+        nlp.get_synsets(['cat'], clean=True)
+        nlp.get_synsets(['cat'], clean=False)
+        self.assertEqual(self.cache.info()['hits'], 0)
+
+    def test_warm(self):
+        self.assertEqual(nlp.warm_synset_cache(['cat', 'dog', 'cat']), 2)
+        self.assertEqual(nlp.warm_synset_cache(['cat', 'dog']), 0)
@@ -51,6 +51,47 @@ class StemWordsTestCase(unittest.TestCase):
         self.assertEqual(words, stemmed)
 
 
+class StemCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self._stem = norm._stem
+        norm._stem = self.fake_stem
+        norm._stem_cache.clear()
+
+    def tearDown(self):
+        norm._stem = self._stem
+        norm._stem_cache.clear()
+        norm.set_stem_cache_size(norm.namebot_settings.STEM_CACHE_SIZE)
+
+    def fake_stem(self, word):
+        self.calls.append(word)
+        return word.rstrip('s')
+
+    def test_stem_word_cached(self):
+        self.assertEqual(norm.stem_word('cats'), 'cat')
+        self.assertEqual(norm.stem_word('cats'), 'cat')
+        self.assertEqual(self.calls, ['cats'])
+        info = norm.stem_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 1)
+
+    def test_batch_dedupes(self):
+        words = ['cats', 'dogs', 'cats', 'cow', 'dogs']
+        self.assertEqual(
+            norm.stem_words_batch(words), ['cat', 'dog', 'cat', 'cow', 'dog'])
+        self.assertEqual(sorted(self.calls), ['cats', 'cow', 'dogs'])
+
+    def test_batch_empty(self):
+        self.assertEqual(norm.stem_words_batch([]), [])
+
+    def test_cache_size(self):
+        norm.set_stem_cache_size(1)
+        norm.stem_words(['cats', 'dogs', 'cats'])
+        self.assertEqual(self.calls, ['cats', 'dogs', 'cats'])
+        self.assertEqual(norm.stem_cache_info()['currsize'], 1)
+
+
 class RemoveBadWordsTestCase(unittest.TestCase):
     def test_stem_words(self):
         """Test bad words are getting filtered out."""
@@ -70,6 +111,39 @@ class RemoveStopWordsTestCase(unittest.TestCase):
         self.assertEqual(len(filtered), 0)
 
 
+class StopWordSetsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        norm._stop_words['first'] = frozenset(['the', 'a'])
+        norm._stop_words['second'] = frozenset(['el', 'la'])
+
+    def tearDown(self):
+        norm._stop_words.pop('first')
+        norm._stop_words.pop('second')
+
+    def test_cached_set(self):
+        self.assertIs(norm.get_stop_words('first'),
+                      norm.get_stop_words('first'))
+
+    def test_multiple_languages(self):
+        self.assertEqual(
+            norm.remove_stop_words(['The', 'cat', 'el', 'gato'],
+                                   language=['first', 'second']),
+            ['cat', 'gato'])
+
+    def test_add_stop_words(self):
+        norm.add_stop_words(['Cat'], language='first')
+        self.assertEqual(
+            norm.remove_stop_words(['the', 'cat', 'dog'], language='first'),
+            ['dog'])
+
+    def test_batch(self):
+        self.assertEqual(
+            norm.remove_stop_words_batch(
+                [['the', 'cat'], ['a', 'dog'], []], language='first'),
+            [['cat'], ['dog'], []])
+
+
 class FilterWordsTestCase(unittest.TestCase):
     def test_filter_normal_words(self):
         """Test that normal words are not filtered out"""
@@ -134,6 +208,38 @@ class KeyWordsByPosTagTestCase(unittest.TestCase):
         self.assertEqual(dict(keyed), expected)
 
 
+class NormalizationPipelineTestCase(unittest.TestCase):
+
+    def test_unknown_stage(self):
+        with self.assertRaises(ValueError):
+            norm.NormalizationPipeline(['clean', 'nope'])
+
+    def test_scrub_stages(self):
+        pipeline = norm.NormalizationPipeline(norm.SCRUB_STAGES)
+        words = pipeline(['a', ' Foo. ', 'aaadog', 'bar!'])
+        self.assertEqual(words, ['foo', 'bar'])
+        self.assertEqual(pipeline.removed['clean'], 1)
+        self.assertEqual(pipeline.removed['odd_sounding'], 1)
+
+    def test_unique_keeps_first(self):
+        pipeline = norm.NormalizationPipeline(['clean', 'unique'])
+        self.assertEqual(
+            pipeline(['Dog', 'cat', 'dog', 'CAT', 'cow']),
+            ['dog', 'cat', 'cow'])
+        self.assertEqual(pipeline.removed['unique'], 2)
+
+    def test_run_resets_state(self):
+        pipeline = norm.NormalizationPipeline(['unique'])
+        self.assertEqual(pipeline(['dog', 'dog']), ['dog'])
+        self.assertEqual(pipeline(['dog']), ['dog'])
+        self.assertEqual(pipeline.removed['unique'], 0)
+
+    def test_process(self):
+        pipeline = norm.NormalizationPipeline(['bad_words', 'clean'])
+        self.assertEqual(pipeline.process('Monkey'), 'monkey')
+        self.assertIsNone(pipeline.process('x'))
+
+
 class FlattenTestCase(unittest.TestCase):
 
     def test_basic(self):
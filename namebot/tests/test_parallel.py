@@ -0,0 +1,73 @@
+"""Parallel techniques tests."""
+
+import unittest
+
+from namebot import parallel
+from namebot import techniques
+
+
+class PlanTasksTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['shop', 'cool', 'radio', 'jamba', 'juice']
+
+    def test_per_word_chunks(self):
+        tasks = parallel._plan_tasks(self.words, names=['suffix'],
+                                     chunk_size=2)
+        self.assertEqual(
+            [task[1] for task in tasks],
+            [['shop', 'cool'], ['radio', 'jamba'], ['juice']])
+
+    def test_row_chunks(self):
+        tasks = parallel._plan_tasks(self.words, names=['alliterations'],
+                                     chunk_size=2)
+        self.assertEqual(
+            [(task[2], task[3]) for task in tasks], [(0, 2), (2, 4), (4, 6)])
+        for task in tasks:
+            self.assertEqual(task[1], self.words)
+
+    def test_unchunked(self):
+        tasks = parallel._plan_tasks(self.words, names=['spoonerism'],
+                                     chunk_size=2)
+        self.assertEqual(tasks, [('spoonerism', self.words, None, None)])
+
+    def test_row_chunks_match_serial(self):
+        tasks = parallel._plan_tasks(self.words, names=['alliterations'],
+                                     chunk_size=2)
+        res = []
+        for task in tasks:
+            res += parallel._run_task(task)
+        self.assertEqual(res, techniques.make_name_alliteration(self.words))
+
+
+class GenerateAllTechniquesParallelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['shop', 'cool', 'radio', 'jamba', 'juice']
+        self.names = ['alliterations', 'suffix', 'prefix', 'palindrome',
+                      'make_portmanteau_split', 'spoonerism']
+
+    def _serial(self):
+        data = {'words': dict(
+            (name, func(self.words))
+            for name, func, _ in techniques._all_techniques
+            if name in self.names)}
+        return techniques.super_scrub(data)
+
+    def test_matches_serial(self):
+        res = parallel.generate_all_techniques_parallel(
+            self.words, workers=2, chunk_size=2, names=self.names)
+        expected = self._serial()
+        for name in self.names:
+            self.assertEqual(sorted(res['words'][name]),
+                             sorted(expected['words'][name]))
+
+    def test_single_worker(self):
+        res = parallel.generate_all_techniques_parallel(
+            self.words, workers=1, chunk_size=2, names=self.names)
+        self.assertEqual(sorted(res['words'].keys()), sorted(self.names))
+
+    def test_empty_words(self):
+        res = parallel.generate_all_techniques_parallel(
+            [], workers=1, names=['suffix'])
+        self.assertEqual(res['words']['suffix'], [])
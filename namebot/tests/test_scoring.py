@@ -23,6 +23,43 @@ class ScoringTestCase(unittest.TestCase):
         pass
 
 
+class PhoneticCodesTestCase(unittest.TestCase):
+
+    def test_dmetaphone(self):
+        self.assertEqual(sc.get_dmetaphone('cat'), ('KT', None))
+
+    def test_soundex(self):
+        self.assertEqual(sc.get_soundex('bear'), 'B600')
+
+    def test_soundex_does_not_modify_word(self):
+        word = ''.join(['b', 'e', 'a', 'r'])
+        sc.get_soundex(word)
+        self.assertEqual(word, 'bear')
+
+    def test_nysiis(self):
+        self.assertEqual(sc.get_nysiis('cat'), 'CAT')
+
+    def test_encoders(self):
+        self.assertEqual(sc.dmeta('cat'), ['KT', None])
+        self.assertEqual(sc.soundex('BEAR'), 'B600')
+
+    def test_cached(self):
+        sc.get_soundex('cached')
+        hits = sc.phonetic_cache_info()['hits']
+        sc.get_soundex('cached')
+        self.assertEqual(sc.phonetic_cache_info()['hits'], hits + 1)
+
+    def test_resize(self):
+        maxsize = sc.phonetic_cache_info()['maxsize']
+        sc.set_phonetic_cache_size(1)
+        try:
+            sc.get_soundex('foo')
+            sc.get_soundex('bar')
+            self.assertEqual(sc.phonetic_cache_info()['currsize'], 1)
+        finally:
+            sc.set_phonetic_cache_size(maxsize)
+
+
 class ScoringLengthTestCase(unittest.TestCase):
 
     def test_score_length1(self):
@@ -118,3 +155,66 @@ class ScoringOverallTestCase(unittest.TestCase):
     def test_scores_overall(self):
         self.assertIsInstance(sc.score_names_overall(
             ['google', 'microsoft', 'apple']), list)
+
+
+class ScoringOverallBatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['facebook', 'the cat in the hat', 'x', 'AEIOU', '123',
+                      'reallyreallyreallylongwordnojoke', 'radio0', 'a-b_c',
+                      u'caf\xe9', 'supercalifragilistic', '']
+
+    def test_matches_single(self):
+        self.assertEqual(
+            list(sc.score_names_overall_batch(self.words)),
+            [sc.score_name_overall(word) for word in self.words])
+
+    def test_chunked(self):
+        self.assertEqual(
+            list(sc.score_names_overall_batch(self.words, chunk_size=3)),
+            list(sc.score_names_overall_batch(self.words)))
+
+    def test_empty(self):
+        self.assertEqual(len(sc.score_names_overall_batch([])), 0)
+
+    def test_none(self):
+        self.assertEqual(list(sc.score_names_overall_batch([None])), [0])
+
+    def test_punctuation_only(self):
+        words = ['facebook', '-', '&', 'radio']
+        self.assertEqual(sc.score_pronounceability('&'), 0)
+        self.assertEqual(
+            list(sc.score_names_overall_batch(words)),
+            [sc.score_name_overall(word) for word in words])
+
+
+class TopKRankerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['facebook', 'x', 'radio', 'supercalifragilistic',
+                      'google', 'apple', 'reallyreallyreallylongwordnojoke']
+
+    def test_matches_sort(self):
+        scored = sc.score_names_overall(self.words)
+        expected = sorted(enumerate(scored),
+                          key=lambda pair: (-pair[1][0], pair[0]))
+        expected = [pair for _, pair in expected]
+        for k in range(len(self.words) + 2):
+            self.assertEqual(sc.top_k_names(iter(self.words), k=k),
+                             expected[:k])
+
+    def test_stable_ties(self):
+        res = sc.top_k_names(['bb', 'a', 'cc', 'dd', 'e'], k=3, scorer=len)
+        self.assertEqual(res, [(2, 'bb'), (2, 'cc'), (2, 'dd')])
+
+    def test_items(self):
+        ranker = sc.TopKRanker(1, scorer=len)
+        ranker.add('cat', ('suffix', 'cat'))
+        ranker.add('horse', ('prefix', 'horse'))
+        self.assertEqual(ranker.results(), [(5, ('prefix', 'horse'))])
+        self.assertEqual(ranker.count, 2)
+        self.assertEqual(len(ranker), 1)
+
+    def test_negative_k(self):
+        with self.assertRaises(ValueError):
+            sc.TopKRanker(-1)
@@ -178,3 +178,87 @@ class FilterConsonantEndingTestCase(unittest.TestCase):
         words = ['bar', 'baz', 'foo']
         res = [w for w in words if strain.filter_consonant_ending(w)]
         self.assertEqual(res, ['bar', 'baz'])
+
+
+class StrainerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['banana', 'baseball', 'brain', 'bar', 'cat',
+                      'phone', 'grape', 'sitcom', 'Barcode', 'improbable']
+
+    def _manual(self, words):
+        return [word for word in words if
+                strain.filter_length(word, min_length=4, max_length=8) and
+                strain.filter_startswith(word, beginning='b') and
+                strain.filter_vowel_cons_ratio(word, ratio=0.3)]
+
+    def test_matches_functions(self):
+        strainer = strain.Strainer([
+            ('vowel_cons_ratio', {'ratio': 0.3}),
+            ('startswith', {'beginning': 'b'}),
+            ('length', {'min_length': 4, 'max_length': 8})])
+        self.assertEqual(list(strainer.strain(self.words)),
+                         self._manual(self.words))
+
+    def test_cheapest_first(self):
+        strainer = strain.Strainer([
+            ('dmetaphone', {'code': 'AMPR'}),
+            ('vowel_cons_ratio', {}),
+            ('endswith', {'ending': 'e'}),
+            'length'])
+        self.assertEqual(
+            [name for name, _ in strainer.filters],
+            ['length', 'endswith', 'vowel_cons_ratio', 'dmetaphone'])
+
+    def test_rejections(self):
+        strainer = strain.Strainer([
+            ('length', {'min_length': 4, 'max_length': 8}),
+            ('startswith', {'beginning': 'b'})])
+        res = list(strainer.strain(self.words))
+        self.assertEqual(res, ['banana', 'baseball', 'brain', 'Barcode'])
+        self.assertEqual(strainer.rejections,
+                         {'length(max_length=8, min_length=4)': 3,
+                          "startswith(beginning='b')": 3})
+
+    def test_rejections_repeated_filter(self):
+        strainer = strain.Strainer([
+            ('startswith', {'beginning': 'b'}),
+            ('length', {'min_length': 1, 'max_length': 8}),
+            ('length', {'min_length': 4, 'max_length': 20})])
+        list(strainer.strain(self.words))
+        self.assertEqual(strainer.rejections,
+                         {'length(max_length=8, min_length=1)': 1,
+                          'length(max_length=20, min_length=4)': 2,
+                          "startswith(beginning='b')": 3})
+
+    def test_rejections_no_kwargs(self):
+        strainer = strain.Strainer(['vowel_ending'])
+        list(strainer.strain(self.words))
+        self.assertEqual(strainer.rejections, {'vowel_ending': 5})
+
+    def test_tld(self):
+        strainer = strain.Strainer([('tld', {'tld': '.com'})])
+        self.assertEqual(list(strainer.strain(self.words)), ['sitcom'])
+
+    def test_phonetic(self):
+        strainer = strain.Strainer([
+            ('dmetaphone', {'code': 'ampr'}),
+            ('soundex', {'code': 'i516'}),
+            ('nysiis', {})])
+        self.assertEqual(list(strainer.strain(self.words)), ['improbable'])
+
+    def test_endings(self):
+        strainer = strain.Strainer(['vowel_ending'])
+        self.assertEqual(list(strainer.strain(self.words)),
+                         ['banana', 'phone', 'grape', 'Barcode',
+                          'improbable'])
+
+    def test_unknown_filter(self):
+        with self.assertRaises(ValueError):
+            strain.Strainer(['nope'])
+
+    def test_unknown_argument(self):
+        with self.assertRaises(ValueError):
+            strain.Strainer([('length', {'max_lenght': 7})])
+        with self.assertRaises(ValueError):
+            strain.Strainer([('vowel_ending', {'ratio': 0.5})])
@@ -3,6 +3,7 @@
 import unittest
 
 from namebot import techniques
+from namebot.candidates import CandidateStore
 
 
 class SliceEndsTestCase(unittest.TestCase):
@@ -150,6 +151,27 @@ class AffixWordsTestCase(unittest.TestCase):
         res = techniques.suffixify(self.words)
         self.assertEqual(res[:3], ['shopage', 'shopable', 'shopible'])
 
+    def test_prefix_vowel_start(self):
+        res = techniques.prefixify(['apple'])
+        self.assertTrue('enapple' in res)
+        self.assertTrue('reapple' not in res)
+
+    def test_prefix_table_matches_settings_order(self):
+        for prefixes in techniques._prefix_table.values():
+            self.assertEqual(
+                prefixes,
+                [p for p in techniques._prefixes if p in prefixes])
+
+    def test_suffix_ify(self):
+        res = techniques.suffixify(['pie'])
+        self.assertTrue('piify' in res)
+        self.assertTrue('pieify' in res)
+
+    def test_suffix_consonant_start(self):
+        res = techniques.suffixify(['shop'])
+        self.assertTrue('shopless' not in res)
+        self.assertTrue('shopify' in res)
+
     def test_duplifix(self):
         res = techniques.duplifixify(self.words)
         self.assertEqual(res[:3], ['shop ahop', 'shop bhop', 'shop chop'])
@@ -254,6 +276,29 @@ class MakeNameAlliterationTestCase(unittest.TestCase):
             techniques.make_name_alliteration(
                 original, divider=' & '), updated)
 
+    def test_onsets(self):
+        original = ['street', 'strong', 'stone', 'chat', 'cheese', 'cat']
+        self.assertEqual(
+            techniques.make_name_alliteration(original, onsets=True),
+            ['chat cheese', 'cheese chat', 'street strong', 'strong street'])
+
+    def test_max_per_bucket(self):
+        original = ['ab', 'ac', 'ad', 'bc', 'bd']
+        self.assertEqual(
+            techniques.make_name_alliteration(original, max_per_bucket=3),
+            ['ab ac', 'ab ad', 'ac ab', 'bc bd', 'bd bc'])
+
+    def test_iter(self):
+        original = ['jamba', 'juice', 'dancing', 'disco']
+        res = techniques.iter_name_alliterations(original)
+        self.assertFalse(isinstance(res, list))
+        self.assertEqual(list(res),
+                         techniques.make_name_alliteration(original))
+
+    def test_no_alliterations(self):
+        self.assertEqual(
+            techniques.make_name_alliteration(['cat', 'dog', 'emu']), [])
+
 
 class MakeNameAbbreviationTestCase(unittest.TestCase):
 
@@ -290,6 +335,16 @@ class MakeVowelTestCase(unittest.TestCase):
         self.assertEqual(techniques.make_vowel(
             ['matching', 'not'], r'a{1}', 'a'), [])
 
+    def test_same_word_not_paired(self):
+        self.assertEqual(techniques.make_vowel(
+            ['brad', 'brad'], r'a{1}', 'a'), [])
+
+    def test_vowel_position_index(self):
+        prefixes, suffixes = techniques._vowel_position_index(
+            ['brad', 'angelina', 'cool'], r'a{1}', 'a')
+        self.assertEqual(prefixes, [('brad', 'bra', True)])
+        self.assertEqual(suffixes, [('angelina', 'ngelina', True)])
+
 
 class MakePortmanteauDefaultVowelTestCase(unittest.TestCase):
 
@@ -430,6 +485,74 @@ class RecycleTestCase(unittest.TestCase):
                     'ratchelery', 'ratchelery']
         self.assertEqual(res, expected)
 
+    def test_string_results(self):
+        self.assertEqual(techniques.recycle(
+            ['cats', 'dogs'], techniques.make_name_abbreviation), 'CD')
+
+    def test_store_drops_seen(self):
+        store = CandidateStore()
+        store.add('urringpaywayway', 'other')
+        words = techniques.pig_latinize(['purring', 'cats'])
+        res = techniques.recycle(
+            words, techniques.pig_latinize, store=store)
+        self.assertEqual(res, ['atscaywayway'])
+        self.assertEqual(store.sources('atscayway'), ['pig_latinize'])
+
+    def test_store_dedupes_rounds(self):
+        store = CandidateStore()
+        res = techniques.recycle(['a', 'b'], lambda words: ['a', 'c'],
+                                 times=3, store=store)
+        self.assertEqual(res, [])
+        self.assertEqual(store.words(), ['a', 'c'])
+
+
+class RecycleIterTestCase(unittest.TestCase):
+
+    def test_rounds(self):
+        rounds = list(techniques.recycle_iter(
+            ['cats'], techniques.pig_latinize, times=2))
+        self.assertEqual(rounds, [['atscay'], ['atscayway']])
+
+    def test_lazy(self):
+        res = techniques.recycle_iter(['cats'], techniques.pig_latinize)
+        self.assertFalse(isinstance(res, list))
+
+    def test_unique(self):
+        rounds = list(techniques.recycle_iter(
+            ['a'], lambda words: ['a', 'b', 'b', 'c'], times=3))
+        self.assertEqual(rounds, [['b', 'c'], []])
+
+    def test_not_unique(self):
+        rounds = list(techniques.recycle_iter(
+            ['a'], lambda words: ['a', 'a'], times=2, unique=False))
+        self.assertEqual(rounds, [['a', 'a'], ['a', 'a']])
+
+    def test_max_per_round(self):
+        words = ['cats', 'dogs']
+        for round_words in techniques.recycle_iter(
+                words, techniques.duplifixify, times=3, max_per_round=50):
+            self.assertLessEqual(len(round_words), 50)
+            self.assertEqual(len(round_words), len(set(round_words)))
+
+    def test_beam(self):
+        rounds = list(techniques.recycle_iter(
+            ['x'], lambda words: [word + 'a' for word in words] + ['bbbbbb'],
+            times=2, beam_width=1, scorer=len))
+        self.assertEqual(rounds, [['bbbbbb'], ['bbbbbba']])
+
+    def test_beam_requires_scorer(self):
+        with self.assertRaises(ValueError):
+            techniques.recycle_iter(
+                ['cats'], techniques.pig_latinize, beam_width=2)
+
+    def test_store(self):
+        store = CandidateStore()
+        store.add('b')
+        rounds = list(techniques.recycle_iter(
+            ['a'], lambda words: ['a', 'b', 'c'], times=1, store=store))
+        self.assertEqual(rounds, [['a', 'c']])
+        self.assertEqual(store.sources('c'), ['<lambda>'])
+
 
 class SuperScrubTestCase(unittest.TestCase):
 
@@ -459,3 +582,66 @@ class BackronymTestCase(unittest.TestCase):
                          'success_ratio', 'success']
         for key in expected_keys:
             self.assertTrue(key in res)
+
+
+class GenerateAllTechniquesIterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['shop', 'cool', 'radio']
+
+    def test_yields_pairs(self):
+        for technique, word in techniques.generate_all_techniques_iter(
+                self.words):
+            self.assertIsInstance(technique, str)
+            self.assertIsInstance(word, str)
+
+    def test_lazy(self):
+        res = techniques.generate_all_techniques_iter(self.words)
+        self.assertFalse(isinstance(res, list))
+        self.assertEqual(len(next(res)), 2)
+
+    def test_per_word_matches_eager(self):
+        res = set(word for technique, word in
+                  techniques.generate_all_techniques_iter(self.words)
+                  if technique == 'suffix')
+        expected = set(techniques.super_scrub(
+            {'words': {'suffix': techniques.suffixify(self.words)}}
+        )['words']['suffix'])
+        self.assertEqual(res, expected)
+
+    def test_pairwise_lazy(self):
+        words = ['shop', 'cool', 'radio', 'sassy', 'rabbit', 'kite']
+        funcs = dict((name, func)
+                     for name, func, _ in techniques._all_techniques)
+        for name, iter_func in techniques._iter_techniques.items():
+            res = iter_func(words)
+            self.assertFalse(isinstance(res, list))
+            self.assertEqual(list(res), funcs[name](words))
+
+    def test_unique(self):
+        pairs = [('technique', 'words'), ('technique', 'words'),
+                 ('other', 'words')]
+        self.assertEqual(
+            list(techniques.super_scrub_iter(pairs)),
+            [('technique', 'words'), ('other', 'words')])
+
+    def test_not_unique(self):
+        pairs = [('technique', 'words'), ('technique', 'words')]
+        self.assertEqual(
+            list(techniques.super_scrub_iter(pairs, unique=False)), pairs)
+
+    def test_scrubbed(self):
+        pairs = [('technique', '!!@words'), ('technique', 'asdsaasdokokk')]
+        self.assertEqual(
+            list(techniques.super_scrub_iter(pairs)),
+            [('technique', 'words')])
+
+    def test_store_dedupes_across_techniques(self):
+        store = CandidateStore()
+        pairs = list(techniques.generate_all_techniques_iter(
+            self.words, store=store))
+        words = [word for technique, word in pairs]
+        self.assertEqual(len(words), len(set(words)))
+        self.assertEqual(len(store), len(words))
+        for technique, word in pairs:
+            self.assertEqual(store.sources(word)[0], technique)
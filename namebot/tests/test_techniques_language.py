@@ -32,3 +32,15 @@ class LatinLookupTestCase(unittest.TestCase):
         results = tl.lookup_latin_words(['cool'])
         for result in results:
             self.assertIsInstance(result, list)
+
+    def test_lookup_results_are_copies(self):
+        tl.lookup_latin_word('cool')[0].append('changed')
+        self.assertEqual(tl.lookup_latin_word('cool'), [['tepesco']])
+
+    def test_lookup_words_dict(self):
+        self.assertEqual(
+            tl.lookup_latin_words_dict(['cool', 'no-word', 'cool']),
+            {'cool': [['tepesco']], 'no-word': []})
+
+    def test_lookup_words_dict_empty(self):
+        self.assertEqual(tl.lookup_latin_words_dict(None), {})
@@ -33,7 +33,8 @@ setup(
     url='https://github.com/automotron/namebot',
     keywords=keywords,
     license='Apache License 2.0',
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["tests", "tests.*",
+                                    "benchmarks", "benchmarks.*"]),
     install_requires=_get_requires('requirements.txt'),
     setup_requires=[
         'setuptools>=0.8',